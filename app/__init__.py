@@ -2,9 +2,14 @@ from flask import Flask, render_template, session, request, redirect, url_for
 from flask_babel import lazy_gettext as _l
 from config import Config
 from app.extensions import db, migrate, bcrypt, login_manager, http_auth, mail, cors, babel
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
-import sqlite3
+from app.utilities.database import init_database
+from app.utilities.storage import init_storage
+from app.utilities.jobs import init_jobs
+from app.utilities.outbox import init_outbox
+from app.utilities.passwords import init_passwords, HashingBusy
+from app.utilities.transactions import WriteConflict
+from app.utilities.activity import init_activity
+import click
 
 LANGUAGES = ['de', 'en']
 
@@ -23,16 +28,14 @@ def create_app(config_class=Config):
     app.config['BABEL_DEFAULT_TIMEZONE'] = 'UTC'
 
     # Initialize Flask extensions
-    db.init_app(app)
+    init_database(app)
     migrate.init_app(app, db)
-
-    @event.listens_for(Engine, "connect")
-    def _set_sqlite_wal(dbapi_connection, connection_record):
-        if isinstance(dbapi_connection, sqlite3.Connection):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.close()
     bcrypt.init_app(app)
+    init_passwords(app)
+    init_storage(app)
+    init_jobs(app)
+    init_outbox(app)
+    init_activity(app)
     login_manager.init_app(app)
     mail.init_app(app)
     cors.init_app(app)
@@ -43,11 +46,14 @@ def create_app(config_class=Config):
 
     @login_manager.user_loader
     def user_loader(id):
-        return User.query.get(int(id))
+        from app.utilities.user_deletion import active_users
+        # Sessions of an account that is being deleted end with its next request
+        return active_users().filter(User.id == int(id)).first()
 
     @http_auth.verify_token
     def verify_token(token):
-        return User.query.filter_by(token=token).first()
+        from app.utilities.api_tokens import verify_api_token
+        return verify_api_token(token)
 
     # Redirect unauthenticated users to login page
     login_manager.login_view = 'auth.login'
@@ -95,6 +101,8 @@ def create_app(config_class=Config):
             'already_member':    _('This user is already a member of this team.'),
             'visibility_change_confirm': _('Do you really want to change the visibility of this team to "{value}"?'),
             'change':            _('Change'),
+            'by':                _('by'),
+            'by_me':             _('by me'),
         }
         from flask_login import current_user as cu
         owner_email = app.config.get('OWNER_EMAIL', '')
@@ -107,6 +115,19 @@ def create_app(config_class=Config):
             'current_user_is_owner': _is_owner,
         }
 
+    # Password hashing is capped, reject instead of queueing up workers
+    @app.errorhandler(HashingBusy)
+    def hashing_busy(e):
+        from flask_babel import gettext as _
+        return _('Too many login attempts at the moment. Please try again in a few seconds.'), 429, {'Retry-After': '2'}
+
+    # Other workers kept the database locked, the client may simply retry
+    @app.errorhandler(WriteConflict)
+    def write_conflict(e):
+        from flask_babel import gettext as _
+        db.session.rollback()
+        return _('The server is busy at the moment. Please try again in a few seconds.'), 503, {'Retry-After': '1'}
+
     # Language switching
     @app.route('/set_lang/<lang>')
     def set_lang(lang):
@@ -133,10 +154,236 @@ def create_app(config_class=Config):
 
     # CLI command: flask send_status_mail
     @app.cli.command('send_status_mail')
-    def send_status_mail_cmd():
-        """Send daily status e-mail to OWNER_EMAIL."""
+    @click.option('--window', 'windows', multiple=True, type=click.Choice(['day', 'week', 'month']),
+                  help='Report window, repeatable. Default: STATUS_MAIL_WINDOWS.')
+    def send_status_mail_cmd(windows):
+        """Send status e-mails (daily, weekly, monthly) to STATUS_EMAIL."""
         from app.utilities.status_mail import send_status_mail
-        send_status_mail()
-        print('Status mail sent.')
+        from app.utilities.outbox import deliver_outbox
+        queued = send_status_mail(list(windows) or None)
+        sent, failed = deliver_outbox()
+        print(f'{queued} status mails queued ({sent} sent, {failed} failed).')
+
+    # CLI command: flask outbox
+    @app.cli.command('outbox')
+    @click.option('--flush', is_flag=True, help='Deliver all due messages now.')
+    def outbox_cmd(flush):
+        """Show the number of queued e-mails."""
+        from app.utilities.outbox import deliver_outbox, outbox_status
+        if flush:
+            sent, failed = deliver_outbox()
+            print(f'Sent {sent} messages, {failed} failed.')
+        status = outbox_status()
+        print(f"Pending: {status['pending']}, given up: {status['failed']}, oldest: {status['oldest_age'] or 0} s")
+
+    # CLI command: flask bcrypt_benchmark
+    @app.cli.command('bcrypt_benchmark')
+    @click.option('--seconds', default=2.0, show_default=True, help='Measuring time per cost factor.')
+    def bcrypt_benchmark_cmd(seconds):
+        """Measure logins per second and core for several bcrypt cost factors."""
+        import time
+        current = app.config['BCRYPT_LOG_ROUNDS']
+        slots = len(app.extensions['hashing_slots'].paths)
+        print(f'Configured cost: {current}, hashing slots: {slots}')
+        for rounds in range(max(4, current - 2), current + 3):
+            pw_hash = bcrypt.generate_password_hash('benchmark-password', rounds)
+            checks = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                bcrypt.check_password_hash(pw_hash, 'benchmark-password')
+                checks += 1
+            elapsed = time.perf_counter() - start
+            marker = ' <- configured' if rounds == current else ''
+            rate = checks / elapsed
+            print(f'  cost {rounds:2d}: {rate:8.1f} logins/s per core, {1000 / rate:7.1f} ms each, '
+                  f'{rate * slots:8.1f} logins/s with {slots} slots{marker}')
+
+    # CLI command: flask db_settings
+    @app.cli.command('db_settings')
+    def db_settings_cmd():
+        """Show the connection settings the database actually runs with."""
+        from app.utilities.database import database_settings
+        for key, value in database_settings().items():
+            print(f'{key:14} {value}')
+
+    # CLI command: flask db_benchmark
+    @app.cli.command('db_benchmark')
+    @click.option('--requests', default=50, show_default=True, help='get_shapes requests per profile.')
+    @click.option('--downloads', default=500, show_default=True, help='Recorded downloads per profile, one commit each.')
+    @click.option('--limit', default=100, show_default=True, help='Shapes per get_shapes request.')
+    def db_benchmark_cmd(requests, downloads, limit):
+        """Compare SQLite settings profiles on copies of the database."""
+        from app.utilities.database import PROFILES, benchmark_profiles
+        if db.engine.dialect.name != 'sqlite':
+            print('The benchmark only runs on SQLite.')
+            return
+        profiles = {**PROFILES, 'configured': app.extensions['sqlite_pragmas']}
+        for name, (reads, writes) in benchmark_profiles(profiles, requests, downloads, limit).items():
+            print(f'  {name:16} get_shapes {reads:8.2f} ms   download {writes:6.2f} ms   '
+                  f'{", ".join(f"{k}={v}" for k, v in profiles[name].items() if k != "journal_mode")}')
+
+    # CLI command: flask write_stress
+    @app.cli.command('write_stress')
+    @click.option('--processes', default=4, show_default=True, help='Writing processes, like gunicorn workers.')
+    @click.option('--seconds', default=10.0, show_default=True, help='Duration of the run.')
+    @click.option('--hold', default=5.0, show_default=True, help='Milliseconds each transaction holds the write lock.')
+    @click.option('--pause', default=10.0, show_default=True, help='Milliseconds between two transactions of a process.')
+    @click.option('--busy-timeout', type=int, help='Milliseconds instead of SQLITE_BUSY_TIMEOUT.')
+    @click.option('--plain', is_flag=True, help='Write without BEGIN IMMEDIATE and retries, as before.')
+    def write_stress_cmd(processes, seconds, hold, pause, busy_timeout, plain):
+        """Record downloads from several processes at once on a copy of the database."""
+        from app.utilities.transactions import stress_writes
+        if db.engine.dialect.name != 'sqlite':
+            print('The stress test only runs on SQLite.')
+            return
+        rate, locked, conflicts, metrics = stress_writes(processes, seconds, hold / 1000, pause / 1000,
+                                                         busy_timeout, plain)
+        print(f'{rate:.1f} commits/s, {locked} "database is locked" errors, {conflicts} conflicts after retries')
+        for m in metrics:
+            if m['transactions']:
+                print(f"  pid {m['pid']}: {m['transactions']} lock waits, mean {m['mean_wait_ms']:.1f} ms, "
+                      f"max {m['max_wait_ms']:.1f} ms, {m['retries']} retries")
+
+    # CLI command: flask fingerprint
+    @app.cli.command('fingerprint')
+    def fingerprint_cmd():
+        """Compute missing SHA-256 fingerprints for stored shapes and stencils."""
+        from app.utilities.fingerprint import backfill_fingerprints
+        shapes, stencils = backfill_fingerprints()
+        print(f'Fingerprinted {shapes} shapes and {stencils} stencils.')
+
+    # CLI command: flask rebuild_stats
+    @app.cli.command('rebuild_stats')
+    def rebuild_stats_cmd():
+        """Rebuild the download rollups behind the account statistics from the raw download tables."""
+        from app.utilities.rollups import rebuild_rollups
+        rows = rebuild_rollups()
+        print(f'Rebuilt statistics from {rows} usage rows.')
+
+    # CLI command: flask stats_benchmark
+    @app.cli.command('stats_benchmark')
+    @click.option('--days', default='30,180,365,1095', show_default=True,
+                  help='Comma-separated lengths of the download history, in days.')
+    @click.option('--per-day', default=1000, show_default=True, help='Downloads seeded per day of history.')
+    @click.option('--requests', default=20, show_default=True, help='Statistics computed per history length.')
+    def stats_benchmark_cmd(days, per_day, requests):
+        """Time the account statistics on a copy of the database while its download history grows."""
+        from app.utilities.rollups import benchmark_account_stats
+        if db.engine.dialect.name != 'sqlite':
+            print('The benchmark only runs on SQLite.')
+            return
+        try:
+            lengths = [int(day) for day in days.split(',')]
+        except ValueError:
+            raise click.BadParameter('Give whole numbers of days, e.g. 30,365.', param_hint='--days')
+        for length, events, stats, page in benchmark_account_stats(lengths, per_day, requests=requests):
+            print(f'  {length:5d} days {events:9d} downloads   account_stats {stats:7.2f} ms   '
+                  f'with 30-day figures {page:7.2f} ms')
+
+    # CLI command: flask compact-downloads
+    @app.cli.command('compact-downloads')
+    @click.option('--days', type=int, default=None,
+                  help='Keep raw events of this many days. [default: DOWNLOAD_RETENTION_DAYS]')
+    @click.option('--batch-size', default=1000, show_default=True, help='Raw events deleted per transaction.')
+    @click.option('--pause', default=50, show_default=True, help='Milliseconds between two delete batches.')
+    def compact_downloads_cmd(days, batch_size, pause):
+        """Fold old download events into the daily rollups, archive them and delete them."""
+        from app.utilities.rollups import compact_downloads
+        if days is None:
+            days = app.config['DOWNLOAD_RETENTION_DAYS']
+        if not days or days < 1:
+            raise click.BadParameter('Give the number of days to keep, at least 1.', param_hint='--days')
+        folded, retired = compact_downloads(days, batch_size=batch_size, pause=pause / 1000)
+        print(f'Folded {folded} download events, deleted {retired} raw events older than {days} days.')
+        if retired and app.config['DOWNLOAD_ARCHIVE_DIR']:
+            print(f"Archived them to {app.config['DOWNLOAD_ARCHIVE_DIR']}.")
+        if days < 30:
+            print('Per-download timestamps now cover fewer days than the 30-day statistics; '
+                  'those count whole days before them.')
+
+    # CLI command: flask query_plans
+    @app.cli.command('query_plans')
+    @click.option('--user', 'user_id', default=1, show_default=True, help='User id the queries are run for.')
+    @click.option('--team', 'team_id', default=1, show_default=True, help='Team id the queries are run for.')
+    @click.option('--verbose', '-v', is_flag=True, help='Print every statement and its plan.')
+    def query_plans_cmd(user_id, team_id, verbose):
+        """Fail if one of the key queries scans a whole table (SQLite only)."""
+        from app.utilities.query_plans import check_query_plans
+        if db.engine.dialect.name != 'sqlite':
+            print('Query plans are only checked on SQLite.')
+            return
+        failed = 0
+        for name, statement, plan, scans in check_query_plans(user_id, team_id):
+            if scans:
+                failed += 1
+            if scans or verbose:
+                print(f"{'FULL SCAN of ' + ', '.join(scans) if scans else 'ok'} [{name}]")
+                print(f'  {" ".join(statement.split())}')
+                for detail in plan:
+                    print(f'    {detail}')
+        if failed:
+            print(f'{failed} statements scan whole tables.')
+            raise SystemExit(1)
+        print('No full table scans.')
+
+    # CLI command: flask sweep_files
+    @app.cli.command('sweep_files')
+    def sweep_files_cmd():
+        """Remove files of deleted shapes and stencils queued by the delete routes."""
+        from app.utilities.file_cleanup import sweep_file_deletions, pending_file_deletions
+        removed, failed = sweep_file_deletions()
+        print(f'Removed {removed} files, {failed} failed, {pending_file_deletions()} pending.')
+
+    # CLI command: flask run-jobs
+    @app.cli.command('run-jobs')
+    @click.option('--once', is_flag=True, help='Run the jobs that are due now and exit.')
+    def run_jobs_cmd(once):
+        """Run scheduled jobs (expirations, file sweep) in a dedicated worker."""
+        import time
+        from datetime import timedelta
+        from app.utilities.jobs import ensure_periodic_jobs, run_due_jobs, pending_jobs
+        ensure_periodic_jobs()
+        interval = app.config['JOBS_POLL_INTERVAL'] or 30
+        claim_timeout = timedelta(seconds=app.config['JOBS_CLAIM_TIMEOUT'])
+        while True:
+            done, failed = run_due_jobs(claim_timeout=claim_timeout)
+            if once:
+                print(f'Ran {done} jobs, {failed} failed, {pending_jobs()} scheduled.')
+                return
+            time.sleep(interval)
+
+    # CLI command: flask storage-check
+    @app.cli.command('storage-check')
+    def storage_check_cmd():
+        """Write, copy, download and delete scratch objects on the configured storage backend."""
+        from app.utilities.storage import check_storage, get_storage
+        storage = get_storage()
+        print(f'Checking {type(storage).__name__}.')
+        for step, error in check_storage(storage):
+            print(f'  {step:10} {error or "ok"}')
+            if error:
+                raise SystemExit(1)
+        print('Storage backend works.')
+
+    # CLI command: flask storage-audit
+    @app.cli.command('storage-audit')
+    @click.option('--reclaim', is_flag=True, help='Delete orphaned files.')
+    @click.option('--min-age', default=60, show_default=True, help='Only reclaim orphans older than this many minutes.')
+    @click.option('--verbose', '-v', is_flag=True, help='List every orphaned and missing file.')
+    def storage_audit_cmd(reclaim, min_age, verbose):
+        """Find files without a DB row (orphans) and rows without a file (missing)."""
+        from app.utilities.storage_audit import audit_storage, reclaim_orphans
+        result = audit_storage()
+        print(f'Checked {result.checked_files} files against {result.checked_rows} rows.')
+        print(f'Orphaned files: {len(result.orphans)} ({result.orphan_bytes / 1024 / 1024:.1f} MB)')
+        print(f'Missing files:  {len(result.missing)}')
+        if verbose:
+            for obj in result.orphans:
+                print(f'  orphan  {obj.key} ({obj.size} bytes)')
+            for kind, item_id in result.missing:
+                print(f'  missing {kind} {item_id}')
+        if reclaim:
+            files, size = reclaim_orphans(result, min_age=min_age * 60)
+            print(f'Reclaimed {files} files ({size / 1024 / 1024:.1f} MB).')
 
     return app
@@ -4,15 +4,17 @@ from flask_mail import Message
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 import re
 from app.blueprints.account import bp
-from app.extensions import db, mail
+from app.extensions import db
 from app.models.auth import User, Team, TeamMembership
 from app.utilities import expire_pending_email_after_time
-from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
+from app.utilities.account_lists import shape_page, stencil_page
+from app.utilities.bulk_content import KINDS, BulkError, bulk_update, split_tags
+from app.utilities.file_cleanup import queue_shape_files, queue_stencil_files
+from app.utilities.outbox import queue_mail
+from app.utilities.rollups import cached_account_stats, forget_content, refresh_user_stats, user_counters
+from app.utilities.transactions import write_transaction
+from app.models.visio import Shape, Stencil
 from flask_login import login_required, current_user
-from pathlib import Path
-from sqlalchemy import func
-from datetime import datetime, timedelta
-import logging
 
 
 # ── Helper: team access ──
@@ -50,185 +52,53 @@ def _can_manage_stencil(stencil):
 @bp.route('/account')
 @login_required
 def account():
-    shapes = Shape.query.filter_by(user_id=current_user.id).order_by(Shape.upload_date.desc()).all()
-    stencils = Stencil.query.filter_by(user_id=current_user.id).order_by(Stencil.upload_date.desc()).all()
-
-    my_shape_ids = [s.id for s in shapes]
-    my_stencil_ids = [s.id for s in stencils]
-
-    if my_shape_ids:
-        my_shapes_used_by_others = (
-            ShapeDownload.query
-            .filter(ShapeDownload.shape_id.in_(my_shape_ids), ShapeDownload.user_id != current_user.id)
-            .count()
-        )
-        users_used_my_shapes = (
-            db.session.query(func.count(func.distinct(ShapeDownload.user_id)))
-            .filter(ShapeDownload.shape_id.in_(my_shape_ids), ShapeDownload.user_id != current_user.id)
-            .scalar() or 0
-        )
-        top_own_shapes = (
-            db.session.query(Shape, func.count(ShapeDownload.id).label('cnt'))
-            .join(ShapeDownload, ShapeDownload.shape_id == Shape.id)
-            .filter(Shape.user_id == current_user.id, ShapeDownload.user_id != current_user.id)
-            .group_by(Shape.id)
-            .order_by(func.count(ShapeDownload.id).desc())
-            .limit(5)
-            .all()
-        )
-    else:
-        my_shapes_used_by_others = 0
-        users_used_my_shapes = 0
-        top_own_shapes = []
-
-    if my_stencil_ids:
-        my_stencils_downloaded_by_others = (
-            StencilDownload.query
-            .filter(StencilDownload.stencil_id.in_(my_stencil_ids), StencilDownload.user_id != current_user.id)
-            .count()
-        )
-        users_downloaded_my_stencils = (
-            db.session.query(func.count(func.distinct(StencilDownload.user_id)))
-            .filter(StencilDownload.stencil_id.in_(my_stencil_ids), StencilDownload.user_id != current_user.id)
-            .scalar() or 0
-        )
-        top_own_stencils = (
-            db.session.query(Stencil, func.count(StencilDownload.id).label('cnt'))
-            .join(StencilDownload, StencilDownload.stencil_id == Stencil.id)
-            .filter(Stencil.user_id == current_user.id, StencilDownload.user_id != current_user.id)
-            .group_by(Stencil.id)
-            .order_by(func.count(StencilDownload.id).desc())
-            .limit(5)
-            .all()
-        )
-    else:
-        my_stencils_downloaded_by_others = 0
-        users_downloaded_my_stencils = 0
-        top_own_stencils = []
-
-    top_foreign_shapes = (
-        db.session.query(Shape, func.count(ShapeDownload.id).label('cnt'))
-        .join(ShapeDownload, ShapeDownload.shape_id == Shape.id)
-        .filter(ShapeDownload.user_id == current_user.id, Shape.user_id != current_user.id)
-        .group_by(Shape.id)
-        .order_by(func.count(ShapeDownload.id).desc())
-        .limit(5)
-        .all()
-    )
-    foreign_shapes_used_total = (
-        ShapeDownload.query
-        .join(Shape, Shape.id == ShapeDownload.shape_id)
-        .filter(ShapeDownload.user_id == current_user.id, Shape.user_id != current_user.id)
-        .count()
-    )
-    top_foreign_stencils = (
-        db.session.query(Stencil, func.count(StencilDownload.id).label('cnt'))
-        .join(StencilDownload, StencilDownload.stencil_id == Stencil.id)
-        .filter(StencilDownload.user_id == current_user.id, Stencil.user_id != current_user.id)
-        .group_by(Stencil.id)
-        .order_by(func.count(StencilDownload.id).desc())
-        .limit(5)
-        .all()
-    )
-    foreign_stencils_downloaded_total = (
-        StencilDownload.query
-        .join(Stencil, Stencil.id == StencilDownload.stencil_id)
-        .filter(StencilDownload.user_id == current_user.id, Stencil.user_id != current_user.id)
-        .count()
-    )
-
-    top_used_shapes = (
-        db.session.query(Shape, func.count(ShapeDownload.id).label('cnt'))
-        .join(ShapeDownload, ShapeDownload.shape_id == Shape.id)
-        .filter(ShapeDownload.user_id == current_user.id)
-        .group_by(Shape.id)
-        .order_by(func.count(ShapeDownload.id).desc())
-        .limit(5)
-        .all()
-    )
-    shapes_used_total = (
-        ShapeDownload.query
-        .filter(ShapeDownload.user_id == current_user.id)
-        .count()
-    )
-
-    top_downloaded_stencils = (
-        db.session.query(Stencil, func.count(StencilDownload.id).label('cnt'))
-        .join(StencilDownload, StencilDownload.stencil_id == Stencil.id)
-        .filter(StencilDownload.user_id == current_user.id)
-        .group_by(Stencil.id)
-        .order_by(func.count(StencilDownload.id).desc())
-        .limit(5)
-        .all()
-    )
-    stencils_downloaded_total = (
-        StencilDownload.query
-        .filter(StencilDownload.user_id == current_user.id)
-        .count()
-    )
-
-    since = datetime.utcnow() - timedelta(days=30)
-
-    my_shapes_used_by_others_30d = (
-        ShapeDownload.query
-        .filter(ShapeDownload.shape_id.in_(my_shape_ids), ShapeDownload.user_id != current_user.id, ShapeDownload.date >= since)
-        .count()
-    ) if my_shape_ids else 0
-
-    my_stencils_downloaded_by_others_30d = (
-        StencilDownload.query
-        .filter(StencilDownload.stencil_id.in_(my_stencil_ids), StencilDownload.user_id != current_user.id, StencilDownload.date >= since)
-        .count()
-    ) if my_stencil_ids else 0
-
-    shapes_used_by_me_30d = (
-        ShapeDownload.query
-        .filter(ShapeDownload.user_id == current_user.id, ShapeDownload.date >= since)
-        .count()
-    )
-
-    stencils_downloaded_by_me_30d = (
-        StencilDownload.query
-        .filter(StencilDownload.user_id == current_user.id, StencilDownload.date >= since)
-        .count()
-    )
-
-    stats = {
-        'my_shapes_used_by_others': my_shapes_used_by_others,
-        'users_used_my_shapes': users_used_my_shapes,
-        'my_stencils_downloaded_by_others': my_stencils_downloaded_by_others,
-        'users_downloaded_my_stencils': users_downloaded_my_stencils,
-        'top_own_shapes': top_own_shapes,
-        'top_own_stencils': top_own_stencils,
-        'shapes_used_total': shapes_used_total,
-        'stencils_downloaded_total': stencils_downloaded_total,
-        'top_used_shapes': top_used_shapes,
-        'top_downloaded_stencils': top_downloaded_stencils,
-        'foreign_shapes_used_total': foreign_shapes_used_total,
-        'foreign_stencils_downloaded_total': foreign_stencils_downloaded_total,
-        'top_foreign_shapes': top_foreign_shapes,
-        'top_foreign_stencils': top_foreign_stencils,
-        'my_shapes_used_by_others_30d': my_shapes_used_by_others_30d,
-        'my_stencils_downloaded_by_others_30d': my_stencils_downloaded_by_others_30d,
-        'shapes_used_by_me_30d': shapes_used_by_me_30d,
-        'stencils_downloaded_by_me_30d': stencils_downloaded_by_me_30d,
-    }
+    shapes, shapes_next = shape_page(current_user.id)
+    stencils, stencils_next = stencil_page(current_user.id)
 
     memberships = current_user.memberships
 
     return render_template(
         'browser/account.html',
         shapes=shapes,
+        shapes_next=shapes_next,
         stencils=stencils,
-        stats=stats,
+        stencils_next=stencils_next,
+        counters=user_counters(current_user.id),
         memberships=memberships,
     )
 
 
+@bp.route('/account/shapes')
+@login_required
+def account_shapes():
+    q = request.args.get('q', '').strip()
+    after = request.args.get('after', type=int)
+    shapes, next_cursor = shape_page(current_user.id, q, after)
+    return render_template('browser/_account_shapes.html', shapes=shapes, next_cursor=next_cursor,
+                           q=q, after=after)
+
+
+@bp.route('/account/stencils')
+@login_required
+def account_stencils():
+    q = request.args.get('q', '').strip()
+    after = request.args.get('after', type=int)
+    stencils, next_cursor = stencil_page(current_user.id, q, after)
+    return render_template('browser/_account_stencils.html', stencils=stencils, next_cursor=next_cursor,
+                           q=q, after=after)
+
+
+@bp.route('/account/stats.json')
+@login_required
+def account_stats_json():
+    return jsonify(cached_account_stats(current_user.id))
+
+
 # ── Profile edits ──
 
 @bp.route('/account/change_name', methods=['POST'])
 @login_required
+@write_transaction
 def change_name():
     new_name = request.form.get('name', '').strip()
     if not new_name:
@@ -278,6 +148,7 @@ def _build_email_change_email(confirm_url):
 
 @bp.route('/account/change_email', methods=['POST'])
 @login_required
+@write_transaction
 def change_email():
     new_email = request.form.get('email', '').strip().lower()
     if not new_email:
@@ -293,7 +164,6 @@ def change_email():
     token = s.dumps({'user_id': current_user.id, 'new_email': new_email})
 
     current_user.pending_email = new_email
-    db.session.commit()
     expire_pending_email_after_time(current_user.id)
 
     confirm_url = f"{current_app.config['BASE_URL']}/account/confirm_email/{token}"
@@ -302,13 +172,15 @@ def change_email():
         recipients=[new_email],
         html=_build_email_change_email(confirm_url)
     )
-    mail.send(msg)
+    queue_mail(msg)
+    db.session.commit()
 
     return jsonify({'pending_email': new_email}), 200
 
 
 @bp.route('/account/confirm_email/<token>')
 @login_required
+@write_transaction
 def confirm_email(token):
     s = URLSafeTimedSerializer(current_app.config['SECRET_KEY'])
     try:
@@ -346,6 +218,7 @@ def confirm_email(token):
 
 @bp.route('/account/cancel_email_change', methods=['POST'])
 @login_required
+@write_transaction
 def cancel_email_change():
     current_user.pending_email = None
     db.session.commit()
@@ -356,53 +229,43 @@ def cancel_email_change():
 
 @bp.route('/account/shape/<int:shape_id>/delete', methods=['POST'])
 @login_required
+@write_transaction
 def delete_shape(shape_id):
     shape = Shape.query.get_or_404(shape_id)
     if not _can_manage_shape(shape):
         abort(403)
 
-    img_path = Path(current_app.root_path) / 'static' / 'images' / 'shapes' / f'{shape_id}.png'
-    try:
-        if img_path.exists():
-            img_path.unlink()
-    except Exception:
-        logging.warning(f'Could not delete image for shape {shape_id}')
-
+    queue_shape_files([shape_id])
+    affected = forget_content(shape_ids=[shape_id]) | {shape.user_id}
     db.session.delete(shape)
+    db.session.flush()
+    refresh_user_stats(affected)
     db.session.commit()
     return jsonify({'message': 'deleted'}), 200
 
 
 @bp.route('/account/stencil/<int:stencil_id>/delete', methods=['POST'])
 @login_required
+@write_transaction
 def delete_stencil(stencil_id):
     stencil = Stencil.query.get_or_404(stencil_id)
     if not _can_manage_stencil(stencil):
         abort(403)
 
-    ext = Path(stencil.file_name).suffix
-    stencil_path = Path(current_app.root_path) / 'stencils' / f'{stencil_id}{ext}'
-    try:
-        if stencil_path.exists():
-            stencil_path.unlink()
-    except Exception:
-        logging.warning(f'Could not delete stencil file {stencil_id}')
-
-    for shape in stencil.shapes:
-        img_path = Path(current_app.root_path) / 'static' / 'images' / 'shapes' / f'{shape.id}.png'
-        try:
-            if img_path.exists():
-                img_path.unlink()
-        except Exception:
-            logging.warning(f'Could not delete image for shape {shape.id}')
-
+    shape_ids = [shape_id for shape_id, in db.session.query(Shape.id).filter(Shape.stencil_id == stencil_id)]
+    queue_stencil_files([(stencil_id, stencil.file_name)])
+    queue_shape_files(shape_ids)
+    affected = forget_content(shape_ids=shape_ids, stencil_ids=[stencil_id]) | {stencil.user_id}
     db.session.delete(stencil)
+    db.session.flush()
+    refresh_user_stats(affected)
     db.session.commit()
     return jsonify({'message': 'deleted'}), 200
 
 
 @bp.route('/account/shape/<int:shape_id>/edit', methods=['POST'])
 @login_required
+@write_transaction
 def edit_shape(shape_id):
     shape = Shape.query.get_or_404(shape_id)
     if not _can_manage_shape(shape):
@@ -417,6 +280,7 @@ def edit_shape(shape_id):
 
 @bp.route('/account/stencil/<int:stencil_id>/edit', methods=['POST'])
 @login_required
+@write_transaction
 def edit_stencil(stencil_id):
     stencil = Stencil.query.get_or_404(stencil_id)
     if not _can_manage_stencil(stencil):
@@ -434,6 +298,31 @@ def edit_stencil(stencil_id):
     }), 200
 
 
+@bp.route('/account/<any(shapes, stencils):kind>/bulk', methods=['POST'])
+@login_required
+@write_transaction
+def bulk_content(kind):
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'invalid_body'}), 400
+    try:
+        results = bulk_update(
+            KINDS[kind], data.get('action'), data.get('ids'), current_user,
+            team_id=data.get('team_id'),
+            owner_id=data.get('owner_id'),
+            add=split_tags(data.get('add')),
+            remove=split_tags(data.get('remove')),
+        )
+    except BulkError as e:
+        db.session.rollback()
+        return jsonify({'error': e.error}), e.status
+    db.session.commit()
+    return jsonify({
+        'results': results,
+        'done': sum(1 for r in results if r['result'] == 'ok'),
+    }), 200
+
+
 # ── Team member management (Team Owner only) ──
 
 def _build_team_notification_email(subject_text, body_html):
@@ -479,10 +368,7 @@ def _send_team_added_email(user, team, role):
         recipients=[user.email],
         html=_build_team_notification_email(team.name, body)
     )
-    try:
-        mail.send(msg)
-    except Exception:
-        logging.warning(f'Could not send team-added email to {user.email}')
+    queue_mail(msg)
 
 
 def _send_team_removed_email(user, team):
@@ -497,14 +383,12 @@ def _send_team_removed_email(user, team):
         recipients=[user.email],
         html=_build_team_notification_email(team.name, body)
     )
-    try:
-        mail.send(msg)
-    except Exception:
-        logging.warning(f'Could not send team-removed email to {user.email}')
+    queue_mail(msg)
 
 
 @bp.route('/account/team/<int:team_id>/add_member', methods=['POST'])
 @login_required
+@write_transaction
 def team_add_member(team_id):
     team = Team.query.get_or_404(team_id)
 
@@ -526,9 +410,8 @@ def team_add_member(team_id):
 
     membership = TeamMembership(user_id=user.id, team_id=team_id, role=role)
     db.session.add(membership)
-    db.session.commit()
-
     _send_team_added_email(user, team, role)
+    db.session.commit()
 
     return jsonify({
         'ok': True,
@@ -538,6 +421,7 @@ def team_add_member(team_id):
 
 @bp.route('/account/team/<int:team_id>/remove_member', methods=['POST'])
 @login_required
+@write_transaction
 def team_remove_member(team_id):
     team = Team.query.get_or_404(team_id)
 
@@ -555,16 +439,16 @@ def team_remove_member(team_id):
 
     user = User.query.get(user_id)
     db.session.delete(membership)
-    db.session.commit()
-
     if user:
         _send_team_removed_email(user, team)
+    db.session.commit()
 
     return jsonify({'ok': True}), 200
 
 
 @bp.route('/account/team/<int:team_id>/set_visibility', methods=['POST'])
 @login_required
+@write_transaction
 def team_set_visibility(team_id):
     team = Team.query.get_or_404(team_id)
 
@@ -583,6 +467,7 @@ def team_set_visibility(team_id):
 
 @bp.route('/account/team/<int:team_id>/set_member_role', methods=['POST'])
 @login_required
+@write_transaction
 def team_set_member_role(team_id):
     team = Team.query.get_or_404(team_id)  # noqa: F841
 
@@ -1,18 +1,20 @@
 from functools import wraps
-from pathlib import Path
-
-import logging
 
 from flask import render_template, redirect, abort, flash, current_app, request, jsonify
 from flask_babel import gettext as _
 from flask_login import login_required, current_user
 from flask_mail import Message
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 
 from app.blueprints.admin import bp
-from app.extensions import db, mail
+from app.extensions import db
 from app.models.auth import User, Role, Team, TeamMembership
-from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
+from app.models.stats import ShapeUsage, StencilUsage, UserStats
+from app.models.visio import Shape, Stencil
+from app.utilities.outbox import queue_mail, outbox_status
+from app.utilities.transactions import write_metrics, write_transaction
+from app.utilities.user_deletion import start_user_deletion, deletion_status, recent_deletions
 
 
 # ── Helper functions ──
@@ -41,35 +43,66 @@ def admin_required(f):
 
 # ── User routes ──
 
+USERS_PER_PAGE = 50
+
+# Sort keys of the user list; the id makes the order of equal values stable across pages
+USER_SORTS = {
+    'registered': (User.register_date.desc(), User.id.desc()),
+    'active': (User.last_active.desc().nulls_last(), User.id.desc()),
+    'shapes': (func.coalesce(UserStats.shapes, 0).desc(), User.id.desc()),
+    'stencils': (func.coalesce(UserStats.stencils, 0).desc(), User.id.desc()),
+}
+
+
 @bp.route('/admin')
 @admin_required
 def admin_users():
-    users = User.query.order_by(User.register_date.desc()).all()
-
-    shape_counts_q = (
-        db.session.query(Shape.user_id, func.count(Shape.id))
-        .group_by(Shape.user_id)
+    q = request.args.get('q', '').strip()
+    sort = request.args.get('sort', 'registered')
+    if sort not in USER_SORTS:
+        sort = 'registered'
+    page = max(request.args.get('page', 1, type=int), 1)
+
+    conditions = []
+    if q:
+        conditions.append(db.or_(User.name.icontains(q, autoescape=True),
+                                 User.email.icontains(q, autoescape=True)))
+    total = db.session.query(func.count(User.id)).filter(*conditions).scalar()
+    pages = max((total + USERS_PER_PAGE - 1) // USERS_PER_PAGE, 1)
+
+    # Content counts come from the user_stats rollup, roles are loaded in one extra query
+    rows = (
+        db.session.query(User, func.coalesce(UserStats.shapes, 0), func.coalesce(UserStats.stencils, 0))
+        .outerjoin(UserStats, UserStats.user_id == User.id)
+        .options(selectinload(User.roles))
+        .filter(*conditions)
+        .order_by(*USER_SORTS[sort])
+        .limit(USERS_PER_PAGE)
+        .offset((page - 1) * USERS_PER_PAGE)
         .all()
     )
-    shape_counts = dict(shape_counts_q)
-
-    stencil_counts_q = (
-        db.session.query(Stencil.user_id, func.count(Stencil.id))
-        .group_by(Stencil.user_id)
-        .all()
-    )
-    stencil_counts = dict(stencil_counts_q)
+    users = [user for user, _shapes, _stencils in rows]
+    shape_counts = {user.id: shapes for user, shapes, _stencils in rows}
+    stencil_counts = {user.id: stencils for user, _shapes, stencils in rows}
 
     admin_user_ids = {u.id for u in users if any(r.name == 'admin' for r in u.roles)}
     owner_email = current_app.config.get('OWNER_EMAIL', '')
+    deletions = recent_deletions()
 
     return render_template(
         'browser/admin_users.html',
         users=users,
+        deletions=deletions,
+        deleting_user_ids={d.user_id for d in deletions if d.finished_at is None},
         shape_counts=shape_counts,
         stencil_counts=stencil_counts,
         admin_user_ids=admin_user_ids,
         owner_email=owner_email,
+        q=q,
+        sort=sort,
+        page=page,
+        pages=pages,
+        total=total,
     )
 
 
@@ -77,55 +110,129 @@ def admin_users():
 @admin_required
 def admin_user_detail(user_id):
     user = User.query.get_or_404(user_id)
+    # The sections are loaded page by page from admin_user_section()
+    return render_template('browser/admin_user_detail.html', user=user)
+
 
-    uploaded_shapes = (
-        db.session.query(Shape, func.count(ShapeDownload.id).label('cnt'))
-        .outerjoin(ShapeDownload, Shape.id == ShapeDownload.shape_id)
+# ── User detail sections ──
+# Only the displayed columns; counts come from the usage rollups, which
+# outlive retired raw download events. The id keeps equal counts in a
+# stable order across pages.
+
+DETAIL_PER_PAGE = 50
+
+
+def _uploaded_shapes(user_id):
+    downloads = (
+        db.session.query(ShapeUsage.shape_id, func.sum(ShapeUsage.count).label('cnt'))
+        .filter(ShapeUsage.owner_id == user_id)
+        .group_by(ShapeUsage.shape_id)
+        .subquery()
+    )
+    cnt = func.coalesce(downloads.c.cnt, 0)
+    return (
+        db.session.query(Shape.id, Shape.name, Shape.upload_date, cnt.label('count'))
+        .outerjoin(downloads, downloads.c.shape_id == Shape.id)
         .filter(Shape.user_id == user_id)
-        .group_by(Shape.id)
-        .order_by(func.count(ShapeDownload.id).desc())
-        .all()
+        .order_by(cnt.desc(), Shape.id.desc())
     )
 
-    downloaded_shapes = (
-        db.session.query(Shape, func.count(ShapeDownload.id).label('cnt'))
-        .join(ShapeDownload, Shape.id == ShapeDownload.shape_id)
-        .filter(ShapeDownload.user_id == user_id)
-        .group_by(Shape.id)
-        .order_by(func.count(ShapeDownload.id).desc())
-        .all()
+
+def _downloaded_shapes(user_id):
+    return (
+        db.session.query(Shape.id, Shape.name, Shape.upload_date, ShapeUsage.count)
+        .join(ShapeUsage, Shape.id == ShapeUsage.shape_id)
+        .filter(ShapeUsage.user_id == user_id)
+        .order_by(ShapeUsage.count.desc(), ShapeUsage.shape_id.desc())
     )
 
-    uploaded_stencils = (
-        db.session.query(Stencil, func.count(StencilDownload.id).label('cnt'))
-        .outerjoin(StencilDownload, Stencil.id == StencilDownload.stencil_id)
+
+def _uploaded_stencils(user_id):
+    downloads = (
+        db.session.query(StencilUsage.stencil_id, func.sum(StencilUsage.count).label('cnt'))
+        .filter(StencilUsage.owner_id == user_id)
+        .group_by(StencilUsage.stencil_id)
+        .subquery()
+    )
+    cnt = func.coalesce(downloads.c.cnt, 0)
+    shape_count = (
+        db.select(func.count(Shape.id))
+        .where(Shape.stencil_id == Stencil.id)
+        .correlate(Stencil)
+        .scalar_subquery()
+    )
+    return (
+        db.session.query(Stencil.id, Stencil.title, shape_count.label('shapes'), cnt.label('count'))
+        .outerjoin(downloads, downloads.c.stencil_id == Stencil.id)
         .filter(Stencil.user_id == user_id)
-        .group_by(Stencil.id)
-        .order_by(func.count(StencilDownload.id).desc())
-        .all()
+        .order_by(cnt.desc(), Stencil.id.desc())
     )
 
-    downloaded_stencils = (
-        db.session.query(Stencil, func.count(StencilDownload.id).label('cnt'))
-        .join(StencilDownload, Stencil.id == StencilDownload.stencil_id)
-        .filter(StencilDownload.user_id == user_id)
-        .group_by(Stencil.id)
-        .order_by(func.count(StencilDownload.id).desc())
+
+def _downloaded_stencils(user_id):
+    return (
+        db.session.query(Stencil.id, Stencil.title, StencilUsage.count)
+        .join(StencilUsage, Stencil.id == StencilUsage.stencil_id)
+        .filter(StencilUsage.user_id == user_id)
+        .order_by(StencilUsage.count.desc(), StencilUsage.stencil_id.desc())
+    )
+
+
+DETAIL_SECTIONS = {
+    'uploaded_shapes': _uploaded_shapes,
+    'downloaded_shapes': _downloaded_shapes,
+    'uploaded_stencils': _uploaded_stencils,
+    'downloaded_stencils': _downloaded_stencils,
+}
+
+
+@bp.route('/admin/user/<int:user_id>/<section>.json')
+@admin_required
+def admin_user_section(user_id, section):
+    if section not in DETAIL_SECTIONS:
+        abort(404)
+    page = max(request.args.get('page', 1, type=int), 1)
+    rows = (
+        DETAIL_SECTIONS[section](user_id)
+        .limit(DETAIL_PER_PAGE + 1)
+        .offset((page - 1) * DETAIL_PER_PAGE)
         .all()
     )
+    return jsonify({
+        'items': [row._asdict() for row in rows[:DETAIL_PER_PAGE]],
+        'page': page,
+        'has_more': len(rows) > DETAIL_PER_PAGE,
+    })
 
-    return render_template(
-        'browser/admin_user_detail.html',
-        user=user,
-        uploaded_shapes=uploaded_shapes,
-        downloaded_shapes=downloaded_shapes,
-        uploaded_stencils=uploaded_stencils,
-        downloaded_stencils=downloaded_stencils,
+
+# Typeahead for the user pickers. A prefix LIKE can use the NOCASE indexes on
+# name and email, so a lookup never reads the whole user table.
+
+USER_SEARCH_LIMIT = 10
+
+
+def user_search(q):
+    pattern = q.replace('/', '//').replace('%', '/%').replace('_', '/_') + '%'
+    return (
+        db.session.query(User.id, User.name, User.email)
+        .filter(db.or_(User.name.like(pattern, escape='/'), User.email.like(pattern, escape='/')))
+        .order_by(User.name.collate('NOCASE'))
+        .limit(USER_SEARCH_LIMIT)
     )
 
 
+@bp.route('/admin/users/search.json')
+@admin_required
+def admin_user_search():
+    q = request.args.get('q', '').strip()
+    if not q:
+        return jsonify([])
+    return jsonify([row._asdict() for row in user_search(q)])
+
+
 @bp.route('/admin/user/<int:user_id>/delete', methods=['POST'])
 @admin_required
+@write_transaction
 def admin_delete_user(user_id):
     user = User.query.get_or_404(user_id)
     owner_email = current_app.config.get('OWNER_EMAIL', '')
@@ -136,53 +243,23 @@ def admin_delete_user(user_id):
     if is_admin(user) and not is_owner(current_user):
         abort(403)
 
-    shape_ids = [s.id for s in user.shapes]
-    if shape_ids:
-        ShapeDownload.query.filter(
-            db.or_(
-                ShapeDownload.user_id == user_id,
-                ShapeDownload.shape_id.in_(shape_ids)
-            )
-        ).delete(synchronize_session=False)
-    else:
-        ShapeDownload.query.filter(ShapeDownload.user_id == user_id).delete(synchronize_session=False)
-
-    stencil_ids = [st.id for st in user.stencils]
-    if stencil_ids:
-        StencilDownload.query.filter(
-            db.or_(
-                StencilDownload.user_id == user_id,
-                StencilDownload.stencil_id.in_(stencil_ids)
-            )
-        ).delete(synchronize_session=False)
-    else:
-        StencilDownload.query.filter(StencilDownload.user_id == user_id).delete(synchronize_session=False)
-
-    for shape in user.shapes:
-        img_path = Path(current_app.root_path) / 'static' / 'images' / 'shapes' / f'{shape.id}.png'
-        try:
-            if img_path.exists():
-                img_path.unlink()
-        except Exception:
-            logging.warning(f'Could not delete image for shape {shape.id}')
-
-    for stencil in user.stencils:
-        ext = Path(stencil.file_name).suffix
-        stencil_path = Path(current_app.root_path) / 'stencils' / f'{stencil.id}{ext}'
-        try:
-            if stencil_path.exists():
-                stencil_path.unlink()
-        except Exception:
-            logging.warning(f'Could not delete stencil file {stencil.id}')
-
-    db.session.delete(user)
+    # Large accounts take a while; the delete_user job removes them in chunks
+    start_user_deletion(user, requested_by=current_user.email)
     db.session.commit()
+    flash(_('The account "%(name)s" is being deleted.', name=user.name), 'success')
 
     return redirect('/admin')
 
 
+@bp.route('/admin/deletions.json')
+@admin_required
+def admin_deletions_status():
+    return jsonify([deletion_status(deletion) for deletion in recent_deletions()])
+
+
 @bp.route('/admin/user/<int:user_id>/toggle_admin', methods=['POST'])
 @admin_required
+@write_transaction
 def admin_toggle_admin(user_id):
     if not is_owner(current_user):
         abort(403)
@@ -208,6 +285,21 @@ def admin_toggle_admin(user_id):
     return redirect('/admin')
 
 
+# ── Maintenance routes ──
+
+@bp.route('/admin/outbox.json')
+@admin_required
+def admin_outbox_status():
+    return jsonify(outbox_status())
+
+
+@bp.route('/admin/write_locks.json')
+@admin_required
+def admin_write_locks():
+    # Counters of the worker process that answers this request
+    return jsonify(write_metrics())
+
+
 # ── Team mail helpers ──
 
 def _build_team_notification_email(body_html):
@@ -247,10 +339,7 @@ def _send_team_owner_email(user, team):
         recipients=[user.email],
         html=_build_team_notification_email(body)
     )
-    try:
-        mail.send(msg)
-    except Exception:
-        logging.warning(f'Could not send team-owner email to {user.email}')
+    queue_mail(msg)
 
 
 def _send_team_owner_revoked_email(user, team):
@@ -266,10 +355,7 @@ def _send_team_owner_revoked_email(user, team):
         recipients=[user.email],
         html=_build_team_notification_email(body)
     )
-    try:
-        mail.send(msg)
-    except Exception:
-        logging.warning(f'Could not send team-owner-revoked email to {user.email}')
+    queue_mail(msg)
 
 
 def _send_team_member_added_email(user, team, role):
@@ -294,10 +380,7 @@ def _send_team_member_added_email(user, team, role):
         recipients=[user.email],
         html=_build_team_notification_email(body)
     )
-    try:
-        mail.send(msg)
-    except Exception:
-        logging.warning(f'Could not send team-member-added email to {user.email}')
+    queue_mail(msg)
 
 
 def _send_team_member_removed_email(user, team):
@@ -313,10 +396,7 @@ def _send_team_member_removed_email(user, team):
         recipients=[user.email],
         html=_build_team_notification_email(body)
     )
-    try:
-        mail.send(msg)
-    except Exception:
-        logging.warning(f'Could not send team-member-removed email to {user.email}')
+    queue_mail(msg)
 
 
 # ── Team routes (Owner only) ──
@@ -334,17 +414,29 @@ def owner_required(f):
 @bp.route('/admin/teams')
 @owner_required
 def admin_teams():
-    teams = Team.query.order_by(Team.name).all()
-    all_users = User.query.order_by(User.name).all()
+    teams = (
+        Team.query
+        .options(selectinload(Team.memberships).selectinload(TeamMembership.user))
+        .order_by(Team.name)
+        .all()
+    )
+    shape_counts = dict(
+        db.session.query(Shape.team_id, func.count(Shape.id)).filter(Shape.team_id.isnot(None)).group_by(Shape.team_id)
+    )
+    stencil_counts = dict(
+        db.session.query(Stencil.team_id, func.count(Stencil.id)).filter(Stencil.team_id.isnot(None)).group_by(Stencil.team_id)
+    )
     return render_template(
         'browser/admin_teams.html',
         teams=teams,
-        all_users=all_users,
+        shape_counts=shape_counts,
+        stencil_counts=stencil_counts,
     )
 
 
 @bp.route('/admin/team/create', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_create():
     name = request.form.get('name', '').strip()
     description = request.form.get('description', '').strip() or None
@@ -369,6 +461,7 @@ def admin_team_create():
 
 @bp.route('/admin/team/<int:team_id>/rename', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_rename(team_id):
     team = Team.query.get_or_404(team_id)
     new_name = request.form.get('name', '').strip()
@@ -386,6 +479,7 @@ def admin_team_rename(team_id):
 
 @bp.route('/admin/team/<int:team_id>/update_description', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_update_description(team_id):
     team = Team.query.get_or_404(team_id)
     description = request.form.get('description', '').strip()
@@ -396,6 +490,7 @@ def admin_team_update_description(team_id):
 
 @bp.route('/admin/team/<int:team_id>/delete', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_delete(team_id):
     team = Team.query.get_or_404(team_id)
 
@@ -410,6 +505,7 @@ def admin_team_delete(team_id):
 
 @bp.route('/admin/team/<int:team_id>/set_visibility', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_set_visibility(team_id):
     team = Team.query.get_or_404(team_id)
     visibility = request.form.get('visibility', 'public')
@@ -424,6 +520,7 @@ def admin_team_set_visibility(team_id):
 
 @bp.route('/admin/team/<int:team_id>/set_owner', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_set_owner(team_id):
     team = Team.query.get_or_404(team_id)
     user_id = request.form.get('user_id', type=int)
@@ -443,18 +540,19 @@ def admin_team_set_owner(team_id):
             m.role = None
 
     membership.role = 'owner'
-    db.session.commit()
 
     new_owner = db.session.get(User, user_id)
     _send_team_owner_email(new_owner, team)
     if former_owner:
         _send_team_owner_revoked_email(former_owner, team)
+    db.session.commit()
 
     return jsonify({'ok': True})
 
 
 @bp.route('/admin/team/<int:team_id>/remove_owner', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_remove_owner(team_id):
     team = Team.query.get_or_404(team_id)
 
@@ -464,22 +562,27 @@ def admin_team_remove_owner(team_id):
             former_owner = m.user
             m.role = None
 
-    db.session.commit()
     if former_owner:
         _send_team_owner_revoked_email(former_owner, team)
+    db.session.commit()
     return redirect('/admin/teams')
 
 
 @bp.route('/admin/team/<int:team_id>')
 @owner_required
 def admin_team_detail(team_id):
-    team = Team.query.get_or_404(team_id)
-    all_users = User.query.order_by(User.name).all()
-    return render_template('browser/admin_team_detail.html', team=team, all_users=all_users)
+    team = (
+        Team.query
+        .options(selectinload(Team.memberships).selectinload(TeamMembership.user))
+        .filter_by(id=team_id)
+        .first_or_404()
+    )
+    return render_template('browser/admin_team_detail.html', team=team)
 
 
 @bp.route('/admin/team/<int:team_id>/member/<int:user_id>/set_role', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_member_set_role(team_id, user_id):
     team = Team.query.get_or_404(team_id)
     target_m = TeamMembership.query.filter_by(user_id=user_id, team_id=team_id).first_or_404()
@@ -495,11 +598,11 @@ def admin_team_member_set_role(team_id, user_id):
                 former_owner = m.user
                 m.role = None
         target_m.role = 'owner'
-        db.session.commit()
         new_owner = db.session.get(User, user_id)
         _send_team_owner_email(new_owner, team)
         if former_owner:
             _send_team_owner_revoked_email(former_owner, team)
+        db.session.commit()
     else:
         target_m.role = role
         db.session.commit()
@@ -509,6 +612,7 @@ def admin_team_member_set_role(team_id, user_id):
 
 @bp.route('/admin/team/<int:team_id>/member/<int:user_id>/remove', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_member_remove(team_id, user_id):
     team = Team.query.get_or_404(team_id)
     membership = TeamMembership.query.filter_by(user_id=user_id, team_id=team_id).first_or_404()
@@ -516,19 +620,20 @@ def admin_team_member_remove(team_id, user_id):
     user = db.session.get(User, user_id)
 
     db.session.delete(membership)
-    db.session.commit()
 
     if user:
         if was_owner:
             _send_team_owner_revoked_email(user, team)
         else:
             _send_team_member_removed_email(user, team)
+    db.session.commit()
 
     return jsonify({'ok': True})
 
 
 @bp.route('/admin/team/<int:team_id>/add_member', methods=['POST'])
 @owner_required
+@write_transaction
 def admin_team_add_member(team_id):
     team = Team.query.get_or_404(team_id)
     email = request.form.get('email', '').strip().lower()
@@ -545,9 +650,8 @@ def admin_team_add_member(team_id):
 
     membership = TeamMembership(user_id=user.id, team_id=team_id, role=role)
     db.session.add(membership)
-    db.session.commit()
-
     _send_team_member_added_email(user, team, role)
+    db.session.commit()
 
     return jsonify({
         'ok': True,
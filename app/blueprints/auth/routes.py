@@ -1,34 +1,57 @@
-from flask import render_template, request, url_for, redirect, flash, current_app
+from flask import render_template, request, url_for, redirect, flash, current_app, jsonify
 from flask_babel import gettext as _
 from app.blueprints.auth import bp
 from app.models.auth import User, Team, Role
-from app.extensions import db, bcrypt, mail
+from app.extensions import db, http_auth
 from flask_login import login_user, login_required, logout_user, current_user
-from app.utilities import generate_password, delete_user_if_not_loggedIn_after_time, expire_pending_password_after_time
+from app.utilities import (
+    PASSWORD_WINDOW, generate_password, delete_user_if_not_loggedIn_after_time, expire_pending_password_after_time,
+)
+from app.utilities.outbox import queue_mail
+from app.utilities.passwords import hash_password, check_password, needs_rehash
+from app.utilities.transactions import begin_write, write_transaction
+from app.utilities.api_tokens import issue_token, revoke_tokens, verify_api_token, legacy_tokens_accepted
+from app.utilities.user_deletion import active_users
 from flask_mail import Message
 from sqlalchemy import func
 
 
+def _record_login(user):
+    # The first login activates the account and has to be visible to the
+    # registration expiry job right away. Later activity is recorded for
+    # every request by app.utilities.activity.
+    if user.last_active is None:
+        user.last_active = func.now()
+
+
 @bp.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         email = request.form['email']
         password = request.form['password']
-        user: User = User.query.filter_by(email=email).first()
+        user: User = active_users().filter_by(email=email).first()
 
-        if user and bcrypt.check_password_hash(user.password_hash, password):
+        if user and check_password(user.password_hash, password):
+            if needs_rehash(user.password_hash):
+                user.password_hash = hash_password(password)
+            begin_write()
             user.pending_password_hash = None
-            user.last_active = func.now()
+            _record_login(user)
             db.session.commit()
             login_user(user, remember=True)
             next_url = request.args.get('next') or url_for('browse')
             return redirect(next_url)
 
-        if user and user.pending_password_hash and bcrypt.check_password_hash(user.pending_password_hash, password):
-            user.password_hash = bcrypt.generate_password_hash(password)
-            user.token = password
+        if user and check_password(user.pending_password_hash, password):
+            # The pending hash is already a hash of this password
+            user.password_hash = user.pending_password_hash
+            if needs_rehash(user.password_hash):
+                user.password_hash = hash_password(password)
+            if legacy_tokens_accepted():
+                user.token = password
+            begin_write()
             user.pending_password_hash = None
-            user.last_active = func.now()
+            _record_login(user)
             db.session.commit()
             login_user(user, remember=True)
             next_url = request.args.get('next') or url_for('browse')
@@ -40,21 +63,44 @@ def login():
 
 
 @bp.route('/token_login', methods=['POST'])
+@write_transaction
 def token_login():
     if current_user.is_authenticated:
         logout_user()
 
     token = request.form['token']
-    user: User = User.query.filter_by(token=token).first()
+    principal = verify_api_token(token)
+    user: User = active_users().filter(User.id == principal.id).first() if principal else None
 
     if user:
-        user.last_active = func.now()
+        _record_login(user)
         db.session.commit()
         login_user(user, remember=True)
 
     return redirect(url_for('visio.panel'))
 
 
+@bp.route('/api/token', methods=['POST'])
+def api_token():
+    """Exchange e-mail and password for a signed API token for the Visio add-in."""
+    data = request.get_json(silent=True) or request.form
+    user: User = active_users().filter_by(email=data.get('email', '')).first()
+    if not user or not check_password(user.password_hash, data.get('password', '')):
+        return jsonify({'message': 'Invalid credentials'}), 401
+    return jsonify({'token': issue_token(user), 'expires_in': current_app.config['API_TOKEN_MAX_AGE']})
+
+
+@bp.route('/api/token/revoke', methods=['POST'])
+@http_auth.login_required
+@write_transaction
+def api_token_revoke():
+    """Invalidate all API tokens of the calling user (logout everywhere)."""
+    user = db.session.get(User, http_auth.current_user().id)
+    revoke_tokens(user)
+    db.session.commit()
+    return jsonify({'ok': True})
+
+
 @bp.route('/logout')
 @login_required
 def logout():
@@ -167,26 +213,29 @@ def register():
             return render_template('browser/register.html')
 
         password = generate_password(10)
-        token = password
+        # Raw password tokens are only issued during the transition to signed API tokens
+        token = password if legacy_tokens_accepted() else None
 
         new_user = User(
             email=email,
             name=name,
-            password_hash=bcrypt.generate_password_hash(password),
+            password_hash=hash_password(password),
             token=token
         )
+        begin_write()
         db.session.add(new_user)
-        db.session.commit()
+        db.session.flush()
+        delete_user_if_not_loggedIn_after_time(new_user.id)
 
         msg = Message(
             _('Your Visio-Shapes password'),
             recipients=[email],
             html=_build_registration_email(password, current_app.config['BASE_URL'])
         )
-        mail.send(msg)
+        queue_mail(msg, expires=PASSWORD_WINDOW)
+        db.session.commit()
 
         flash(_('An email has been sent to %(email)s. Please log in within 5 minutes.', email=email), category='success')
-        delete_user_if_not_loggedIn_after_time(new_user.id)
         return redirect(url_for('auth.login'))
 
     return render_template('browser/register.html')
@@ -199,20 +248,21 @@ def reset_password():
 
     if request.method == 'POST':
         email = request.form['email']
-        user: User = User.query.filter_by(email=email).first()
+        user: User = active_users().filter_by(email=email).first()
 
         if user:
             password = generate_password(10)
-            user.pending_password_hash = bcrypt.generate_password_hash(password)
-            db.session.commit()
+            user.pending_password_hash = hash_password(password)
+            begin_write()
+            expire_pending_password_after_time(user.id)
 
             msg = Message(
                 _('Your new Visio-Shapes password'),
                 recipients=[email],
                 html=_build_reset_email(password, current_app.config['BASE_URL'])
             )
-            mail.send(msg)
-            expire_pending_password_after_time(user.id)
+            queue_mail(msg, expires=PASSWORD_WINDOW)
+            db.session.commit()
 
         flash(_('If a matching account was found, an email has been sent.'), category='success')
         return redirect(url_for('auth.login'))
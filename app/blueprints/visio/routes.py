@@ -1,14 +1,24 @@
-from flask import render_template, request, send_file, jsonify, current_app, redirect, url_for
+from flask import render_template, request, jsonify, redirect, url_for, abort, Response
 from app.blueprints.visio import bp
 from app.extensions import db, http_auth
 from flask_login import current_user
 from app.models.auth import Team, TeamMembership
-from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
+from app.models.stats import ShapeUsage
+from app.models.visio import Shape, Stencil
 from app.utilities import register_shape, noaccess_shape
+from app.utilities.fingerprint import (
+    sha256_text, sha256_upload, save_deduplicated, image_candidates, stencil_candidates,
+)
+from app.utilities.file_cleanup import queue_shape_files, queue_stencil_files
+from app.utilities.rollups import record_shape_download, record_stencil_downloads, count_new_content, refresh_user_stats
+from app.utilities.storage import get_storage, shape_image_key, stencil_file_key
+from app.utilities.transactions import WriteConflict, begin_write
+from app.utilities.user_deletion import deletion_pending
 from sqlalchemy import func
 from sqlalchemy.orm import selectinload
-import json, logging
 from pathlib import Path
+from urllib.parse import quote
+import json, logging, zipfile
 
 
 @bp.route('/panel')
@@ -28,8 +38,8 @@ def get_shapes():
     limit = request.args.get('limit', type=int)
 
     download_counts = (
-        db.session.query(ShapeDownload.shape_id, func.count(ShapeDownload.id).label('cnt'))
-        .group_by(ShapeDownload.shape_id)
+        db.session.query(ShapeUsage.shape_id, func.sum(ShapeUsage.count).label('cnt'))
+        .group_by(ShapeUsage.shape_id)
         .subquery()
     )
 
@@ -98,13 +108,141 @@ def download_stencil(stencil_id):
             if not _user_is_team_member(current_user.id, stencil.team_id):
                 return redirect(url_for('auth.login'))
 
-    file_path = Path(current_app.root_path) / 'stencils' / f'{stencil_id}{Path(stencil.file_name).suffix}'
+    begin_write()
+    record_stencil_downloads([(stencil_id, stencil.user_id)], current_user.id)
+    db.session.commit()
 
-    download = StencilDownload(stencil_id=stencil_id, user_id=current_user.id)
-    db.session.add(download)
+    return get_storage().send(stencil_file_key(stencil_id, stencil.file_name), download_name=stencil.file_name)
+
+
+@bp.route('/shape_image/<int:shape_id>.png')
+def shape_image(shape_id):
+    storage = get_storage()
+    key = shape_image_key(shape_id)
+    if storage.stat(key) is None:
+        abort(404)
+    return storage.send(key, mimetype='image/png', max_age=86400)
+
+
+class _ZipStream:
+    """Write-only file object that buffers what ZipFile writes until it is drained.
+
+    It has no seek(), so ZipFile writes data descriptors instead of rewinding
+    to patch local headers and the archive can be streamed as it is built.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._pos = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._pos
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _stream_zip(storage, entries, chunk_size=64 * 1024):
+    """Yield a ZIP archive of (StoredObject, arcname) entries from storage chunk by chunk.
+
+    Runs while the response is sent, after the app context is gone, so it
+    must not touch current_app or the session.
+    """
+    buf = _ZipStream()
+    with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_STORED) as zf:
+        for obj, arcname in entries:
+            info = zipfile.ZipInfo(arcname, date_time=obj.changed.timetuple()[:6])
+            info.file_size = obj.size
+            with storage.open(obj.key) as src, zf.open(info, 'w') as dst:
+                for chunk in iter(lambda: src.read(chunk_size), b''):
+                    dst.write(chunk)
+                    yield buf.drain()
+            yield buf.drain()
+    yield buf.drain()
+
+
+def _unique_arcname(name, used):
+    if name not in used:
+        used.add(name)
+        return name
+    stem, suffix = Path(name).stem, Path(name).suffix
+    n = 2
+    while f'{stem} ({n}){suffix}' in used:
+        n += 1
+    name = f'{stem} ({n}){suffix}'
+    used.add(name)
+    return name
+
+
+@bp.route('/download_stencils')
+def download_stencils():
+    """Stream a ZIP of several stencils: ?team_id=<id> or ?ids=1,2,3."""
+    if not current_user.is_authenticated:
+        return redirect(url_for('auth.login'))
+
+    team_id = request.args.get('team_id', type=int)
+    try:
+        ids = [int(i) for i in request.args.get('ids', '').split(',') if i.strip()]
+    except ValueError:
+        abort(400)
+    if not team_id and not ids:
+        abort(400)
+
+    query = (
+        db.session.query(Stencil.id, Stencil.file_name, Stencil.user_id, Stencil.team_id, Team.visibility)
+        .outerjoin(Team, Stencil.team_id == Team.id)
+        .order_by(Stencil.id)
+    )
+    if team_id:
+        query = query.filter(Stencil.team_id == team_id)
+    if ids:
+        query = query.filter(Stencil.id.in_(ids))
+
+    # Access check for Visible and Private teams, resolved once for the whole bundle
+    member_team_ids = {
+        tid for tid, in
+        db.session.query(TeamMembership.team_id).filter(TeamMembership.user_id == current_user.id)
+    }
+    storage = get_storage()
+    entries = []
+    downloaded = []
+    used_names = set()
+    for stencil_id, file_name, owner_id, stencil_team_id, visibility in query:
+        if stencil_team_id and visibility in ('visible', 'private') and stencil_team_id not in member_team_ids:
+            continue
+        obj = storage.stat(stencil_file_key(stencil_id, file_name))
+        if obj is None:
+            logging.warning(f'Stencil file {stencil_id} missing, skipped in bundle')
+            continue
+        entries.append((obj, _unique_arcname(file_name, used_names)))
+        downloaded.append((stencil_id, owner_id))
+
+    if not entries:
+        abort(404)
+
+    begin_write()
+    record_stencil_downloads(downloaded, current_user.id)
     db.session.commit()
 
-    return send_file(file_path, download_name=stencil.file_name, as_attachment=True)
+    bundle_name = 'stencils.zip'
+    if team_id:
+        team = db.session.get(Team, team_id)
+        bundle_name = f'{team.name}.zip'
+    return Response(
+        _stream_zip(storage, entries),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f"attachment; filename=stencils.zip; filename*=UTF-8''{quote(bundle_name)}"},
+    )
 
 
 @bp.route('/get_shape/<int:shape_id>')
@@ -126,8 +264,8 @@ def get_shape(shape_id):
             if not _user_is_team_member(current_user.id, shape.team_id):
                 return access_denied()
 
-    download = ShapeDownload(shape_id=shape_id, user_id=current_user.id)
-    db.session.add(download)
+    begin_write()
+    record_shape_download(shape, current_user.id)
     db.session.commit()
 
     return shape.data_object
@@ -162,24 +300,54 @@ def add_shape():
             if not membership or membership.role not in ('contributor', 'admin', 'owner'):
                 return jsonify({'message': 'Forbidden: not a contributor of this team'}), 403
 
+        data_hash = sha256_text(add_shape_request['DataObject'])
+        image_hash = sha256_upload(file)
+
+        # Duplicate check and insert under the write lock
+        begin_write()
+        if deletion_pending(http_auth.current_user().id):
+            # The token may still be valid in other workers for API_TOKEN_GENERATION_TTL
+            return jsonify({'message': 'Forbidden: account is being deleted'}), 403
+        duplicate = Shape.query.filter_by(
+            user_id=http_auth.current_user().id,
+            team_id=team_id,
+            stencil_id=None,
+            data_hash=data_hash,
+        ).first()
+        if duplicate:
+            return jsonify({'message': 'Duplicate', 'id': duplicate.id}), 409
+
         new_shape = Shape(
             name=add_shape_request['Name'],
             prompt=add_shape_request['Prompt'],
             keywords=add_shape_request['Keywords'],
             data_object=add_shape_request['DataObject'],
+            data_hash=data_hash,
+            image_hash=image_hash,
             user_id=http_auth.current_user().id,
             team_id=team_id,
         )
 
         db.session.add(new_shape)
+        count_new_content(new_shape.user_id, shapes=1)
+        db.session.flush()
+        user_id, shape_id = new_shape.user_id, new_shape.id
         db.session.commit()
 
-        file.save(Path(current_app.root_path) / 'static' / 'images' / 'shapes' / f'{new_shape.id}.png')
-
+    except WriteConflict:
+        raise
     except Exception as e:
         logging.exception('Error adding shape.')
         return jsonify({'message': 'Failed'}), 500
 
+    # Stored after the commit, so the write lock is not held during the upload
+    try:
+        save_deduplicated(file, shape_image_key(shape_id), image_candidates(image_hash, exclude_id=shape_id))
+    except Exception:
+        logging.exception('Error storing shape image.')
+        _discard_upload(user_id, [shape_id])
+        return jsonify({'message': 'Failed'}), 500
+
     return jsonify({'message': 'Success'}), 201
 
 
@@ -201,17 +369,36 @@ def add_stencil():
             if not membership or membership.role not in ('contributor', 'admin', 'owner'):
                 return jsonify({'message': 'Forbidden: not a contributor of this team'}), 403
 
+        file_hash = sha256_upload(stencil)
+        image_hashes = [sha256_upload(image) for image in images]
+
+        # Duplicate check and insert under the write lock
+        begin_write()
+        if deletion_pending(http_auth.current_user().id):
+            # The token may still be valid in other workers for API_TOKEN_GENERATION_TTL
+            return jsonify({'message': 'Forbidden: account is being deleted'}), 403
+        duplicate = Stencil.query.filter_by(
+            user_id=http_auth.current_user().id,
+            team_id=team_id,
+            file_hash=file_hash,
+        ).first()
+        if duplicate:
+            return jsonify({'message': 'Duplicate', 'id': duplicate.id}), 409
+
         shapes_list = [
             Shape(
                 name=shape['Name'],
                 prompt=shape['Prompt'],
                 keywords=shape['Keywords'],
                 data_object=shape['DataObject'],
+                data_hash=sha256_text(shape['DataObject']),
                 user_id=http_auth.current_user().id,
                 team_id=team_id,
             )
             for shape in add_stencil_request['Shapes']
         ]
+        for shape, image_hash in zip(shapes_list, image_hashes):
+            shape.image_hash = image_hash
 
         new_stencil = Stencil(
             file_name=add_stencil_request['FileName'],
@@ -224,6 +411,7 @@ def add_stencil():
             categories=add_stencil_request['Categories'],
             tags=add_stencil_request['Tags'],
             comments=add_stencil_request['Comments'],
+            file_hash=file_hash,
             shapes=shapes_list,
             user_id=http_auth.current_user().id,
             team_id=team_id,
@@ -231,17 +419,52 @@ def add_stencil():
 
         db.session.add(new_stencil)
         db.session.flush()  # IDs werden vergeben, Transaktion noch offen
-
-        for shape, image in zip(shapes_list, images):
-            image.save(Path(current_app.root_path) / 'static' / 'images' / 'shapes' / f'{shape.id}.png')
-
-        stencil.save(Path(current_app.root_path) / 'stencils' / f'{new_stencil.id}{Path(stencil.filename).suffix}')
-
+        count_new_content(new_stencil.user_id, shapes=len(shapes_list), stencils=1)
+        user_id, stencil_id = new_stencil.user_id, new_stencil.id
+        shape_ids = [(shape.id, shape.image_hash) for shape in shapes_list]
         db.session.commit()
 
+    except WriteConflict:
+        raise
     except Exception:
         db.session.rollback()
         logging.exception('Error adding stencil.')
         return jsonify({'message': 'Failed'}), 500
 
+    # Stored after the commit, so the write lock is not held during the uploads
+    try:
+        for (shape_id, image_hash), image in zip(shape_ids, images):
+            save_deduplicated(image, shape_image_key(shape_id), image_candidates(image_hash, exclude_id=shape_id))
+
+        save_deduplicated(
+            stencil,
+            stencil_file_key(stencil_id, stencil.filename),
+            stencil_candidates(file_hash, exclude_id=stencil_id),
+        )
+    except Exception:
+        logging.exception('Error storing stencil files.')
+        _discard_upload(user_id, [shape_id for shape_id, _ in shape_ids], (stencil_id, stencil.filename))
+        return jsonify({'message': 'Failed'}), 500
+
     return jsonify({'message': 'Success'}), 201
+
+
+def _discard_upload(user_id, shape_ids, stencil=None):
+    """Remove the rows of an upload whose files could not be stored, and queue what was stored.
+
+    stencil is an (id, file name) pair. The upload has no downloads yet,
+    so only the uploader's content counters change.
+    """
+    try:
+        db.session.rollback()
+        begin_write()
+        queue_shape_files(shape_ids)
+        Shape.query.filter(Shape.id.in_(shape_ids)).delete(synchronize_session=False)
+        if stencil is not None:
+            queue_stencil_files([stencil])
+            Stencil.query.filter(Stencil.id == stencil[0]).delete(synchronize_session=False)
+        refresh_user_stats([user_id])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logging.exception('Could not remove the rows of a failed upload.')
@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from sqlalchemy.orm import DeclarativeBase
 from flask_migrate import Migrate
 from flask_bcrypt import Bcrypt
@@ -11,7 +12,30 @@ from flask_babel import Babel
 class Base(DeclarativeBase):
     pass
 
-db = SQLAlchemy(model_class=Base)
+
+class ReadRoutingSession(Session):
+    """Sends SELECTs to the 'read' engine while info['read_only'] is set.
+
+    Anything else, a flush, an INSERT/UPDATE/DELETE, raw SQL or a plain
+    connection() such as begin_write(), sets info['primary']: from then on
+    the session stays on the primary and reads its own writes.
+    """
+
+    def connection(self, *args, **kwargs):
+        self.info['primary'] = True
+        return super().connection(*args, **kwargs)
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self.info.get('primary'):
+            # ORM queries over several entities come without a clause
+            if self._flushing or not getattr(clause, 'is_select', clause is None):
+                self.info['primary'] = True
+            elif self.info.get('read_only') and 'read' in self._db.engines:
+                return self._db.engines['read']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(model_class=Base, session_options={'class_': ReadRoutingSession})
 migrate = Migrate()
 bcrypt = Bcrypt()
 login_manager = LoginManager()
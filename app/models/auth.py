@@ -2,7 +2,7 @@ from __future__ import annotations
 from app.extensions import db
 from datetime import datetime
 from typing import List
-from sqlalchemy import Integer, String, func, ForeignKey, Column, Table
+from sqlalchemy import Integer, String, func, ForeignKey, Column, Table, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from flask_login import UserMixin
 from app.models.visio import Shape, Stencil
@@ -11,12 +11,16 @@ user_role_table = Table(
     "user_role_table",
     db.Model.metadata,
     Column("user_id", ForeignKey("users.id")),
-    Column("role_id", ForeignKey("roles.id"))
+    Column("role_id", ForeignKey("roles.id")),
+    Index("ix_user_role_table_user", "user_id", "role_id"),
 )
 
 
 class TeamMembership(db.Model):
     __tablename__ = "team_membership"
+    __table_args__ = (
+        Index('ix_team_membership_team', 'team_id', 'role'),
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
     team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), primary_key=True)
     # 'owner', 'admin', 'contributor', or None (= Viewer/Konsument)
@@ -28,12 +32,14 @@ class TeamMembership(db.Model):
 class User(db.Model, UserMixin):
     __tablename__ = "users"
     id: Mapped[int] = mapped_column(primary_key=True)
-    register_date: Mapped[datetime] = mapped_column(insert_default=func.now())
-    last_active: Mapped[datetime] = mapped_column(nullable=True)
+    register_date: Mapped[datetime] = mapped_column(insert_default=func.now(), index=True)
+    last_active: Mapped[datetime] = mapped_column(nullable=True, index=True)
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
     email: Mapped[str] = mapped_column(unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(nullable=False)
     token: Mapped[str] = mapped_column(nullable=True)
+    # Bumped to revoke all signed API tokens of the user, see app.utilities.api_tokens
+    token_generation: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
     pending_password_hash: Mapped[str] = mapped_column(nullable=True)
     pending_email: Mapped[str] = mapped_column(nullable=True)
     message: Mapped[str] = mapped_column(String(512), nullable=True)
@@ -50,6 +56,11 @@ class User(db.Model, UserMixin):
         return self.id
 
 
+# Case-insensitive prefix search (LIKE 'abc%') for the user pickers
+Index('ix_users_name_nocase', User.name.collate('NOCASE'))
+Index('ix_users_email_nocase', User.email.collate('NOCASE'))
+
+
 class Team(db.Model):
     __tablename__ = "teams"
     id: Mapped[int] = mapped_column(primary_key=True)
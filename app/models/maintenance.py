@@ -0,0 +1,89 @@
+from __future__ import annotations
+from app.extensions import db
+from datetime import datetime
+from sqlalchemy import JSON, Index, String, Text, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class FileDeletion(db.Model):
+    """A stored file whose DB row is gone and which still has to be removed from disk."""
+    __tablename__ = "file_deletions"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # Storage key, e.g. 'shapes/12.png'
+    storage_key: Mapped[str] = mapped_column(String(512), nullable=False)
+    # Set in Python (not func.now()) so it has sub-second precision
+    queued_at: Mapped[datetime] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    next_attempt: Mapped[datetime] = mapped_column(nullable=True, index=True)
+    last_error: Mapped[str] = mapped_column(String(512), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"FileDeletion(id={self.id!r}, storage_key={self.storage_key!r})"
+
+
+class ScheduledJob(db.Model):
+    """A task from the job registry (app.utilities.jobs) that is due at run_at."""
+    __tablename__ = "scheduled_jobs"
+    __table_args__ = (
+        # At most one row per periodic task, so several processes can register them safely
+        Index('ix_scheduled_jobs_periodic_task', 'task', unique=True,
+              sqlite_where=text('repeat_seconds IS NOT NULL'),
+              postgresql_where=text('repeat_seconds IS NOT NULL')),
+    )
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task: Mapped[str] = mapped_column(String(64), nullable=False)
+    kwargs: Mapped[dict] = mapped_column(JSON, nullable=True)
+    run_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
+    # Set for periodic tasks: the job is rescheduled instead of removed after it ran
+    repeat_seconds: Mapped[int] = mapped_column(nullable=True)
+    claimed_at: Mapped[datetime] = mapped_column(nullable=True)
+    claimed_by: Mapped[str] = mapped_column(String(64), nullable=True)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    last_error: Mapped[str] = mapped_column(String(512), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"ScheduledJob(id={self.id!r}, task={self.task!r}, run_at={self.run_at!r})"
+
+
+class OutboxMessage(db.Model):
+    """An e-mail waiting to be delivered by the outbox sender (app.utilities.outbox)."""
+    __tablename__ = "mail_outbox"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    sender: Mapped[str] = mapped_column(String(255), nullable=True)
+    recipients: Mapped[list] = mapped_column(JSON, nullable=False)
+    html: Mapped[str] = mapped_column(Text, nullable=True)
+    body: Mapped[str] = mapped_column(Text, nullable=True)
+    queued_at: Mapped[datetime] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    next_attempt: Mapped[datetime] = mapped_column(nullable=True, index=True)
+    # Random token of the delivery batch that currently owns the message
+    claimed_by: Mapped[str] = mapped_column(String(32), nullable=True)
+    claimed_at: Mapped[datetime] = mapped_column(nullable=True)
+    last_error: Mapped[str] = mapped_column(String(512), nullable=True)
+    # Dropped unsent after this, e.g. a password that is no longer valid
+    expires_at: Mapped[datetime] = mapped_column(nullable=True)
+
+    def __repr__(self) -> str:
+        return f"OutboxMessage(id={self.id!r}, subject={self.subject!r})"
+
+
+class UserDeletion(db.Model):
+    """An account that the delete_user job (app.utilities.user_deletion) removes in chunks."""
+    __tablename__ = "user_deletions"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # No foreign key: the user row is the last thing the job deletes
+    user_id: Mapped[int] = mapped_column(nullable=False, index=True)
+    user_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    requested_by: Mapped[str] = mapped_column(String(255), nullable=True)
+    requested_at: Mapped[datetime] = mapped_column(nullable=False)
+    # Shapes and stencils the account had when the deletion was requested, and how many are gone
+    total: Mapped[int] = mapped_column(nullable=False, default=0)
+    done: Mapped[int] = mapped_column(nullable=False, default=0)
+    # 'shapes', 'stencils', 'downloads' or 'account'
+    step: Mapped[str] = mapped_column(String(20), nullable=False, default='shapes')
+    finished_at: Mapped[datetime] = mapped_column(nullable=True, index=True)
+    last_error: Mapped[str] = mapped_column(String(512), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"UserDeletion(id={self.id!r}, user_id={self.user_id!r}, step={self.step!r})"
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from datetime import date, datetime
+from app.extensions import db
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class UserStats(db.Model):
+    """Running totals for the account page, maintained by app.utilities.rollups."""
+    __tablename__ = "user_stats"
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    shapes: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    stencils: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    # Downloads of this user's content by other users, and how many distinct users that were
+    shapes_used_by_others: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    users_used_my_shapes: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    stencils_downloaded_by_others: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    users_downloaded_my_stencils: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    # Downloads by this user, in total and of other users' content
+    shapes_used: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    stencils_downloaded: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    foreign_shapes_used: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    foreign_stencils_downloaded: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+
+    def __repr__(self) -> str:
+        return f"UserStats(user_id={self.user_id!r})"
+
+
+class ShapeUsage(db.Model):
+    """How often a user downloaded a shape. owner_id is copied from the shape."""
+    __tablename__ = "shape_usage"
+    __table_args__ = (
+        Index('ix_shape_usage_user_count', 'user_id', 'count'),
+        Index('ix_shape_usage_owner', 'owner_id', 'shape_id'),
+    )
+    shape_id: Mapped[int] = mapped_column(ForeignKey("shapes.id"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
+class StencilUsage(db.Model):
+    """How often a user downloaded a stencil. owner_id is copied from the stencil."""
+    __tablename__ = "stencil_usage"
+    __table_args__ = (
+        Index('ix_stencil_usage_user_count', 'user_id', 'count'),
+        Index('ix_stencil_usage_owner', 'owner_id', 'stencil_id'),
+    )
+    stencil_id: Mapped[int] = mapped_column(ForeignKey("stencils.id"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
+class UserReach(db.Model):
+    """Another user downloaded at least one of owner_id's shapes or stencils (kind)."""
+    __tablename__ = "user_reach"
+    __table_args__ = (
+        Index('ix_user_reach_user', 'user_id'),
+    )
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    # 'shape' or 'stencil'
+    kind: Mapped[str] = mapped_column(String(10), primary_key=True)
+
+
+class DownloadDaily(db.Model):
+    """Downloads per day, item and downloader, folded in from the raw download tables."""
+    __tablename__ = "download_daily"
+    __table_args__ = (
+        Index('ix_download_daily_user', 'user_id', 'day'),
+        Index('ix_download_daily_owner', 'owner_id', 'day'),
+        Index('ix_download_daily_item', 'kind', 'item_id'),
+    )
+    day: Mapped[date] = mapped_column(primary_key=True)
+    # 'shape' or 'stencil'; item_id is a shapes.id or stencils.id accordingly
+    kind: Mapped[str] = mapped_column(String(10), primary_key=True)
+    item_id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
+class RollupWatermark(db.Model):
+    """Highest raw download id already folded into download_daily, per raw table.
+
+    retired_before: raw events before this time may be deleted, the days
+    before it are only counted from download_daily.
+    """
+    __tablename__ = "rollup_watermarks"
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_id: Mapped[int] = mapped_column(nullable=False, default=0)
+    retired_before: Mapped[datetime] = mapped_column(nullable=True)
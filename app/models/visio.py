@@ -2,7 +2,7 @@ from __future__ import annotations
 from app.extensions import db
 from datetime import datetime
 from typing import List
-from sqlalchemy import Integer, String, func, ForeignKey
+from sqlalchemy import Integer, String, func, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -11,8 +11,14 @@ if TYPE_CHECKING:
 
 class Stencil(db.Model):
     __tablename__ = "stencils"
+    __table_args__ = (
+        Index('ix_stencils_user_list', 'user_id', 'id'),
+        Index('ix_stencils_team_upload', 'team_id', 'upload_date'),
+        # Ids of deleted rows are never handed out again, their files may still be queued
+        {'sqlite_autoincrement': True},
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
-    upload_date: Mapped[datetime] = mapped_column(insert_default=func.now())
+    upload_date: Mapped[datetime] = mapped_column(insert_default=func.now(), index=True)
     last_update: Mapped[datetime] = mapped_column(nullable=True)
     file_name: Mapped[str] = mapped_column()
     title: Mapped[str] = mapped_column()
@@ -24,6 +30,7 @@ class Stencil(db.Model):
     categories: Mapped[str] = mapped_column()
     tags: Mapped[str] = mapped_column(String(512))
     comments: Mapped[str] = mapped_column(String(1024))
+    file_hash: Mapped[str] = mapped_column(String(64), nullable=True, index=True)
     shapes: Mapped[List["Shape"]] = relationship(back_populates="stencil", cascade="all, delete-orphan")
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     user: Mapped["User"] = relationship(back_populates="stencils")
@@ -36,14 +43,22 @@ class Stencil(db.Model):
 
 class Shape(db.Model):
     __tablename__ = "shapes"
+    __table_args__ = (
+        Index('ix_shapes_user_list', 'user_id', 'id'),
+        Index('ix_shapes_team_upload', 'team_id', 'upload_date'),
+        # Ids of deleted rows are never handed out again, their files may still be queued
+        {'sqlite_autoincrement': True},
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
-    upload_date: Mapped[datetime] = mapped_column(insert_default=func.now())
+    upload_date: Mapped[datetime] = mapped_column(insert_default=func.now(), index=True)
     last_update: Mapped[datetime] = mapped_column(nullable=True)
     name: Mapped[str] = mapped_column()
     prompt: Mapped[str] = mapped_column()
     keywords: Mapped[str] = mapped_column()
     data_object: Mapped[str] = mapped_column()
-    stencil_id: Mapped[int] = mapped_column(ForeignKey("stencils.id"), nullable=True)
+    data_hash: Mapped[str] = mapped_column(String(64), nullable=True, index=True)
+    image_hash: Mapped[str] = mapped_column(String(64), nullable=True, index=True)
+    stencil_id: Mapped[int] = mapped_column(ForeignKey("stencils.id"), nullable=True, index=True)
     stencil: Mapped["Stencil"] = relationship(back_populates="shapes")
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     user: Mapped["User"] = relationship(back_populates="shapes")
@@ -73,15 +88,27 @@ class Shape(db.Model):
 
 class ShapeDownload(db.Model):
     __tablename__ = "shape_downloads"
+    __table_args__ = (
+        Index('ix_shape_downloads_shape_user', 'shape_id', 'user_id'),
+        Index('ix_shape_downloads_user_date', 'user_id', 'date'),
+        # Ids of deleted rows are never handed out again, see rollups._fold()
+        {'sqlite_autoincrement': True},
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     shape_id: Mapped[int] = mapped_column(ForeignKey("shapes.id"), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    date: Mapped[datetime] = mapped_column(insert_default=func.now())
+    date: Mapped[datetime] = mapped_column(insert_default=func.now(), index=True)
 
 
 class StencilDownload(db.Model):
     __tablename__ = "stencil_downloads"
+    __table_args__ = (
+        Index('ix_stencil_downloads_stencil_user', 'stencil_id', 'user_id'),
+        Index('ix_stencil_downloads_user_date', 'user_id', 'date'),
+        # Ids of deleted rows are never handed out again, see rollups._fold()
+        {'sqlite_autoincrement': True},
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     stencil_id: Mapped[int] = mapped_column(ForeignKey("stencils.id"), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    date: Mapped[datetime] = mapped_column(insert_default=func.now())
+    date: Mapped[datetime] = mapped_column(insert_default=func.now(), index=True)
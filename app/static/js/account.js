@@ -1,4 +1,4 @@
-/* account.js – Account management: tabs, edit, delete, change name */
+/* account.js – Account management: tabs, lists, edit, delete, change name */
 
 // ── Inline name edit ──
 const nameEl = document.getElementById('account-display-name');
@@ -174,10 +174,59 @@ document.querySelectorAll('.tab-btn').forEach(btn => {
     btn.classList.add('active');
     const panel = document.getElementById('tab-' + btn.dataset.tab);
     panel.classList.add('active');
-    panel.querySelectorAll('img[data-src]').forEach(img => {
-      img.src = img.dataset.src;
-      delete img.dataset.src;
-    });
+    loadImages(panel);
+  });
+});
+
+function loadImages(container) {
+  container.querySelectorAll('img[data-src]').forEach(img => {
+    img.src = img.dataset.src;
+    delete img.dataset.src;
+  });
+}
+
+// ── Shape / stencil lists (pages of rendered rows, see /account/shapes) ──
+async function fetchRows(list, query, after) {
+  const params = new URLSearchParams();
+  if (query) params.set('q', query);
+  if (after) params.set('after', after);
+  const res = await fetch(`/account/${list}?${params}`);
+  if (!res.ok) throw new Error(res.status);
+  const tpl = document.createElement('template');
+  tpl.innerHTML = await res.text();
+  loadImages(tpl.content);
+  return tpl.content;
+}
+
+document.querySelectorAll('.account-filter').forEach(input => {
+  const container = document.getElementById(`account-list-${input.dataset.list}`);
+  let timer = null;
+  let seq = 0;
+
+  input.addEventListener('input', () => {
+    clearTimeout(timer);
+    timer = setTimeout(async () => {
+      const current = ++seq;
+      try {
+        const rows = await fetchRows(input.dataset.list, input.value.trim());
+        if (current === seq) container.replaceChildren(rows);
+      } catch {
+        if (current === seq) alert(window.TRANSLATIONS.network_error);
+      }
+    }, 300);
+  });
+
+  container.addEventListener('click', async e => {
+    const btn = e.target.closest('.account-more button');
+    if (!btn) return;
+    btn.disabled = true;
+    try {
+      const rows = await fetchRows(input.dataset.list, input.value.trim(), btn.dataset.after);
+      btn.parentElement.replaceWith(rows);
+    } catch {
+      btn.disabled = false;
+      alert(window.TRANSLATIONS.network_error);
+    }
   });
 });
 
@@ -251,3 +300,65 @@ document.getElementById('delete-confirm-btn').addEventListener('click', async ()
   }
   pendingDelete = null;
 });
+
+// ── Statistics (loaded after the page, see /account/stats.json) ──
+function renderTopList(section, items, userId) {
+  const list = section.querySelector('.overview-list');
+  const withAuthor = section.hasAttribute('data-author');
+  list.replaceChildren(...items.map((item, i) => {
+    const row = document.createElement('div');
+    row.className = 'overview-list-item';
+
+    const rank = document.createElement('span');
+    rank.className = 'overview-rank';
+    rank.textContent = i + 1;
+    row.append(rank);
+
+    if (item.kind === 'shape') {
+      const img = document.createElement('img');
+      img.className = 'overview-thumb';
+      img.src = `/shape_image/${item.id}.png`;
+      img.alt = item.name;
+      row.append(img);
+    }
+
+    const name = document.createElement('span');
+    name.className = 'overview-item-name';
+    name.textContent = item.name;
+    if (withAuthor) {
+      const author = document.createElement('span');
+      author.className = 'overview-item-author';
+      author.textContent = item.user_id === userId
+        ? window.TRANSLATIONS.by_me
+        : `${window.TRANSLATIONS.by} ${item.user_name}`;
+      name.append(' ', author);
+    }
+    row.append(name);
+
+    const count = document.createElement('span');
+    count.className = 'overview-item-count';
+    count.textContent = `${item.count}×`;
+    row.append(count);
+    return row;
+  }));
+  section.hidden = items.length === 0;
+}
+
+async function loadStats() {
+  try {
+    const res = await fetch('/account/stats.json');
+    if (!res.ok) return;
+    const stats = await res.json();
+    document.querySelectorAll('[data-stat]').forEach(el => {
+      el.textContent = stats[el.dataset.stat] ?? 0;
+    });
+    document.querySelectorAll('[data-top]').forEach(section => {
+      renderTopList(section, stats[section.dataset.top] || [], stats.user_id);
+    });
+    document.querySelectorAll('[data-empty]').forEach(el => {
+      el.hidden = el.dataset.empty.split(' ').some(key => (stats[key] || []).length);
+    });
+  } catch { /* the placeholders stay */ }
+}
+
+loadStats();
@@ -17,7 +17,7 @@ function buildCard(shape) {
   return `
     <div class="shape-card" title="${escHtml(shape.prompt)}">
       <div class="shape-card-image">
-        <img src="/static/images/shapes/${shape.id}.png" alt="${escHtml(shape.name)}" loading="lazy">
+        <img src="/shape_image/${shape.id}.png" alt="${escHtml(shape.name)}" loading="lazy">
       </div>
       <div class="shape-card-body">
         <div class="shape-card-name">${escHtml(shape.name)}</div>
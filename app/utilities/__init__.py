@@ -1,9 +1,12 @@
 import secrets
 import string
-from threading import Timer
+from datetime import timedelta
 from app.extensions import db
 from app.models.auth import User
-from flask import current_app
+from app.utilities.jobs import job, schedule
+
+# How long a mailed password is valid: to log in after registering, or to use after a reset
+PASSWORD_WINDOW = timedelta(minutes=5)
 
 
 def generate_password(length):
@@ -11,46 +14,43 @@ def generate_password(length):
     return ''.join(secrets.choice(alphabet) for i in range(length))
 
 
-def delete_user_if_not_logged_in(user_id, context):
-    with context:
-        user = db.session.get(User, user_id)
-        if not user: return
-        if user.last_active is None:
-            db.session.delete(user)
-            db.session.commit()
+@job('delete_user_if_not_logged_in')
+def delete_user_if_not_logged_in(user_id):
+    user = db.session.get(User, user_id)
+    if not user: return
+    if user.last_active is None:
+        db.session.delete(user)
+        db.session.commit()
 
 
 def delete_user_if_not_loggedIn_after_time(user_id):
-    t = Timer(300.0, delete_user_if_not_logged_in, [user_id, current_app.app_context()])
-    t.start()
+    schedule('delete_user_if_not_logged_in', PASSWORD_WINDOW, user_id=user_id)
 
 
-def _expire_pending_password(user_id, context):
-    with context:
-        user = db.session.get(User, user_id)
-        if not user:
-            return
-        user.pending_password_hash = None
-        db.session.commit()
+@job('expire_pending_password')
+def _expire_pending_password(user_id):
+    user = db.session.get(User, user_id)
+    if not user:
+        return
+    user.pending_password_hash = None
+    db.session.commit()
 
 
 def expire_pending_password_after_time(user_id):
-    t = Timer(300.0, _expire_pending_password, [user_id, current_app.app_context()])
-    t.start()
+    schedule('expire_pending_password', PASSWORD_WINDOW, user_id=user_id)
 
 
-def _expire_pending_email(user_id, context):
-    with context:
-        user = db.session.get(User, user_id)
-        if not user:
-            return
-        user.pending_email = None
-        db.session.commit()
+@job('expire_pending_email')
+def _expire_pending_email(user_id):
+    user = db.session.get(User, user_id)
+    if not user:
+        return
+    user.pending_email = None
+    db.session.commit()
 
 
 def expire_pending_email_after_time(user_id):
-    t = Timer(86400.0, _expire_pending_email, [user_id, current_app.app_context()])
-    t.start()
+    schedule('expire_pending_email', timedelta(hours=24), user_id=user_id)
 
 register_shape = r'{"Visio 15.0 Shapes":"UEsDBBQABgAIAAAAIQAmbrlnWQEAAD8EAAATAAgCW0NvbnRlbnRfVHlwZXNdLnhtbCCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACkU8luwyAQvVfqPyCulU3SQ1VVcXLocmxzSD8AwThBNYsYsv19Bye1mihLrV6QYHjLDI/RZGMbtoKIxruKD8sBZ+CU18bNK/45eyseOcMknZaNd1DxLSCfjG9vRrNtAGSEdljxRUrhSQhUC7ASSx/AUaX20cpE2zgXQaovOQdxPxg8COVdApeKlDn4ePQCtVw2ib1u6HjnBGzN2fPuXpaquLEZvylyRZzERGjwCCRDaIySiboTK6ePnBV7VyUh2zu4MAHvyPoZhVw5dPVbYI/7oHFGo4FNZUzv0pJ3sTLUltBeLS01Xl7myUYtFi2m1FGu6TFKK437cXZeIdCMkIZNax+RFtCHfdiX/To5dan9upftPeQSN418Gn1AylyEP5g+jG4XkIwuAhFBTAa6iJx6iE6RotFf0Ne1UdAFBfKP0KD7aqslJm//Lb+jOSEu2u8//gYAAP//AwBQSwMEFAAGAAgAAAAhAKdYwrUlAQAAXgMAAAsACAJfcmVscy8ucmVscyCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsk8tOwzAQRfdI/IPlfeOkPIRQk24QUncIhQ8Y7EliET9kT6r277EKBSIlZdEuPR7fe2auvFrvTM+2GKJ2tuRFlnOGVjqlbVvyt/p58cBZJLAKemex5HuMfF1dX61esQdKj2KnfWRJxcaSd0T+UYgoOzQQM+fRppvGBQOUjqEVHuQHtCiWeX4vwl8NXo002UaVPGzUDWf13ifnc7SFQQIFBEK6gAsfElkgnWZhNYQWqeTKyZdUjoeOLFFzMQ20vCwQdYN5t6D7CZSfuwxNM8dTzPAYLYOLrqFMOiO2OiWctl7k462LNPdg0NKv/VfrsX5qFXcz1hO5u6bREp++zSbiF3KI5Mw/2Rx6TiHdXhIJd4RWoToNBd4ficToV1SfAAAA//8DAFBLAwQUAAYACAAAACEAVOIMHvoSAAAMdQAAEgAAAHZpc2lvL2RvY3VtZW50LnhtbOxdW3fjOI5+33P2P/icefDsQyW+xHHSJ6k5iS+pbOc2cerS+6bYdKwpWfJIcqoyv34BUhJBEZTkntmqzmy6TneXhY8gSIIgCILSyV++r4PWs4gTPwpP2929Trslwnm08MOn0/Y2Xb47arf+8v4//+Pkkw+QcTTfrkWYtqBUmJy2V2m6+WV/P5mvxNpL9tb+PI6SaJnuzaP1frRc+nOx/4wF93udbm9/7flhW5X9JbZKRxsRAt9lFK+9NNmL4qeMRV4rMOkc7sci8FKQNln5m0Ry+yXZeHNx2t7EIhHxs2i/P8mLzESaQlOS1kO0ufOeAAQNHIultw3SB/E9naUvATzsFw+v/FBYD6d+EFgPL7b+IoceQJUXwVbk1b0/Ptk3fp/MQm9TUA8HRwfDk33jmURMvqcixKFI3vcPFIA8kpCz8CkQyT408SX0oMMvYn8xCb3HQCzed0/2macnd3GUirlqa/K+c7JvPijoK28jDLp6kNOvvSQFRSEM8ic54vzrU7iggOwBiJUpTtEFJ6MoiICZ+v8kTOOX1uWX03bvoN26vzg/bf9pOMU/bWiphBLIIIdMp6NOp8NBDnPI8eHZdMRyGeaQ8+loMulyXED3lSxQ0aQ/Qsh+LvcUVO7GW0OHneR/beHvj6ftkbd+jH2v3foY+jCVxL0XPgmYLe8G/cOjw+Nur9vqdjvDfmcw7A1b/f5gcHDQ77VAM0crL4YuAixCh90+0OHxnRdGCahpr3XQGrT68O9B6xD+D7/brWngPUGB3nFPypcLA3JJlZ2tBDCkP1qXYzkNMmlvopYEtluXyWibpNE6I3TbskGnbR4B1gK0fiSCoHVz2lYqiLMHlAvn5Sek4+AZAJxJlQCclA7AB5hv0yg+22yCF8lfjXzGH6v+LPynVapoe51u56B7qP8ZUmkQLUeSZ3TnpaDqYKvKrbiPtiHaRrvYJFycxXH0beb/Q0iqHI689efiyQ8l3V3SpkgpvY1N0Oz46ormPcReqAbD6KxRtN5gSx5eNkpYg4qDBB0tYDLLqo1xRKKc1rZUcnBdPTdbLb5RpkaNSKR9bhCJOI7mFDI56KRuJwJsH8L4HpmhJUTy7XKZiPSL3fYS4rcqxGPg/30rpCGvgM3mXiBgNqdRLFHGKBTVnQdbRTa6rCDPVtE3u44rsUyvvRhU0qbd4xRyEWEVdZHOoxRMh4v6ScSpDw06C/wnZlrhrHcoVb5Ye4+zNMqmwt7guDMYdLtHYEZ7/cOeMdWQ19iPYcGDddRuX1GVQxOuovnXz/4iXdlFkfSBmBjDoADtOnoWjGpgMSQxOoGks2QDsvK1jUUgUmaGYjlpA/hiYIt4wn2Uei5+I7DbfKlP6ffJwneIiP3ppsKMB2eOZ3sRR1tHjSMvmH/+wBebQZ+4+gvXL1w9+JLTOFrLSqukegBXVi0NjN3EfpeAyXIJQlQhRlEYAgR8HF4YyWYahZVMLsOF+M6XvxebAFwQnvjJA/+D1/+b6Pbxbx+8cAFepF34JgrvYj9En5kjjtKgoqic3OcRI/DHzQL0zk3HpR0Vya4T/NmpEItHb/7VJqKLzRvsz17w9S4WSxHDbobpJJg8D7H/9CRy49maSj8HNWMbeHRmw2RqCoWe5cWB9Ra3TbIFlPdlMgZtnUXbmBPyJrryn0Xm0TODBdroBeBuXIv4iWnjTQRTIVqyQwkTTIQLL2898dOuwFm9HEtJRfhuPKHiymXlV/HyLYoXSh5KxabchrjLkkuXZGEsWqDyYy8Fvxi8qg44rq4eBxxRBjdu8gx9On4MRoFfaEcN+sv0OlrUCqAYaztSw/QaNpM+tr6W8QcRbGAN9ecSSTtvFG1eQCEz75VSrrwXEV+L9WOmq5T25X4biHiMe8ZU+cR9Yy38rYauyt9CxZwroEq7qF9w50mrPqKS/VZJlWVnsGtnlVOWdVJlWZdQsqiLeOGt10r7DLUES53GsLdVo7c3oM04l2MSiiSbfiYV5kMMQYts2Mkk4r0y6KzIT5iZKl2RjYe2itnZqAUP9FaVNGQf+wksAy8F0Rh9ZV0ewNETWeNo0y4TjD8QqsH4MskXdhdiDN2Gbs1o5QcLEN3uBWku7kS8FhieYDwjE8D4Rybgjl/w7s2AkDQuZCwkj6n/XSxGeRfavvJdEH2rIMO2L1WxHlcrUbRsG10WAPSronqg4m7tv7frDS8AAbgryFmA48v0M2EBAGc/YxumgZ+bMdKHGQPZDRNumZadPNsEnJeoaSnqgd2DmRJfiWcR2NR7kcAah8uKTVNRBzQ1Ni1fN2HLZhNHaRycJZfhZsvMjLPnyF9gheex8L4yC69URMdgVKmKLDcWG25z4dbAfGwL9TAmak51iIPNyCG8cpQQjHZg+YfoBmZPplt7neOjg96ge3x4NOj0j/uHx9SwaHjGqxp+HoBTjWGMnHnBdtjpDI+GB5R3Ac5ZV4HPwD+AmCxh3Tse9IYDvXukrDU6512FVo3E/+ZiN+gThOfMa+FoEdT2P69Bx7Lgb1Y4S+PzKqrxZ4u/wW4J90T29EBBFf0hsqlSjXlDgQXdVgJVTVsDhjEqayk2sdczFmRkcV8OUTCYUqSCQdgBixJIerGq740ZJ5+rPjaeo2gJg5fPGfwIvFfBmmtJyEaRqqjyrpl+wy0bbwXlbg4lAKcI2OpNYUn0jYh/9bOwgTGb7yDyFZMdiqF3f92C5y0tDw68Dqh2s6h8FpvVMIzUNYCBkixwQYYjAtlaNz9wQhrAULprL4397zXsQLwmuGz73wSKW/wmOH7jqHuuYkuPrbuIvQUOMNh4Wz8oQIcdu3uDYWd4fNjvHQ6PD4xBx2Gq5EgBjThSEbLjKltOytUJUjGsXLrPfrqSJkUNLJ0tHxPoFQgx5VC7vnP0OMBS8H2fUx3RwJzsighKujIyFfwVoKoKhaisRboUZBrQXpBiSEBxVGC4v5IO/l0KQQjNwgmpYAJaLiDsFFS09gotN+z5GkC0VhmyyNGHwO6XGvpvNfT/qaHzEsJmRkZrISxjaxO4sakH0aY8zMgFYX8VYoMbKzi0YxzPe7HE2CY0zxGc1gB+HDQdhbFF1HR+h3oht0GF1aV6VJAcoiGdF2oGCQGTBayNDvJXkc5XMwjy2fLOJM1pChT5bA1HWaqxhqugqGh4zHNB41QQfCQ4pz1t3z3Qxuqio5UHh7dKsr2u4YsqkFzRDBBlJGfUDNMjhCOWq5aSSgjMThVKrkThQlMJkBFnhxTF6iIFrgPJFd8BmkCgKgj8ZIUBTwcmi11jNF3abhIVJJtOgiLhQB7giuhnPDC6hkex+V4OR/z89vaqIgiJPhM1y+4YICIN8+yG2keITbC5J+jGogg66AqxVWjf9XVF68ax9w3s8O8qA/spYh3dQtE6GhW4DFf+o59iWCozBW7m2GLUH/MYpOG4YsHxFqIVc30a1qDox0tMgnr0IcrxUitg6TDZ3RKpE/aRcHUBOXDkcBiG3BlOz8ZBxVEqB2KmFh/M5wC7F8PZM8Sc35/cR99kbk6H5HugtZF9kCe7kHnpcCMcEYqRx4VE76J8rhLGysTB0YWs2djB6LVljyZ9lDfKcFrwEc7U4gBWhWwICf9bSITjKTPYO8BatIq3dqlxtIWwVoGItk8rG3QFiWjoPLBHdrLDHOvqWeJ7YXVvrzeB+D6bx/4mbQws+uud0Y3c6c8+jD8kPmXKAZlEWkvuQEmeYm+zcmgJ2P+pH3OeCFBwp293FBDk/t6mzDa4lsvn77p7RqR7tjkXS8hY4QqdLVGL1ZkTGesPUfwPeSApSUYnnG8DOHa3i6jnMNCSRJd5RSk63/BYNc3R57i4gbpLOV1VyyQvLVHFkDx4j4kxGtBmduywM4utET/JczJmXuhJbfSVBXGoMcVBY33zcLqiPXRPaLRLp5ZR3j9UzH1p0mSGnZVgl2XPwUKM49u6DTFpzZVh54BgCl0Lx0nWI9NUsTv0LyxX/NIdohxmLOhIpVMA5FUJkJoJ55rKFBvjvlMynvQ8F3KJgjWeThyUUQ9ZNY4miLmREH3UGXpuGJzql9P1cAUtiafz7LK5x2ByTm6EbGTm07gl0nUVdqJX2WV6prmZWol+bihqA7jRRdZfNVJna1Xjmg0a+kDN6kZkM56kPU16CuGyUU3ARN5m8HJ2obvT5IZI+oQk1bAxXG0VmsDLHmeDMmWns0GRIszQAEtyFZlpVj4XoFbEOhCgxNJJACWp0FrznEVjXUfjqGeBQWqWs8g0EnlCBFc5WG6DUlStlU9tAErmCw1PvjjmgWH3QFC0jo658ThjmnOn6CbcqTQ0ANRMnmYlZDCx6CEzlOyuh40r2/Df7yYzimG6yzyAus0Mouw+sxDDjWYR1J1mAKZbbcwKw7dliip64V47EcTNrsQUyyhscRigdG44t5vBUvebkMtua5U/CGt5ceECdzEuVxAyMEvUNy8wv0WBNoEu/oZ6vTl+dGn7Qzl+xjgR30mucLblzIf7zdczN0sl1/Df2Nf7N/RbjDlAnSHqqhig/1PvJJ9jOsEAjaveimPGBVnpbDg2YQc46K6V0VHNHwLMO/BH6UtpFtXsQfxd8HbGh+qfi49n9+M/d/6L2l7dp+iq7FJLKTpfcuc13+K4TlpQGQqt8j36xPeA+ziQZOn2Pmx62f+AA1Mc/CzuBL/Qkyp+/ZGiUOVUMrg0Zv7DHP1ae8m9JqVKm8xGZezdZ6Ni3FU6RtWLPaJ7G/mzt6lVKntQqKy8Z+/WWIZcVlhQf6Kw8IsobB9iyrlxU5ZYOpl80FMBkNcPCZuChbEyE0wr/afhEv9Q4yPFJ5dwe31KfXOSaW+8Ocltt/eNav4WEOWcoMIP/7kB0TcnGfIUfoiTXI49u9dpZiHewaFgSpccC2q9bP+BUm03wTgxfwXuQb4sMzeWmY4q31w2TitvIuvmMstCJgToG8wMhr3JzOBKN5oZhH2zmQGVbjgzCPamM4P7ETeemWqNm88MnbkBzaDYm9AMDhK7vPKNaAZm3YxmMKUb0gzCypVhMHKpMG9MMyj+5jQDlOxKNyoNRTcBKkJUAdA3Kg0Qd6PSJU35aqMLV7rf5oKBg2retHQBrTt4DBASZxuIl11uLN3A5Nmhd41Aud1176wIS3LprpolANV4sYEXNbClG5puhrIbJ8VNTQYoGdIbm5UYenOTATI3OAmKnISNmqYVuv1SHRQys7HxTW41AWWSakjEy9cZnXLIEDGSo7Nl2QOl4ryps9c1L60xWYdMFaXsQwZR5Bhu3arnzkZkGNpZiQxIdnjNSbOZpVg1eFyyYkN80cH8gV6VPd7lpA4iWtlJnZTLHXpgyOXQA85lHSuDXyT0QNNp/2ihBzIiDx8m15NPZ1d/NmKcZhyiEZye3NUWcAUqeGnyHKxCQ9jMKZ1h5Z4+OSc3QrbczubiBdNVVotWdKeeZ7VdVBW94KVBVXSkWbkL6ByXWolkZIzEnmoLVJwF8gJVHAnyBUiTd+haLOWOffA1kbbsUJNahumL5xp0GvMyul1LWYeHrkbldVXki9UUrYiS1JTkssdqitQkkVXHTHjeODfzPCc2c4kvhjqUF2OSr+oL7VAXFZGeJ9ZqBRVyp4IN4y58K+syqPhS+YXb4pCstnV5CX2Pq3ERcqGrWRkVjSlkY514KY8CapHqkEQSN9S6Acz4cbL28k1gFw52MOaN4Ga9kBUrFrtmpaybw82KWbeJdyu2w/zS92Z3MO26UPPu0GWKC7y1jdJlmtvL4jZvecfET70CvkPzjQvBtY2wLwnXFylfHGZ0Wd3R3cmyqSLkUnFDQdAGk4vGO5SCTXF+x7hhKTTbu5TSmQOFoykH3v1eDayg/vUb4L1YWR3kjpWuFrfPDfihdKV8CZ4diNcEZ2dtuFtsp2qwVVdbeN1iM0WDtdyyQ8pXtg8Hg74R2OAviFswsLz8JXELqUIZ5pV0CyQVEbKOs9ePWvSiebIRTYAyZFYBdFwcL2r+J6NIvGHTOlk/87gAk4OrvtLK2KR/ZZzJeMUTvBOKqe7/cfDJMTrw8nP7wmzt+ON2uyhWrOj/fCiK6DX1xne661grfL4RKW5y7rKQZ68WwrLG1U1nrSrall8bp58JsORo6H8QEeSU/YHi90iG0CsUnyY4vULx8csqeYD+FYo/eN3iH75u8YevW/yj1y3+8esU/1/7sgTnGuk0aj9waXtbma0l5Qf2/tvK/DN7/21l/pm9/7Yy/8zef/Urs3FzhPyA79wVXxrE796RRA54XpnJYdF/byrH7TaFt8rDMfuae8UnvnoOPkzz7Avmu1xniwW8jOIr91WkT1DARQPRK16FR6KYkAYbedvi7fPFK+8IJONVvB0P37OX50LkL00k8Kwpf91C2mXxUjybPpvDxz0zNoSKlUHou/y5Gf21SBxDGFL4aIxcl+FzPpfhMmrhKRPcOYO3dkrp8Cd8WVTEGJu1HspvzWD3yb/IlzXh0IIY+8Y3Td//LwAAAP//AwBQSwMEFAAGAAgAAAAhAPg2uqkiAgAAWwQAABUAAAB2aXNpby9wYWdlcy9wYWdlcy54bWycU8Fu4jAQva+0/5CbTyROSAlBhGoLqhaJlhXQbnsMZpJY68RZ20Dp16/tpAVE28PeMsmbN2/evAyvX0rm7EBIyqsE+S5GDlSEb2iVJ2irsk4fOdej79+Gv9IcpKPRlUxQoVQ98DxJCihT6ZaUCC55plzCS49nGSXg7ajm9ALsB16Z0go1vQNx0c1rqDRvxkWZKulykbcUE062JVRKk+CeJ4ClSquUBa2lZRvIOiWQoFqABLEDNLIqnekkQXqP+7SEhwQZ4R0fOVM53krFy/a1fmOePv6unUDOI4X9kqRMY0y/KcdaDYgnS3+sn03dzF4WAMqZ0QqW6mA6tY5bytixWsGLeq9GwzEw5tw3Kn7TjSr0oAR13TiMwiC8inDkxyH2kXcO/Qk0L5TF+m4c9eMA9/x+L+7ibniKXRab/TzLJKgnC8au7/d9HwfdXhDgMAo+QT9bdOdruHHWGtRS427cjTCO+pFWfBWFOjra/7u7U0ETke51tv63jb7C6lBDs/hnvO8IbBArQfMchDF5AfqcZMwZF/peC8huDs6q8V7nw6ZGN3htx9HxaVXQNVXLKq2bVU8nGxdmnPxZQM10HFuA2fxmPp99hJxsa0ZJqr7CPkwf9f+zpoyqw+VMc9bzLd9yZA++ZvTvFn5UOXsbcRIfg7D236ZEaSNM3s7y1Z5oAfLCbc+e3GTc2MccMaCbBInpxhLYr9o/A5KjfwAAAP//AwBQSwMEFAAGAAgAAAAhAI5QQMrPAAAAhQEAAB0AAAB2aXNpby9fcmVscy9kb2N1bWVudC54bWwucmVsc6SQz2rDMAyH74O9g9F9UdLDGKNOb4NeR/cAxlYTs9gylumft68YGzRjtx0loe/TT9vdJS3mRFUiZwtD14Oh7DnEPFn4OLw9vYCR5nJwC2eycCWB3fj4sH2nxTVdkjkWMUrJYmFurbwiip8pOem4UNbJkWtyTcs6YXH+002Em75/xnrPgHHFNPtgoe7DBszhWtT8i52iryx8bJ3nhKeoARQ69GsonmMOfBaFuDpRs/Dd6PQuwL+Vw/+URfPdCb9Kza3NHymunjfeAAAA//8DAFBLAwQUAAYACAAAACEAj8OZ7LgAAAALAQAAIAAAAHZpc2lvL3BhZ2VzL19yZWxzL3BhZ2VzLnhtbC5yZWxzXM/PCsIwDAbwu+A7lNxdNw8isnY3YVfRByhd7IrrH5oi+vbGm/MYQn5fvn54hUU8sZBPUUHXtCAw2jT56BTcrufdEQRVEyezpIgK3kgw6O2mv+BiKh/R7DMJViIpmGvNJynJzhgMNSlj5M09lWAqj8XJbOzDOJT7tj3I8muAXplinBSUcepAXN+Zk//s4G1JlO61sSnIp+cCjHbtGuU8hyyY4rAq+E5dwy+B1L1cVdAfAAAA//8DAFBLAwQUAAYACAAAACEAJlQd90AEAABgDQAAFQAAAHZpc2lvL3BhZ2VzL3BhZ2UxLnhtbOxXS3PiOBC+T9X8B1f24GQrwS8IkAKmGAwJNcBkYzIze9pSbAFajOSSREj2129L5iGDZyezx63lYiN1f93qx+dW68PLKrWeMReE0bbtVVzbwjRmCaHztr2Ws6uGbX3ovH/Xukdz3GNUYiqFBUpUtO2FlNmN44h4gVdIVFYk5kywmazEbOWw2YzE2HkmAO34ruc7K0Soneve8BNtlmEKuDPGV0iKCuPzLUTI4vUKzAKIe+1wnCIJzooFyYRGuxEZinHbzjgWmD9ju9OKFijDYvu0hiGczLamrxlI6S3bGhGKI/mawkpgWwOSpod/U/wi9/86rR5OU2vStu8J/WZbX1SUmvWg7vl+3Q2qnu/Wbacg9buWcivNRrN67Qau1wjqft0zpb6SRC60WFBpBnXXrTfqVder1asQ78e2PR6b0neYzBdyZ/u6UXODvVKJ+IjFpq/l8tagbWsvfnUrNdNYrn04Q9Wvec0dxs6a0s69Olbv0nmK8wCYqIOUZHn03OPlrSlz+QEL8hces6QMCXI1YBzPaaLN/DKbxa4LdQsuTe/64/7tY/chPH+4/Xju12qXXtO/dC8uTHSV7Y9LUx8H8bF+dNcN++dKdGvscvQ4DoeDwbk28qU7Oj9Tuz2WMn52cVmy6p9dwM+0PGGfn/68QzRJMdSuKqXibk+m391Vxm45Sgi0Qp+ipxTn5y/EE5K3PNRWAV1tmYVkWlZ7qur7CdmW2fEuBAHa8uBzhGPVhaovegvEUSwxh8Z7YBtr+K1tu/C+65sIUpkXRMWv6QK6nxbgEZ0PQy2B6dVjpPYcADqgeQbaADhIy06BdFQIdmlXGSkEW2fmbaK6298m2kOipCjvWZ7PQjKUq1GMtu1QSIYREy9omL9mSYTCp/SRJpinQFray4KZz0Df5TuR5GSJ5YKvT7VCtoYS2kuw9TznowL0CEvIq+bXUwQd3ylHtOToXUEQ/ZlUrbIUv0QxJ5n8l2r7kF4VIj36YXX5/+XqKu24/+tpz9ZHjGGU4U/Xk7PlRBg7DuR4B0OH6s4lFJkiR+BLePxhMlqIha57oFPdZCY3dpMEppq8wdS0JWDc2mw2FT1VXQk95uhpC76HRCgONkaRaP1k6ptb/RfJ0ZDO2InFAUernGRM+QnefCU0YZtTGgjxDK3TnJML5DGkyksgmVOdiHH5Cb/ujed0XxrAW8xWWHKQPf6uTJj6JJ6CT5ga7srWo0XZASYsoigrk/9tTeJlyNH8sKlyOIUc4nTMnvEU4qfcMtNZMuUYE87hw5ajKFd3KCYR5SgFJnsjSmDQ2XdRNPA/+VI9QSnkNvflhyi1t6Bo4OMKUNNIpxVn26xDVWfGuzy8TxdEWDOM5JpjC14ZTV8t9IxIqkYkC64T1q43cGKt4YYgKu/fwYVmi63O8KbO2in4oADqTu6ho+8TMLDoJ1w5HPOi1PkbAAD//wMAUEsDBBQABgAIAAAAIQDn4OSVuwAAAPMAAAARAAAAdmlzaW8vd2luZG93cy54bWxkj7FuwzAMRPcC/QdtnGo5GYLCiJKhHfIHmQWZsghYoiAybj8/gtst45F3j7zz9TevZsMmxMXBYRjBYAk8U1kcPDR+fIK5Xt7fzncqM/+I+VoJi95p1uSgu//0DWlJug86sIiDpFonayUkzF6GTKGxcNQhcLYcIwW0G/Wz9jgejjZ7KmD27NRe0lyx9F3klr3KwG35R3xzeOT+T4eMJ9tw9dqLSKIqO22S6gM6qA0F24ZgL08AAAD//wMAUEsDBBQABgAIAAAAIQCTwjLUzAUAACwbAAAWAAAAZG9jUHJvcHMvdGh1bWJuYWlsLmVtZuRZXUwcVRQ+szstW5Q6VDDEog4obaUIGzWKhoZbNhKi1TSUGKsS3AoV7A9UEGpq4mj0pZqGmLY+yIP6IsH4YKKJiSZdbWI0Me2D1cSoNdWaFJtQfGqbPqzfNzNngSVLoUKx4TTfnp977t+59557mVoishNQ+s0SGYdyIZ1OE1/dLLKvQMR96NFGEUuqVov0ojyqFULu5YnU2iJFqP9uVpl7ny17WyOCBqQKcAE0t94ylpRCdoCIk/oFVWVvCPoOAYMAfeMm4vuhC5BXX25sud6XRSqNyB2QS3zdqw/NYBPy3UYs7StT7o0lRPYkZlPfNpLprwwNxIBHAJglDiwDXIBzIBxAiTH9RxVw1cshcw4Ic5rzfQvwAM63wgRtBPMVuc1EM/3falZk5DKTl5GnzmO8AU2FRNk1ez7fncg34mVilUqnOVbS+PlLR8bP7zPg9WXQOb9tAMdHH9YhMMINPsuSI9DXAiWAtplOQQFVANqOymjfexz2OMC6BDfAOfAglq64cnrl8C0EZTfTDraap+3A3Z9POLaN0EPyMjLbZnxbLJEmgPGtNJffM7PxWYN2HLRtA6SFWreYkUgd2o8DPCtgcoA/oI9GKus0huQk9YGYjhkr2gSB9WlnfCcT1516uP5HAvmSzymLZVmvghUba8pcGfMw7jn3RBt8agGOi5yknDulKDBN+9X1ZT2VMe7MntEKmq84p+z9Ql3rXsmeWYc2uW85hvJQ1rP6PfQU8P/eSxP5D6Gr935c3uDVvtNgm2BeGL6UATGgNOT/NadN2hP1aDKkib4ZS8bUCUvI8gGHQkjN4D04p/T9AwFXO/kg7CRb7FUJScouZKkXpAtSSKNftl2ET+fHx4tPwhT/6bV+6tc9bMYuvBL4UDeF+1upWXKolfrmX6MD5NxHpPUn3nziIvwH33h+B+3vP3XqSerqF/e9kO8Kargl0qs3NGxl+ZZvun84OhQWgr03Eowjduixs+z/k6qgbG3dA6OUzhwM7PHAPO1X/f8cqxsNxl/m+3z34fHiyc55nwX9aH86ftV/Hg7jceqYHx85eqytvd9f+sz5YrxvArg+JcCqUMb0fZ12UKQFPy6M5eA1wNeQm1kAZNPtMGzKMvoBw89B2FukE6vXK65slw6sYp+8iPXsgB5Yu2U33icvQU9KP9AFLYk13+n7bJdueLtoh2N1gBUAniuyPJRvACd0j7FsJYB84E+eOmUnBOvTn/W1LjnPCEHZmSSzLuvQxvhQ15yDtr11oZ2xKQ9lzr8RMt9KMWB6Dpl6d+u5rTTzc2fNpp016MvBGG2AVGGm6nN/j0zNRe7JaKKv9vdFyUXaN9eEa+YASrpPVG+G0IM1ou9i56LS/TPnomRhk3+0llou+hRr8zqwBdiKteoH53plUyEMuXJRD8qYd57z804fJGrt4iIf9fpar1TDh/tF8wLzAfMH9wxtWsZ+mD/INd+QE7TPd37Q/Tybcz1fPgudH0rzUw3VQ/cnbBPEFWG7am8V7Xuu+eEcTh/HqTRoBZIty67KW6XuwMz5YWPBB0s2PzyDpRgGTgNfAFeSHzrxOumTHuSDB/HuqZEB/1818g3fKl14iwRvAZ5xviOZF/gesAHmCn2bME8wF6idvvQjp9985wfdz/N19mfTzkLnhzMDHYnFyg/a97WWH55+e+b8UFJwz5LMDy04c38Bw8DfQK78wHSe6/2wGWV3AQtxv+t+m825my+fhT6/h2XHop1f7ftaO7+lh2c+v8nCTUvy/KZw7s4CPL8v45DmOr83ojzX+e1DWS++RSRxv3dAqpZncZ/vwi2f/VdBcFfzLo8BvOPJeX9HQ5ll/MagdnJi8j1Pn7nkihPw/xa43LcC3duVZvG+FcRMxC7BWPnO0e/QiI1zr4n4Npgzb/ltoZ/m1nbolAn9/4Bs/U4ZQanS1O8Kas3Fy1HAcfGgNIKXAg7AuEbMxN8aXL8igOQAlP8FAAD//wMAUEsDBBQABgAIAAAAIQCL7TVwkgEAADcDAAARAAgBZG9jUHJvcHMvY29yZS54bWwgogQBKKAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACcUsFu2zAMvRfYPxi6O7KTri2MxAW2rqcWKNAUHXZTJdZRa0uCxMz135eWEyXBtssAHUTy8ZHvScvrj67NfoMP2poVK2cFy8BIq7RpVuxpfZtfsSygMEq01sCKDRDYdf3lbCldJa2HB28deNQQMmIyoZJuxTaIruI8yA10IswIYaj4an0nkELfcCfku2iAz4vigneAQgkUfCTMXWJkO0olE6Xb+jYSKMmhhQ4MBl7OSn7AIvgu/LUhVo6QncbBkabdusfcSk7FhP4IOgH7vp/1i7gG7V/yn/d3j1Fqrs3olQRWL5WsUGML9ZIfrnQL25c3kDilU0AF6UGg9fV6Y8m02LVPjWa/w9BbrwI1nkTUqSBIrx3SE060JwlCtyLgPb3pqwb1bUgT/qyMg0bwg9cGQdXzYn6eF5d58XVdltWCzsWvOP8YRFKjs5MCUBl5VU3O7ivPi+8361v2D749KsqlqYmw2+3834x7gjp+V4HQWD9MDsoUkYOtMM2W/mMNJr/5Eb1Pqaj39KvXnwAAAP//AwBQSwMEFAAGAAgAAAAhAE0Y0YfgAQAApAQAABAACAFkb2NQcm9wcy9hcHAueG1sIKIEASigAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtFRNb9swDL0P2H8wfI/lFEUwBLKLLcWQw4oFqJu7atO2MFsSRM1p9utH2Yk/2g4YBswniqSfHh9J8buXtgk6sCi1SsJ1FIcBqFwXUlVJ+JR9XX0KA3RCFaLRCpLwDBjepR8/8IPVBqyTgAFBKEzC2jmzZQzzGlqBEYUVRUptW+HoaCumy1LmcK/zny0ox27ieMPgxYEqoFiZETAcELed+1fQQueeHx6zsyHCKc+gNY1wkHI2mZ+NaWQuHJWePsjcatSlC46StOBsHuSPuWhgR4hpKRoEziYH34Pwah2EtJjyzm07yJ22AcpfpNdNGDwLBM8jCTthpVCO+Pi04dDbjUFn04OoADmj2HDuzXna3Ja36bpPIGOZ6AEGDhRYssukawC/lwdh3Ttk13OyPYeB6kRvNdw559dX63VdYj8IReVYCozWTrdGqDO5RuubVD/wyWT63jfnIu7SyR9rYaGgqbnGJwffk662IZAvJLIvd3ne91Bvu7KZF/rHrpCy8fsSv2rff0m8/aurG3Pyo+N3D2n5TqdT1PkBXmEtaPSjXLfMQiXRge0BLz8sR+ZVPfOcuT3O33LELiKP2uOuFqqC4tqvtwFO23UcHp10vYli+vqNu/o4m56X9DcAAAD//wMAUEsDBBQABgAIAAAAIQAXyJ/obAEAAG4DAAATAAgBZG9jUHJvcHMvY3VzdG9tLnhtbCCiBAEooAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALyTwWuDMBTG74P9D5K7NVq1tajFqoXCVsrmetilWI1twCSSxG5l7H9fqmvpYaetDHLIey98v++DF3/6TmrtgLjAjAbAHECgIVqwEtNdAF6yuT4GmpA5LfOaURSAIxJgGt7f+SvOGsQlRkJTElQEYC9lMzEMUewRycVAjamaVIyTXKqS7wxWVbhACStagqg0LAhdo2iFZERvLnKg15sc5G8lS1ac3Il1dmyU3dD/Fj9qFZG4DMBH4sRJ4kBHt1Iv1k1oznRv6I10OIbQmlnx3IvST6A1p8cW0GhOVPTNerVINtFDlj4toyxdRo/psxI/yEndvAnJQ9+4vp+hf8QPz/hZi+ty2ZIt4jFHuURlD8d2aMKRbTrWyHU7C6rjGzfC2z/g0xL/E9050xfiEUmOiz7ylrE6lLxFXdyuullg94zMMEHXSStcI6l6oQUtW4dqWZzMNCdDddzXzsjlxbUZ47SK/UcJvwAAAP//AwBQSwECLQAUAAYACAAAACEAJm65Z1kBAAA/BAAAEwAAAAAAAAAAAAAAAAAAAAAAW0NvbnRlbnRfVHlwZXNdLnhtbFBLAQItABQABgAIAAAAIQCnWMK1JQEAAF4DAAALAAAAAAAAAAAAAAAAAJIDAABfcmVscy8ucmVsc1BLAQItABQABgAIAAAAIQBU4gwe+hIAAAx1AAASAAAAAAAAAAAAAAAAAOgGAAB2aXNpby9kb2N1bWVudC54bWxQSwECLQAUAAYACAAAACEA+Da6qSICAABbBAAAFQAAAAAAAAAAAAAAAAASGgAAdmlzaW8vcGFnZXMvcGFnZXMueG1sUEsBAi0AFAAGAAgAAAAhAI5QQMrPAAAAhQEAAB0AAAAAAAAAAAAAAAAAZxwAAHZpc2lvL19yZWxzL2RvY3VtZW50LnhtbC5yZWxzUEsBAi0AFAAGAAgAAAAhAI/Dmey4AAAACwEAACAAAAAAAAAAAAAAAAAAcR0AAHZpc2lvL3BhZ2VzL19yZWxzL3BhZ2VzLnhtbC5yZWxzUEsBAi0AFAAGAAgAAAAhACZUHfdABAAAYA0AABUAAAAAAAAAAAAAAAAAZx4AAHZpc2lvL3BhZ2VzL3BhZ2UxLnhtbFBLAQItABQABgAIAAAAIQDn4OSVuwAAAPMAAAARAAAAAAAAAAAAAAAAANoiAAB2aXNpby93aW5kb3dzLnhtbFBLAQItABQABgAIAAAAIQCTwjLUzAUAACwbAAAWAAAAAAAAAAAAAAAAAMQjAABkb2NQcm9wcy90aHVtYm5haWwuZW1mUEsBAi0AFAAGAAgAAAAhAIvtNXCSAQAANwMAABEAAAAAAAAAAAAAAAAAxCkAAGRvY1Byb3BzL2NvcmUueG1sUEsBAi0AFAAGAAgAAAAhAE0Y0YfgAQAApAQAABAAAAAAAAAAAAAAAAAAjSwAAGRvY1Byb3BzL2FwcC54bWxQSwECLQAUAAYACAAAACEAF8if6GwBAABuAwAAEwAAAAAAAAAAAAAAAACjLwAAZG9jUHJvcHMvY3VzdG9tLnhtbFBLBQYAAAAADAAMABoDAABIMgAAAAA=","Object Descriptor":"pgAAABUaAgAAAAAAwAAAAAAAAEYBAAAAKicAAKITAAAAAAAAAAAAACAAAAA0AAAAZAAAAE0AaQBjAHIAbwBzAG8AZgB0ACAAVgBpAHMAaQBvACAARAByAGEAdwBpAG4AZwAAAEQAcgBhAHcAaQBuAGcAMQBcAEQAcgBhAHcAaQBuAGcAXAB+AFAAYQBnAGUALQAxAFwAUwBoAGUAZQB0AC4AMQAAAA=="}'
 noaccess_shape = r'{"Visio 15.0 Shapes":"UEsDBBQABgAIAAAAIQAmbrlnWQEAAD8EAAATAAgCW0NvbnRlbnRfVHlwZXNdLnhtbCCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACkU8luwyAQvVfqPyCulU3SQ1VVcXLocmxzSD8AwThBNYsYsv19Bye1mihLrV6QYHjLDI/RZGMbtoKIxruKD8sBZ+CU18bNK/45eyseOcMknZaNd1DxLSCfjG9vRrNtAGSEdljxRUrhSQhUC7ASSx/AUaX20cpE2zgXQaovOQdxPxg8COVdApeKlDn4ePQCtVw2ib1u6HjnBGzN2fPuXpaquLEZvylyRZzERGjwCCRDaIySiboTK6ePnBV7VyUh2zu4MAHvyPoZhVw5dPVbYI/7oHFGo4FNZUzv0pJ3sTLUltBeLS01Xl7myUYtFi2m1FGu6TFKK437cXZeIdCMkIZNax+RFtCHfdiX/To5dan9upftPeQSN418Gn1AylyEP5g+jG4XkIwuAhFBTAa6iJx6iE6RotFf0Ne1UdAFBfKP0KD7aqslJm//Lb+jOSEu2u8//gYAAP//AwBQSwMEFAAGAAgAAAAhAKdYwrUlAQAAXgMAAAsACAJfcmVscy8ucmVscyCiBAIooAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsk8tOwzAQRfdI/IPlfeOkPIRQk24QUncIhQ8Y7EliET9kT6r277EKBSIlZdEuPR7fe2auvFrvTM+2GKJ2tuRFlnOGVjqlbVvyt/p58cBZJLAKemex5HuMfF1dX61esQdKj2KnfWRJxcaSd0T+UYgoOzQQM+fRppvGBQOUjqEVHuQHtCiWeX4vwl8NXo002UaVPGzUDWf13ifnc7SFQQIFBEK6gAsfElkgnWZhNYQWqeTKyZdUjoeOLFFzMQ20vCwQdYN5t6D7CZSfuwxNM8dTzPAYLYOLrqFMOiO2OiWctl7k462LNPdg0NKv/VfrsX5qFXcz1hO5u6bREp++zSbiF3KI5Mw/2Rx6TiHdXhIJd4RWoToNBd4ficToV1SfAAAA//8DAFBLAwQUAAYACAAAACEAVOIMHvoSAAAMdQAAEgAAAHZpc2lvL2RvY3VtZW50LnhtbOxdW3fjOI5+33P2P/icefDsQyW+xHHSJ6k5iS+pbOc2cerS+6bYdKwpWfJIcqoyv34BUhJBEZTkntmqzmy6TneXhY8gSIIgCILSyV++r4PWs4gTPwpP2929Trslwnm08MOn0/Y2Xb47arf+8v4//+Pkkw+QcTTfrkWYtqBUmJy2V2m6+WV/P5mvxNpL9tb+PI6SaJnuzaP1frRc+nOx/4wF93udbm9/7flhW5X9JbZKRxsRAt9lFK+9NNmL4qeMRV4rMOkc7sci8FKQNln5m0Ry+yXZeHNx2t7EIhHxs2i/P8mLzESaQlOS1kO0ufOeAAQNHIultw3SB/E9naUvATzsFw+v/FBYD6d+EFgPL7b+IoceQJUXwVbk1b0/Ptk3fp/MQm9TUA8HRwfDk33jmURMvqcixKFI3vcPFIA8kpCz8CkQyT408SX0oMMvYn8xCb3HQCzed0/2macnd3GUirlqa/K+c7JvPijoK28jDLp6kNOvvSQFRSEM8ic54vzrU7iggOwBiJUpTtEFJ6MoiICZ+v8kTOOX1uWX03bvoN26vzg/bf9pOMU/bWiphBLIIIdMp6NOp8NBDnPI8eHZdMRyGeaQ8+loMulyXED3lSxQ0aQ/Qsh+LvcUVO7GW0OHneR/beHvj6ftkbd+jH2v3foY+jCVxL0XPgmYLe8G/cOjw+Nur9vqdjvDfmcw7A1b/f5gcHDQ77VAM0crL4YuAixCh90+0OHxnRdGCahpr3XQGrT68O9B6xD+D7/brWngPUGB3nFPypcLA3JJlZ2tBDCkP1qXYzkNMmlvopYEtluXyWibpNE6I3TbskGnbR4B1gK0fiSCoHVz2lYqiLMHlAvn5Sek4+AZAJxJlQCclA7AB5hv0yg+22yCF8lfjXzGH6v+LPynVapoe51u56B7qP8ZUmkQLUeSZ3TnpaDqYKvKrbiPtiHaRrvYJFycxXH0beb/Q0iqHI689efiyQ8l3V3SpkgpvY1N0Oz46ormPcReqAbD6KxRtN5gSx5eNkpYg4qDBB0tYDLLqo1xRKKc1rZUcnBdPTdbLb5RpkaNSKR9bhCJOI7mFDI56KRuJwJsH8L4HpmhJUTy7XKZiPSL3fYS4rcqxGPg/30rpCGvgM3mXiBgNqdRLFHGKBTVnQdbRTa6rCDPVtE3u44rsUyvvRhU0qbd4xRyEWEVdZHOoxRMh4v6ScSpDw06C/wnZlrhrHcoVb5Ye4+zNMqmwt7guDMYdLtHYEZ7/cOeMdWQ19iPYcGDddRuX1GVQxOuovnXz/4iXdlFkfSBmBjDoADtOnoWjGpgMSQxOoGks2QDsvK1jUUgUmaGYjlpA/hiYIt4wn2Uei5+I7DbfKlP6ffJwneIiP3ppsKMB2eOZ3sRR1tHjSMvmH/+wBebQZ+4+gvXL1w9+JLTOFrLSqukegBXVi0NjN3EfpeAyXIJQlQhRlEYAgR8HF4YyWYahZVMLsOF+M6XvxebAFwQnvjJA/+D1/+b6Pbxbx+8cAFepF34JgrvYj9En5kjjtKgoqic3OcRI/DHzQL0zk3HpR0Vya4T/NmpEItHb/7VJqKLzRvsz17w9S4WSxHDbobpJJg8D7H/9CRy49maSj8HNWMbeHRmw2RqCoWe5cWB9Ra3TbIFlPdlMgZtnUXbmBPyJrryn0Xm0TODBdroBeBuXIv4iWnjTQRTIVqyQwkTTIQLL2898dOuwFm9HEtJRfhuPKHiymXlV/HyLYoXSh5KxabchrjLkkuXZGEsWqDyYy8Fvxi8qg44rq4eBxxRBjdu8gx9On4MRoFfaEcN+sv0OlrUCqAYaztSw/QaNpM+tr6W8QcRbGAN9ecSSTtvFG1eQCEz75VSrrwXEV+L9WOmq5T25X4biHiMe8ZU+cR9Yy38rYauyt9CxZwroEq7qF9w50mrPqKS/VZJlWVnsGtnlVOWdVJlWZdQsqiLeOGt10r7DLUES53GsLdVo7c3oM04l2MSiiSbfiYV5kMMQYts2Mkk4r0y6KzIT5iZKl2RjYe2itnZqAUP9FaVNGQf+wksAy8F0Rh9ZV0ewNETWeNo0y4TjD8QqsH4MskXdhdiDN2Gbs1o5QcLEN3uBWku7kS8FhieYDwjE8D4Rybgjl/w7s2AkDQuZCwkj6n/XSxGeRfavvJdEH2rIMO2L1WxHlcrUbRsG10WAPSronqg4m7tv7frDS8AAbgryFmA48v0M2EBAGc/YxumgZ+bMdKHGQPZDRNumZadPNsEnJeoaSnqgd2DmRJfiWcR2NR7kcAah8uKTVNRBzQ1Ni1fN2HLZhNHaRycJZfhZsvMjLPnyF9gheex8L4yC69URMdgVKmKLDcWG25z4dbAfGwL9TAmak51iIPNyCG8cpQQjHZg+YfoBmZPplt7neOjg96ge3x4NOj0j/uHx9SwaHjGqxp+HoBTjWGMnHnBdtjpDI+GB5R3Ac5ZV4HPwD+AmCxh3Tse9IYDvXukrDU6512FVo3E/+ZiN+gThOfMa+FoEdT2P69Bx7Lgb1Y4S+PzKqrxZ4u/wW4J90T29EBBFf0hsqlSjXlDgQXdVgJVTVsDhjEqayk2sdczFmRkcV8OUTCYUqSCQdgBixJIerGq740ZJ5+rPjaeo2gJg5fPGfwIvFfBmmtJyEaRqqjyrpl+wy0bbwXlbg4lAKcI2OpNYUn0jYh/9bOwgTGb7yDyFZMdiqF3f92C5y0tDw68Dqh2s6h8FpvVMIzUNYCBkixwQYYjAtlaNz9wQhrAULprL4397zXsQLwmuGz73wSKW/wmOH7jqHuuYkuPrbuIvQUOMNh4Wz8oQIcdu3uDYWd4fNjvHQ6PD4xBx2Gq5EgBjThSEbLjKltOytUJUjGsXLrPfrqSJkUNLJ0tHxPoFQgx5VC7vnP0OMBS8H2fUx3RwJzsighKujIyFfwVoKoKhaisRboUZBrQXpBiSEBxVGC4v5IO/l0KQQjNwgmpYAJaLiDsFFS09gotN+z5GkC0VhmyyNGHwO6XGvpvNfT/qaHzEsJmRkZrISxjaxO4sakH0aY8zMgFYX8VYoMbKzi0YxzPe7HE2CY0zxGc1gB+HDQdhbFF1HR+h3oht0GF1aV6VJAcoiGdF2oGCQGTBayNDvJXkc5XMwjy2fLOJM1pChT5bA1HWaqxhqugqGh4zHNB41QQfCQ4pz1t3z3Qxuqio5UHh7dKsr2u4YsqkFzRDBBlJGfUDNMjhCOWq5aSSgjMThVKrkThQlMJkBFnhxTF6iIFrgPJFd8BmkCgKgj8ZIUBTwcmi11jNF3abhIVJJtOgiLhQB7giuhnPDC6hkex+V4OR/z89vaqIgiJPhM1y+4YICIN8+yG2keITbC5J+jGogg66AqxVWjf9XVF68ax9w3s8O8qA/spYh3dQtE6GhW4DFf+o59iWCozBW7m2GLUH/MYpOG4YsHxFqIVc30a1qDox0tMgnr0IcrxUitg6TDZ3RKpE/aRcHUBOXDkcBiG3BlOz8ZBxVEqB2KmFh/M5wC7F8PZM8Sc35/cR99kbk6H5HugtZF9kCe7kHnpcCMcEYqRx4VE76J8rhLGysTB0YWs2djB6LVljyZ9lDfKcFrwEc7U4gBWhWwICf9bSITjKTPYO8BatIq3dqlxtIWwVoGItk8rG3QFiWjoPLBHdrLDHOvqWeJ7YXVvrzeB+D6bx/4mbQws+uud0Y3c6c8+jD8kPmXKAZlEWkvuQEmeYm+zcmgJ2P+pH3OeCFBwp293FBDk/t6mzDa4lsvn77p7RqR7tjkXS8hY4QqdLVGL1ZkTGesPUfwPeSApSUYnnG8DOHa3i6jnMNCSRJd5RSk63/BYNc3R57i4gbpLOV1VyyQvLVHFkDx4j4kxGtBmduywM4utET/JczJmXuhJbfSVBXGoMcVBY33zcLqiPXRPaLRLp5ZR3j9UzH1p0mSGnZVgl2XPwUKM49u6DTFpzZVh54BgCl0Lx0nWI9NUsTv0LyxX/NIdohxmLOhIpVMA5FUJkJoJ55rKFBvjvlMynvQ8F3KJgjWeThyUUQ9ZNY4miLmREH3UGXpuGJzql9P1cAUtiafz7LK5x2ByTm6EbGTm07gl0nUVdqJX2WV6prmZWol+bihqA7jRRdZfNVJna1Xjmg0a+kDN6kZkM56kPU16CuGyUU3ARN5m8HJ2obvT5IZI+oQk1bAxXG0VmsDLHmeDMmWns0GRIszQAEtyFZlpVj4XoFbEOhCgxNJJACWp0FrznEVjXUfjqGeBQWqWs8g0EnlCBFc5WG6DUlStlU9tAErmCw1PvjjmgWH3QFC0jo658ThjmnOn6CbcqTQ0ANRMnmYlZDCx6CEzlOyuh40r2/Df7yYzimG6yzyAus0Mouw+sxDDjWYR1J1mAKZbbcwKw7dliip64V47EcTNrsQUyyhscRigdG44t5vBUvebkMtua5U/CGt5ceECdzEuVxAyMEvUNy8wv0WBNoEu/oZ6vTl+dGn7Qzl+xjgR30mucLblzIf7zdczN0sl1/Df2Nf7N/RbjDlAnSHqqhig/1PvJJ9jOsEAjaveimPGBVnpbDg2YQc46K6V0VHNHwLMO/BH6UtpFtXsQfxd8HbGh+qfi49n9+M/d/6L2l7dp+iq7FJLKTpfcuc13+K4TlpQGQqt8j36xPeA+ziQZOn2Pmx62f+AA1Mc/CzuBL/Qkyp+/ZGiUOVUMrg0Zv7DHP1ae8m9JqVKm8xGZezdZ6Ni3FU6RtWLPaJ7G/mzt6lVKntQqKy8Z+/WWIZcVlhQf6Kw8IsobB9iyrlxU5ZYOpl80FMBkNcPCZuChbEyE0wr/afhEv9Q4yPFJ5dwe31KfXOSaW+8Ocltt/eNav4WEOWcoMIP/7kB0TcnGfIUfoiTXI49u9dpZiHewaFgSpccC2q9bP+BUm03wTgxfwXuQb4sMzeWmY4q31w2TitvIuvmMstCJgToG8wMhr3JzOBKN5oZhH2zmQGVbjgzCPamM4P7ETeemWqNm88MnbkBzaDYm9AMDhK7vPKNaAZm3YxmMKUb0gzCypVhMHKpMG9MMyj+5jQDlOxKNyoNRTcBKkJUAdA3Kg0Qd6PSJU35aqMLV7rf5oKBg2retHQBrTt4DBASZxuIl11uLN3A5Nmhd41Aud1176wIS3LprpolANV4sYEXNbClG5puhrIbJ8VNTQYoGdIbm5UYenOTATI3OAmKnISNmqYVuv1SHRQys7HxTW41AWWSakjEy9cZnXLIEDGSo7Nl2QOl4ryps9c1L60xWYdMFaXsQwZR5Bhu3arnzkZkGNpZiQxIdnjNSbOZpVg1eFyyYkN80cH8gV6VPd7lpA4iWtlJnZTLHXpgyOXQA85lHSuDXyT0QNNp/2ihBzIiDx8m15NPZ1d/NmKcZhyiEZye3NUWcAUqeGnyHKxCQ9jMKZ1h5Z4+OSc3QrbczubiBdNVVotWdKeeZ7VdVBW94KVBVXSkWbkL6ByXWolkZIzEnmoLVJwF8gJVHAnyBUiTd+haLOWOffA1kbbsUJNahumL5xp0GvMyul1LWYeHrkbldVXki9UUrYiS1JTkssdqitQkkVXHTHjeODfzPCc2c4kvhjqUF2OSr+oL7VAXFZGeJ9ZqBRVyp4IN4y58K+syqPhS+YXb4pCstnV5CX2Pq3ERcqGrWRkVjSlkY514KY8CapHqkEQSN9S6Acz4cbL28k1gFw52MOaN4Ga9kBUrFrtmpaybw82KWbeJdyu2w/zS92Z3MO26UPPu0GWKC7y1jdJlmtvL4jZvecfET70CvkPzjQvBtY2wLwnXFylfHGZ0Wd3R3cmyqSLkUnFDQdAGk4vGO5SCTXF+x7hhKTTbu5TSmQOFoykH3v1eDayg/vUb4L1YWR3kjpWuFrfPDfihdKV8CZ4diNcEZ2dtuFtsp2qwVVdbeN1iM0WDtdyyQ8pXtg8Hg74R2OAviFswsLz8JXELqUIZ5pV0CyQVEbKOs9ePWvSiebIRTYAyZFYBdFwcL2r+J6NIvGHTOlk/87gAk4OrvtLK2KR/ZZzJeMUTvBOKqe7/cfDJMTrw8nP7wmzt+ON2uyhWrOj/fCiK6DX1xne661grfL4RKW5y7rKQZ68WwrLG1U1nrSrall8bp58JsORo6H8QEeSU/YHi90iG0CsUnyY4vULx8csqeYD+FYo/eN3iH75u8YevW/yj1y3+8esU/1/7sgTnGuk0aj9waXtbma0l5Qf2/tvK/DN7/21l/pm9/7Yy/8zef/Urs3FzhPyA79wVXxrE796RRA54XpnJYdF/byrH7TaFt8rDMfuae8UnvnoOPkzz7Avmu1xniwW8jOIr91WkT1DARQPRK16FR6KYkAYbedvi7fPFK+8IJONVvB0P37OX50LkL00k8Kwpf91C2mXxUjybPpvDxz0zNoSKlUHou/y5Gf21SBxDGFL4aIxcl+FzPpfhMmrhKRPcOYO3dkrp8Cd8WVTEGJu1HspvzWD3yb/IlzXh0IIY+8Y3Td//LwAAAP//AwBQSwMEFAAGAAgAAAAhAPg2uqkiAgAAWwQAABUAAAB2aXNpby9wYWdlcy9wYWdlcy54bWycU8Fu4jAQva+0/5CbTyROSAlBhGoLqhaJlhXQbnsMZpJY68RZ20Dp16/tpAVE28PeMsmbN2/evAyvX0rm7EBIyqsE+S5GDlSEb2iVJ2irsk4fOdej79+Gv9IcpKPRlUxQoVQ98DxJCihT6ZaUCC55plzCS49nGSXg7ajm9ALsB16Z0go1vQNx0c1rqDRvxkWZKulykbcUE062JVRKk+CeJ4ClSquUBa2lZRvIOiWQoFqABLEDNLIqnekkQXqP+7SEhwQZ4R0fOVM53krFy/a1fmOePv6unUDOI4X9kqRMY0y/KcdaDYgnS3+sn03dzF4WAMqZ0QqW6mA6tY5bytixWsGLeq9GwzEw5tw3Kn7TjSr0oAR13TiMwiC8inDkxyH2kXcO/Qk0L5TF+m4c9eMA9/x+L+7ibniKXRab/TzLJKgnC8au7/d9HwfdXhDgMAo+QT9bdOdruHHWGtRS427cjTCO+pFWfBWFOjra/7u7U0ETke51tv63jb7C6lBDs/hnvO8IbBArQfMchDF5AfqcZMwZF/peC8huDs6q8V7nw6ZGN3htx9HxaVXQNVXLKq2bVU8nGxdmnPxZQM10HFuA2fxmPp99hJxsa0ZJqr7CPkwf9f+zpoyqw+VMc9bzLd9yZA++ZvTvFn5UOXsbcRIfg7D236ZEaSNM3s7y1Z5oAfLCbc+e3GTc2MccMaCbBInpxhLYr9o/A5KjfwAAAP//AwBQSwMEFAAGAAgAAAAhAI5QQMrPAAAAhQEAAB0AAAB2aXNpby9fcmVscy9kb2N1bWVudC54bWwucmVsc6SQz2rDMAyH74O9g9F9UdLDGKNOb4NeR/cAxlYTs9gylumft68YGzRjtx0loe/TT9vdJS3mRFUiZwtD14Oh7DnEPFn4OLw9vYCR5nJwC2eycCWB3fj4sH2nxTVdkjkWMUrJYmFurbwiip8pOem4UNbJkWtyTcs6YXH+002Em75/xnrPgHHFNPtgoe7DBszhWtT8i52iryx8bJ3nhKeoARQ69GsonmMOfBaFuDpRs/Dd6PQuwL+Vw/+URfPdCb9Kza3NHymunjfeAAAA//8DAFBLAwQUAAYACAAAACEAj8OZ7LgAAAALAQAAIAAAAHZpc2lvL3BhZ2VzL19yZWxzL3BhZ2VzLnhtbC5yZWxzXM/PCsIwDAbwu+A7lNxdNw8isnY3YVfRByhd7IrrH5oi+vbGm/MYQn5fvn54hUU8sZBPUUHXtCAw2jT56BTcrufdEQRVEyezpIgK3kgw6O2mv+BiKh/R7DMJViIpmGvNJynJzhgMNSlj5M09lWAqj8XJbOzDOJT7tj3I8muAXplinBSUcepAXN+Zk//s4G1JlO61sSnIp+cCjHbtGuU8hyyY4rAq+E5dwy+B1L1cVdAfAAAA//8DAFBLAwQUAAYACAAAACEAJlQd90AEAABgDQAAFQAAAHZpc2lvL3BhZ2VzL3BhZ2UxLnhtbOxXS3PiOBC+T9X8B1f24GQrwS8IkAKmGAwJNcBkYzIze9pSbAFajOSSREj2129L5iGDZyezx63lYiN1f93qx+dW68PLKrWeMReE0bbtVVzbwjRmCaHztr2Ws6uGbX3ovH/Xukdz3GNUYiqFBUpUtO2FlNmN44h4gVdIVFYk5kywmazEbOWw2YzE2HkmAO34ruc7K0Soneve8BNtlmEKuDPGV0iKCuPzLUTI4vUKzAKIe+1wnCIJzooFyYRGuxEZinHbzjgWmD9ju9OKFijDYvu0hiGczLamrxlI6S3bGhGKI/mawkpgWwOSpod/U/wi9/86rR5OU2vStu8J/WZbX1SUmvWg7vl+3Q2qnu/Wbacg9buWcivNRrN67Qau1wjqft0zpb6SRC60WFBpBnXXrTfqVder1asQ78e2PR6b0neYzBdyZ/u6UXODvVKJ+IjFpq/l8tagbWsvfnUrNdNYrn04Q9Wvec0dxs6a0s69Olbv0nmK8wCYqIOUZHn03OPlrSlz+QEL8hces6QMCXI1YBzPaaLN/DKbxa4LdQsuTe/64/7tY/chPH+4/Xju12qXXtO/dC8uTHSV7Y9LUx8H8bF+dNcN++dKdGvscvQ4DoeDwbk28qU7Oj9Tuz2WMn52cVmy6p9dwM+0PGGfn/68QzRJMdSuKqXibk+m391Vxm45Sgi0Qp+ipxTn5y/EE5K3PNRWAV1tmYVkWlZ7qur7CdmW2fEuBAHa8uBzhGPVhaovegvEUSwxh8Z7YBtr+K1tu/C+65sIUpkXRMWv6QK6nxbgEZ0PQy2B6dVjpPYcADqgeQbaADhIy06BdFQIdmlXGSkEW2fmbaK6298m2kOipCjvWZ7PQjKUq1GMtu1QSIYREy9omL9mSYTCp/SRJpinQFray4KZz0Df5TuR5GSJ5YKvT7VCtoYS2kuw9TznowL0CEvIq+bXUwQd3ylHtOToXUEQ/ZlUrbIUv0QxJ5n8l2r7kF4VIj36YXX5/+XqKu24/+tpz9ZHjGGU4U/Xk7PlRBg7DuR4B0OH6s4lFJkiR+BLePxhMlqIha57oFPdZCY3dpMEppq8wdS0JWDc2mw2FT1VXQk95uhpC76HRCgONkaRaP1k6ptb/RfJ0ZDO2InFAUernGRM+QnefCU0YZtTGgjxDK3TnJML5DGkyksgmVOdiHH5Cb/ujed0XxrAW8xWWHKQPf6uTJj6JJ6CT5ga7srWo0XZASYsoigrk/9tTeJlyNH8sKlyOIUc4nTMnvEU4qfcMtNZMuUYE87hw5ajKFd3KCYR5SgFJnsjSmDQ2XdRNPA/+VI9QSnkNvflhyi1t6Bo4OMKUNNIpxVn26xDVWfGuzy8TxdEWDOM5JpjC14ZTV8t9IxIqkYkC64T1q43cGKt4YYgKu/fwYVmi63O8KbO2in4oADqTu6ho+8TMLDoJ1w5HPOi1PkbAAD//wMAUEsDBBQABgAIAAAAIQDn4OSVuwAAAPMAAAARAAAAdmlzaW8vd2luZG93cy54bWxkj7FuwzAMRPcC/QdtnGo5GYLCiJKhHfIHmQWZsghYoiAybj8/gtst45F3j7zz9TevZsMmxMXBYRjBYAk8U1kcPDR+fIK5Xt7fzncqM/+I+VoJi95p1uSgu//0DWlJug86sIiDpFonayUkzF6GTKGxcNQhcLYcIwW0G/Wz9jgejjZ7KmD27NRe0lyx9F3klr3KwG35R3xzeOT+T4eMJ9tw9dqLSKIqO22S6gM6qA0F24ZgL08AAAD//wMAUEsDBBQABgAIAAAAIQCTwjLUzAUAACwbAAAWAAAAZG9jUHJvcHMvdGh1bWJuYWlsLmVtZuRZXUwcVRQ+szstW5Q6VDDEog4obaUIGzWKhoZbNhKi1TSUGKsS3AoV7A9UEGpq4mj0pZqGmLY+yIP6IsH4YKKJiSZdbWI0Me2D1cSoNdWaFJtQfGqbPqzfNzNngSVLoUKx4TTfnp977t+59557mVoishNQ+s0SGYdyIZ1OE1/dLLKvQMR96NFGEUuqVov0ojyqFULu5YnU2iJFqP9uVpl7ny17WyOCBqQKcAE0t94ylpRCdoCIk/oFVWVvCPoOAYMAfeMm4vuhC5BXX25sud6XRSqNyB2QS3zdqw/NYBPy3UYs7StT7o0lRPYkZlPfNpLprwwNxIBHAJglDiwDXIBzIBxAiTH9RxVw1cshcw4Ic5rzfQvwAM63wgRtBPMVuc1EM/3falZk5DKTl5GnzmO8AU2FRNk1ez7fncg34mVilUqnOVbS+PlLR8bP7zPg9WXQOb9tAMdHH9YhMMINPsuSI9DXAiWAtplOQQFVANqOymjfexz2OMC6BDfAOfAglq64cnrl8C0EZTfTDraap+3A3Z9POLaN0EPyMjLbZnxbLJEmgPGtNJffM7PxWYN2HLRtA6SFWreYkUgd2o8DPCtgcoA/oI9GKus0huQk9YGYjhkr2gSB9WlnfCcT1516uP5HAvmSzymLZVmvghUba8pcGfMw7jn3RBt8agGOi5yknDulKDBN+9X1ZT2VMe7MntEKmq84p+z9Ql3rXsmeWYc2uW85hvJQ1rP6PfQU8P/eSxP5D6Gr935c3uDVvtNgm2BeGL6UATGgNOT/NadN2hP1aDKkib4ZS8bUCUvI8gGHQkjN4D04p/T9AwFXO/kg7CRb7FUJScouZKkXpAtSSKNftl2ET+fHx4tPwhT/6bV+6tc9bMYuvBL4UDeF+1upWXKolfrmX6MD5NxHpPUn3nziIvwH33h+B+3vP3XqSerqF/e9kO8Kargl0qs3NGxl+ZZvun84OhQWgr03Eowjduixs+z/k6qgbG3dA6OUzhwM7PHAPO1X/f8cqxsNxl/m+3z34fHiyc55nwX9aH86ftV/Hg7jceqYHx85eqytvd9f+sz5YrxvArg+JcCqUMb0fZ12UKQFPy6M5eA1wNeQm1kAZNPtMGzKMvoBw89B2FukE6vXK65slw6sYp+8iPXsgB5Yu2U33icvQU9KP9AFLYk13+n7bJdueLtoh2N1gBUAniuyPJRvACd0j7FsJYB84E+eOmUnBOvTn/W1LjnPCEHZmSSzLuvQxvhQ15yDtr11oZ2xKQ9lzr8RMt9KMWB6Dpl6d+u5rTTzc2fNpp016MvBGG2AVGGm6nN/j0zNRe7JaKKv9vdFyUXaN9eEa+YASrpPVG+G0IM1ou9i56LS/TPnomRhk3+0llou+hRr8zqwBdiKteoH53plUyEMuXJRD8qYd57z804fJGrt4iIf9fpar1TDh/tF8wLzAfMH9wxtWsZ+mD/INd+QE7TPd37Q/Tybcz1fPgudH0rzUw3VQ/cnbBPEFWG7am8V7Xuu+eEcTh/HqTRoBZIty67KW6XuwMz5YWPBB0s2PzyDpRgGTgNfAFeSHzrxOumTHuSDB/HuqZEB/1818g3fKl14iwRvAZ5xviOZF/gesAHmCn2bME8wF6idvvQjp9985wfdz/N19mfTzkLnhzMDHYnFyg/a97WWH55+e+b8UFJwz5LMDy04c38Bw8DfQK78wHSe6/2wGWV3AQtxv+t+m825my+fhT6/h2XHop1f7ftaO7+lh2c+v8nCTUvy/KZw7s4CPL8v45DmOr83ojzX+e1DWS++RSRxv3dAqpZncZ/vwi2f/VdBcFfzLo8BvOPJeX9HQ5ll/MagdnJi8j1Pn7nkihPw/xa43LcC3duVZvG+FcRMxC7BWPnO0e/QiI1zr4n4Npgzb/ltoZ/m1nbolAn9/4Bs/U4ZQanS1O8Kas3Fy1HAcfGgNIKXAg7AuEbMxN8aXL8igOQAlP8FAAD//wMAUEsDBBQABgAIAAAAIQCL7TVwkgEAADcDAAARAAgBZG9jUHJvcHMvY29yZS54bWwgogQBKKAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACcUsFu2zAMvRfYPxi6O7KTri2MxAW2rqcWKNAUHXZTJdZRa0uCxMz135eWEyXBtssAHUTy8ZHvScvrj67NfoMP2poVK2cFy8BIq7RpVuxpfZtfsSygMEq01sCKDRDYdf3lbCldJa2HB28deNQQMmIyoZJuxTaIruI8yA10IswIYaj4an0nkELfcCfku2iAz4vigneAQgkUfCTMXWJkO0olE6Xb+jYSKMmhhQ4MBl7OSn7AIvgu/LUhVo6QncbBkabdusfcSk7FhP4IOgH7vp/1i7gG7V/yn/d3j1Fqrs3olQRWL5WsUGML9ZIfrnQL25c3kDilU0AF6UGg9fV6Y8m02LVPjWa/w9BbrwI1nkTUqSBIrx3SE060JwlCtyLgPb3pqwb1bUgT/qyMg0bwg9cGQdXzYn6eF5d58XVdltWCzsWvOP8YRFKjs5MCUBl5VU3O7ivPi+8361v2D749KsqlqYmw2+3834x7gjp+V4HQWD9MDsoUkYOtMM2W/mMNJr/5Eb1Pqaj39KvXnwAAAP//AwBQSwMEFAAGAAgAAAAhAE0Y0YfgAQAApAQAABAACAFkb2NQcm9wcy9hcHAueG1sIKIEASigAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtFRNb9swDL0P2H8wfI/lFEUwBLKLLcWQw4oFqJu7atO2MFsSRM1p9utH2Yk/2g4YBswniqSfHh9J8buXtgk6sCi1SsJ1FIcBqFwXUlVJ+JR9XX0KA3RCFaLRCpLwDBjepR8/8IPVBqyTgAFBKEzC2jmzZQzzGlqBEYUVRUptW+HoaCumy1LmcK/zny0ox27ieMPgxYEqoFiZETAcELed+1fQQueeHx6zsyHCKc+gNY1wkHI2mZ+NaWQuHJWePsjcatSlC46StOBsHuSPuWhgR4hpKRoEziYH34Pwah2EtJjyzm07yJ22AcpfpNdNGDwLBM8jCTthpVCO+Pi04dDbjUFn04OoADmj2HDuzXna3Ja36bpPIGOZ6AEGDhRYssukawC/lwdh3Ttk13OyPYeB6kRvNdw559dX63VdYj8IReVYCozWTrdGqDO5RuubVD/wyWT63jfnIu7SyR9rYaGgqbnGJwffk662IZAvJLIvd3ne91Bvu7KZF/rHrpCy8fsSv2rff0m8/aurG3Pyo+N3D2n5TqdT1PkBXmEtaPSjXLfMQiXRge0BLz8sR+ZVPfOcuT3O33LELiKP2uOuFqqC4tqvtwFO23UcHp10vYli+vqNu/o4m56X9DcAAAD//wMAUEsDBBQABgAIAAAAIQAXyJ/obAEAAG4DAAATAAgBZG9jUHJvcHMvY3VzdG9tLnhtbCCiBAEooAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALyTwWuDMBTG74P9D5K7NVq1tajFqoXCVsrmetilWI1twCSSxG5l7H9fqmvpYaetDHLIey98v++DF3/6TmrtgLjAjAbAHECgIVqwEtNdAF6yuT4GmpA5LfOaURSAIxJgGt7f+SvOGsQlRkJTElQEYC9lMzEMUewRycVAjamaVIyTXKqS7wxWVbhACStagqg0LAhdo2iFZERvLnKg15sc5G8lS1ac3Il1dmyU3dD/Fj9qFZG4DMBH4sRJ4kBHt1Iv1k1oznRv6I10OIbQmlnx3IvST6A1p8cW0GhOVPTNerVINtFDlj4toyxdRo/psxI/yEndvAnJQ9+4vp+hf8QPz/hZi+ty2ZIt4jFHuURlD8d2aMKRbTrWyHU7C6rjGzfC2z/g0xL/E9050xfiEUmOiz7ylrE6lLxFXdyuullg94zMMEHXSStcI6l6oQUtW4dqWZzMNCdDddzXzsjlxbUZ47SK/UcJvwAAAP//AwBQSwECLQAUAAYACAAAACEAJm65Z1kBAAA/BAAAEwAAAAAAAAAAAAAAAAAAAAAAW0NvbnRlbnRfVHlwZXNdLnhtbFBLAQItABQABgAIAAAAIQCnWMK1JQEAAF4DAAALAAAAAAAAAAAAAAAAAJIDAABfcmVscy8ucmVsc1BLAQItABQABgAIAAAAIQBU4gwe+hIAAAx1AAASAAAAAAAAAAAAAAAAAOgGAAB2aXNpby9kb2N1bWVudC54bWxQSwECLQAUAAYACAAAACEA+Da6qSICAABbBAAAFQAAAAAAAAAAAAAAAAASGgAAdmlzaW8vcGFnZXMvcGFnZXMueG1sUEsBAi0AFAAGAAgAAAAhAI5QQMrPAAAAhQEAAB0AAAAAAAAAAAAAAAAAZxwAAHZpc2lvL19yZWxzL2RvY3VtZW50LnhtbC5yZWxzUEsBAi0AFAAGAAgAAAAhAI/Dmey4AAAACwEAACAAAAAAAAAAAAAAAAAAcR0AAHZpc2lvL3BhZ2VzL19yZWxzL3BhZ2VzLnhtbC5yZWxzUEsBAi0AFAAGAAgAAAAhACZUHfdABAAAYA0AABUAAAAAAAAAAAAAAAAAZx4AAHZpc2lvL3BhZ2VzL3BhZ2UxLnhtbFBLAQItABQABgAIAAAAIQDn4OSVuwAAAPMAAAARAAAAAAAAAAAAAAAAANoiAAB2aXNpby93aW5kb3dzLnhtbFBLAQItABQABgAIAAAAIQCTwjLUzAUAACwbAAAWAAAAAAAAAAAAAAAAAMQjAABkb2NQcm9wcy90aHVtYm5haWwuZW1mUEsBAi0AFAAGAAgAAAAhAIvtNXCSAQAANwMAABEAAAAAAAAAAAAAAAAAxCkAAGRvY1Byb3BzL2NvcmUueG1sUEsBAi0AFAAGAAgAAAAhAE0Y0YfgAQAApAQAABAAAAAAAAAAAAAAAAAAjSwAAGRvY1Byb3BzL2FwcC54bWxQSwECLQAUAAYACAAAACEAF8if6GwBAABuAwAAEwAAAAAAAAAAAAAAAACjLwAAZG9jUHJvcHMvY3VzdG9tLnhtbFBLBQYAAAAADAAMABoDAABIMgAAAAA=","Object Descriptor":"pgAAABUaAgAAAAAAwAAAAAAAAEYBAAAAKicAAKITAAAAAAAAAAAAACAAAAA0AAAAZAAAAE0AaQBjAHIAbwBzAG8AZgB0ACAAVgBpAHMAaQBvACAARAByAGEAdwBpAG4AZwAAAEQAcgBhAHcAaQBuAGcAMQBcAEQAcgBhAHcAaQBuAGcAXAB+AFAAYQBnAGUALQAxAFwAUwBoAGUAZQB0AC4AMQAAAA=="}'
\ No newline at end of file
@@ -0,0 +1,55 @@
+from app.extensions import db
+from app.models.auth import Team
+from app.models.visio import Shape, Stencil
+
+PAGE_SIZE = 50
+
+
+def shape_page(user_id, q='', after=None):
+    """One page of the user's shapes, newest first, with only the listed columns.
+
+    The cursor is the id of the last shape on the previous page; ids grow
+    with the upload date, so (user_id, id) is walked in index order.
+    """
+    query = (
+        db.session.query(
+            Shape.id, Shape.name, Shape.keywords, Shape.prompt, Shape.upload_date,
+            Stencil.title.label('stencil_title'), Team.name.label('team_name'),
+        )
+        .outerjoin(Stencil, Shape.stencil_id == Stencil.id)
+        .outerjoin(Team, Shape.team_id == Team.id)
+        .filter(Shape.user_id == user_id)
+    )
+    if q:
+        query = query.filter(db.or_(Shape.name.icontains(q, autoescape=True),
+                                    Shape.keywords.icontains(q, autoescape=True)))
+    if after:
+        query = query.filter(Shape.id < after)
+    rows = query.order_by(Shape.id.desc()).limit(PAGE_SIZE + 1).all()
+    return rows[:PAGE_SIZE], rows[PAGE_SIZE - 1].id if len(rows) > PAGE_SIZE else None
+
+
+def stencil_page(user_id, q='', after=None):
+    """One page of the user's stencils, newest first, see shape_page()."""
+    shape_count = (
+        db.select(db.func.count(Shape.id))
+        .where(Shape.stencil_id == Stencil.id)
+        .correlate(Stencil)
+        .scalar_subquery()
+    )
+    query = (
+        db.session.query(
+            Stencil.id, Stencil.title, Stencil.file_name, Stencil.upload_date,
+            Stencil.categories, Stencil.tags, Stencil.comments,
+            Team.name.label('team_name'), shape_count.label('shape_count'),
+        )
+        .outerjoin(Team, Stencil.team_id == Team.id)
+        .filter(Stencil.user_id == user_id)
+    )
+    if q:
+        query = query.filter(db.or_(Stencil.title.icontains(q, autoescape=True),
+                                    Stencil.tags.icontains(q, autoescape=True)))
+    if after:
+        query = query.filter(Stencil.id < after)
+    rows = query.order_by(Stencil.id.desc()).limit(PAGE_SIZE + 1).all()
+    return rows[:PAGE_SIZE], rows[PAGE_SIZE - 1].id if len(rows) > PAGE_SIZE else None
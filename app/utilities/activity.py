@@ -0,0 +1,97 @@
+import atexit
+import logging
+import threading
+from datetime import datetime
+
+from flask import current_app, session
+from sqlalchemy import case, update
+
+from app.extensions import db, http_auth
+from app.models.auth import User
+
+FLUSH_CHUNK = 500
+
+
+class ActivityRecorder:
+    """Collects last_active timestamps in memory and writes them in one UPDATE per interval.
+
+    Every worker process has its own recorder. A background thread flushes
+    it every interval seconds and once more when the process exits.
+    """
+
+    def __init__(self, app, interval):
+        self.app = app
+        self.interval = interval
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def touch(self, user_id):
+        with self._lock:
+            self._pending[user_id] = datetime.utcnow()
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name='activity-flush', daemon=True)
+                self._thread.start()
+                atexit.register(self._flush_in_context)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self._flush_in_context()
+
+    def _flush_in_context(self):
+        with self.app.app_context():
+            try:
+                self.flush()
+            except Exception:
+                db.session.rollback()
+                logging.exception('Could not write user activity')
+
+    def flush(self):
+        """Write the collected timestamps. Returns the number of users updated."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        items = sorted(pending.items())
+        for i in range(0, len(items), FLUSH_CHUNK):
+            chunk = dict(items[i:i + FLUSH_CHUNK])
+            new_value = case(chunk, value=User.id)
+            db.session.execute(
+                update(User)
+                .where(User.id.in_(chunk))
+                # Another worker may already have written a later timestamp
+                .where(db.or_(User.last_active.is_(None), User.last_active < new_value))
+                .values(last_active=new_value)
+                .execution_options(synchronize_session=False)
+            )
+        db.session.commit()
+        return len(items)
+
+
+def touch(user_id):
+    """Record that user_id was active now. Written to the DB with the next flush."""
+    current_app.extensions['activity'].touch(user_id)
+
+
+def init_activity(app):
+    recorder = ActivityRecorder(app, app.config.get('ACTIVITY_FLUSH_INTERVAL', 60))
+    app.extensions['activity'] = recorder
+
+    @app.after_request
+    def _record_activity(response):
+        # Neither check loads the user: a signed API token resolves to a
+        # lazy principal and the session only holds the id
+        principal = http_auth.current_user()
+        user_id = principal.id if principal else session.get('_user_id')
+        if user_id is not None:
+            recorder.touch(int(user_id))
+        return response
+
+    return recorder
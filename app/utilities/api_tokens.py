@@ -0,0 +1,78 @@
+import threading
+import time
+from datetime import date
+
+from flask import current_app
+from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
+
+from app.extensions import db
+from app.models.auth import User
+
+# user_id -> (token_generation, time fetched). Per process; a revocation is
+# seen by other workers after at most API_TOKEN_GENERATION_TTL seconds.
+_generations = {}
+_generations_lock = threading.Lock()
+
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt='api-token')
+
+
+def issue_token(user):
+    """Signed token for the Visio add-in, valid for API_TOKEN_MAX_AGE seconds."""
+    return _serializer().dumps({'u': user.id, 'g': user.token_generation})
+
+
+def _current_generation(user_id):
+    now = time.monotonic()
+    cached = _generations.get(user_id)
+    if cached and now - cached[1] < current_app.config['API_TOKEN_GENERATION_TTL']:
+        return cached[0]
+    generation = db.session.query(User.token_generation).filter(User.id == user_id).scalar()
+    with _generations_lock:
+        _generations[user_id] = (generation, now)
+    return generation
+
+
+def revoke_tokens(user):
+    """Invalidate all tokens issued to user so far (logout everywhere). The caller commits."""
+    user.token_generation += 1
+    user.token = None
+    with _generations_lock:
+        _generations.pop(user.id, None)
+
+
+def legacy_tokens_accepted():
+    """Whether raw users.token values are still valid (API_LEGACY_TOKENS_UNTIL not passed)."""
+    until = current_app.config['API_LEGACY_TOKENS_UNTIL']
+    return not until or date.today() <= date.fromisoformat(until)
+
+
+class TokenPrincipal:
+    """The user behind a signed token. Only loads the User row when more than the id is needed."""
+
+    def __init__(self, user_id):
+        self.id = user_id
+        self._user = None
+
+    def __getattr__(self, name):
+        if self._user is None:
+            self._user = db.session.get(User, self.id)
+        return getattr(self._user, name)
+
+
+def verify_api_token(token):
+    """Return the principal for a signed token (or a legacy raw token), or None."""
+    if not token:
+        return None
+    try:
+        data = _serializer().loads(token, max_age=current_app.config['API_TOKEN_MAX_AGE'])
+    except SignatureExpired:
+        return None
+    except BadSignature:
+        if legacy_tokens_accepted():
+            return User.query.filter_by(token=token).first()
+        return None
+    if _current_generation(data['u']) != data['g']:
+        return None
+    return TokenPrincipal(data['u'])
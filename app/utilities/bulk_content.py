@@ -0,0 +1,225 @@
+from sqlalchemy import select, update
+
+from app.extensions import db
+from app.models.auth import User, TeamMembership
+from app.models.stats import DownloadDaily
+from app.models.visio import Shape, Stencil
+from app.utilities.file_cleanup import queue_shape_files, queue_stencil_files
+from app.utilities.rollups import SHAPE, STENCIL, forget_content, refresh_user_stats
+
+# Ids accepted per request
+BULK_LIMIT = 500
+KINDS = {'shapes': SHAPE, 'stencils': STENCIL}
+# Comma-separated keywords of each kind and their maximum length
+TAG_COLUMNS = {'shape': ('keywords', None), 'stencil': ('tags', 512)}
+
+
+class BulkError(Exception):
+    """The whole request is refused. error is the code for the JSON response."""
+
+    def __init__(self, error, status=400):
+        super().__init__(error)
+        self.error = error
+        self.status = status
+
+
+def _team_roles(user_id, team_ids):
+    if not team_ids:
+        return {}
+    return dict(
+        db.session.query(TeamMembership.team_id, TeamMembership.role)
+        .filter(TeamMembership.user_id == user_id, TeamMembership.team_id.in_(team_ids))
+    )
+
+
+def _resolve(kind, ids, user):
+    """Load the items and check in one go whether user may manage them.
+
+    Same rule as for a single item: the uploader, or an admin or owner of
+    the item's team. Returns (rows of the permitted items by id, results
+    of the refused ids).
+    """
+    item = kind.item
+    columns = [item.id, item.user_id, item.team_id]
+    if kind is SHAPE:
+        columns.append(Shape.stencil_id)
+    rows = {row.id: row for row in db.session.query(*columns).filter(item.id.in_(ids))}
+    roles = _team_roles(user.id, {row.team_id for row in rows.values() if row.team_id})
+
+    allowed, results = {}, {}
+    for item_id in ids:
+        row = rows.get(item_id)
+        if row is None:
+            results[item_id] = 'not_found'
+        elif row.user_id != user.id and roles.get(row.team_id) not in ('admin', 'owner'):
+            results[item_id] = 'forbidden'
+        else:
+            allowed[item_id] = row
+    return allowed, results
+
+
+def _standalone(items, results):
+    """Shapes uploaded with a stencil move and change hands with their stencil only."""
+    ids = []
+    for item_id, row in items.items():
+        if getattr(row, 'stencil_id', None):
+            results[item_id] = 'in_stencil'
+        else:
+            ids.append(item_id)
+    return ids
+
+
+def _move(kind, items, user, team_id, results):
+    if team_id is not None:
+        if _team_roles(user.id, [team_id]).get(team_id) not in ('contributor', 'admin', 'owner'):
+            raise BulkError('forbidden_team', 403)
+    ids = []
+    for item_id in _standalone(items, results):
+        if items[item_id].team_id == team_id:
+            results[item_id] = 'unchanged'
+        else:
+            ids.append(item_id)
+    if not ids:
+        return ids
+
+    kind.item.query.filter(kind.item.id.in_(ids)).update({'team_id': team_id}, synchronize_session=False)
+    if kind is STENCIL:
+        Shape.query.filter(Shape.stencil_id.in_(ids)).update({'team_id': team_id}, synchronize_session=False)
+    return ids
+
+
+def _reassign(kind, items, user, owner_id, results):
+    if owner_id is None or db.session.get(User, owner_id) is None:
+        raise BulkError('user_not_found', 404)
+    roles = _team_roles(owner_id, {row.team_id for row in items.values() if row.team_id})
+    ids = []
+    for item_id in _standalone(items, results):
+        row = items[item_id]
+        if row.user_id == owner_id:
+            results[item_id] = 'unchanged'
+        elif row.team_id is None and row.user_id != user.id:
+            # Personal content is handed on by its uploader only
+            results[item_id] = 'forbidden'
+        elif row.team_id is not None and roles.get(row.team_id) not in ('contributor', 'admin', 'owner'):
+            # The new owner must be able to upload to the item's team
+            results[item_id] = 'not_a_member'
+        else:
+            ids.append(item_id)
+    if not ids:
+        return ids
+
+    # (kind, usage item column, items criterion, item ids) of everything that changes hands
+    changes = [(kind, getattr(kind.usage, kind.item_col), kind.item.id.in_(ids), ids)]
+    if kind is STENCIL:
+        shape_ids = select(Shape.id).where(Shape.stencil_id.in_(ids))
+        changes.append((SHAPE, SHAPE.usage.shape_id, Shape.stencil_id.in_(ids), shape_ids))
+
+    affected = {owner_id} | {items[item_id].user_id for item_id in ids}
+    for changed, item_col, criterion, item_ids in changes:
+        pairs = db.session.query(changed.usage.user_id, changed.usage.owner_id).filter(item_col.in_(item_ids)).distinct()
+        for user_id, former_owner_id in pairs:
+            affected.update((user_id, former_owner_id))
+        changed.item.query.filter(criterion).update({'user_id': owner_id}, synchronize_session=False)
+        changed.usage.query.filter(item_col.in_(item_ids)).update({'owner_id': owner_id}, synchronize_session=False)
+        DownloadDaily.query.filter(
+            DownloadDaily.kind == changed.name, DownloadDaily.item_id.in_(item_ids)
+        ).update({'owner_id': owner_id}, synchronize_session=False)
+    refresh_user_stats(affected)
+    return ids
+
+
+def split_tags(value):
+    """Keywords from a comma-separated string or a list of strings."""
+    if isinstance(value, (list, tuple)):
+        value = ','.join(str(tag) for tag in value)
+    return [tag.strip() for tag in (value or '').split(',') if tag.strip()]
+
+
+def _retag(kind, items, add, remove, results):
+    if not add and not remove:
+        raise BulkError('no_tags')
+    column, max_length = TAG_COLUMNS[kind.name]
+    drop = {tag.lower() for tag in remove}
+    rows = db.session.query(kind.item.id, getattr(kind.item, column)).filter(kind.item.id.in_(list(items)))
+
+    changes = []
+    for item_id, value in rows:
+        current = split_tags(value)
+        tags = [tag for tag in current if tag.lower() not in drop]
+        present = {tag.lower() for tag in tags}
+        for tag in add:
+            if tag.lower() not in present:
+                tags.append(tag)
+                present.add(tag.lower())
+        joined = ', '.join(tags)
+        if tags == current:
+            results[item_id] = 'unchanged'
+        elif max_length and len(joined) > max_length:
+            results[item_id] = 'too_long'
+        else:
+            changes.append({'id': item_id, column: joined})
+    if changes:
+        # One UPDATE statement, executed with a parameter set per item
+        db.session.execute(update(kind.item), changes)
+    return [change['id'] for change in changes]
+
+
+def _delete(kind, items):
+    ids = list(items)
+    owners = {row.user_id for row in items.values()}
+    if kind is SHAPE:
+        queue_shape_files(ids)
+        affected = forget_content(shape_ids=ids)
+        Shape.query.filter(Shape.id.in_(ids)).delete(synchronize_session=False)
+    else:
+        shape_ids = [shape_id for shape_id, in db.session.query(Shape.id).filter(Shape.stencil_id.in_(ids))]
+        queue_stencil_files(db.session.query(Stencil.id, Stencil.file_name).filter(Stencil.id.in_(ids)).all())
+        queue_shape_files(shape_ids)
+        affected = forget_content(shape_ids=shape_ids, stencil_ids=ids)
+        Shape.query.filter(Shape.stencil_id.in_(ids)).delete(synchronize_session=False)
+        Stencil.query.filter(Stencil.id.in_(ids)).delete(synchronize_session=False)
+    refresh_user_stats(affected | owners)
+    return ids
+
+
+def _optional_id(value):
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise BulkError('invalid_ids')
+
+
+def bulk_update(kind, action, ids, user, team_id=None, owner_id=None, add=(), remove=()):
+    """Apply action to many shapes or stencils on behalf of user. The caller commits.
+
+    ids must be a non-empty list of ints. action is 'move' (to team_id,
+    None for the uploader's own content), 'reassign' (to owner_id),
+    'retag' (add and remove keywords) or 'delete'. Files of deleted items are removed later by sweep_files.
+    Returns a list of {'id', 'result'} in the order of ids.
+    """
+    # bool is an int, a string would be walked character by character
+    if (not isinstance(ids, list) or not ids
+            or not all(isinstance(item_id, int) and not isinstance(item_id, bool) for item_id in ids)):
+        raise BulkError('invalid_ids')
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > BULK_LIMIT:
+        raise BulkError('too_many_ids')
+    if action not in ('move', 'reassign', 'retag', 'delete'):
+        raise BulkError('invalid_action')
+    team_id = _optional_id(team_id)
+    owner_id = _optional_id(owner_id)
+
+    items, results = _resolve(kind, ids, user)
+    if items:
+        if action == 'move':
+            done = _move(kind, items, user, team_id, results)
+        elif action == 'reassign':
+            done = _reassign(kind, items, user, owner_id, results)
+        elif action == 'retag':
+            done = _retag(kind, items, add, remove, results)
+        else:
+            done = _delete(kind, items)
+        results.update((item_id, 'ok') for item_id in done)
+    return [{'id': item_id, 'result': results[item_id]} for item_id in ids]
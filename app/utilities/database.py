@@ -0,0 +1,274 @@
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+from flask import current_app, request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from app.extensions import db
+
+# Applied to every new SQLite connection, in this order
+PRAGMAS = ('journal_mode', 'synchronous', 'busy_timeout', 'cache_size', 'mmap_size', 'temp_store', 'foreign_keys')
+# SQLite reports these as numbers
+_NAMES = {
+    'synchronous': ('OFF', 'NORMAL', 'FULL', 'EXTRA'),
+    'temp_store': ('DEFAULT', 'FILE', 'MEMORY'),
+}
+
+# Profiles compared by `flask db_benchmark`, next to the configured one
+PROFILES = {
+    # Out-of-the-box SQLite, only switched to WAL as before
+    'sqlite defaults': {
+        'journal_mode': 'WAL', 'synchronous': 'FULL', 'busy_timeout': 5000,
+        'cache_size': -2000, 'mmap_size': 0, 'temp_store': 'DEFAULT', 'foreign_keys': 0,
+    },
+    # No fsync at all; a power loss can corrupt the database. For comparison only
+    'unsafe': {
+        'journal_mode': 'WAL', 'synchronous': 'OFF', 'busy_timeout': 5000,
+        'cache_size': -65536, 'mmap_size': 1024 ** 3, 'temp_store': 'MEMORY', 'foreign_keys': 0,
+    },
+}
+
+
+# Config key of each pragma
+CONFIG_KEYS = {
+    'synchronous': 'SQLITE_SYNCHRONOUS',
+    'busy_timeout': 'SQLITE_BUSY_TIMEOUT',
+    'cache_size': 'SQLITE_CACHE_SIZE',
+    'mmap_size': 'SQLITE_MMAP_SIZE',
+    'temp_store': 'SQLITE_TEMP_STORE',
+    'foreign_keys': 'SQLITE_FOREIGN_KEYS',
+}
+
+
+def configured_pragmas(config):
+    pragmas = {'journal_mode': 'WAL'}
+    pragmas.update((name, config[key]) for name, key in CONFIG_KEYS.items())
+    pragmas['foreign_keys'] = int(pragmas['foreign_keys'])
+    return pragmas
+
+
+def engine_options(config, uri=None):
+    """Pool settings for the configured database, or the one at uri.
+
+    A sync gunicorn worker serves one request at a time; the job poller
+    and the activity flush thread need a connection now and then. Pooled
+    SQLite connections keep their page cache and memory map between
+    requests.
+    """
+    url = make_url(uri or config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+    options = {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+    }
+    if url.get_backend_name() != 'sqlite':
+        options.update(pool_pre_ping=True, pool_recycle=config['DB_POOL_RECYCLE'])
+    return options
+
+
+def read_uri(config):
+    """URI of the engine GET requests and reports read from, None if they read from the primary.
+
+    READ_DATABASE_URI names a replica. Without one a SQLite database file
+    is opened a second time with query_only connections: in WAL mode they
+    read a consistent snapshot without ever holding a lock a writer waits for.
+    """
+    if not config['DB_READ_ROUTING']:
+        return None
+    if config['READ_DATABASE_URI']:
+        return config['READ_DATABASE_URI']
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:'):
+        return config['SQLALCHEMY_DATABASE_URI']
+    return None
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    for name in PRAGMAS:
+        if name in pragmas:
+            cursor.execute(f'PRAGMA {name}={pragmas[name]}')
+    cursor.close()
+
+
+def read_pragmas(dbapi_connection):
+    """The settings a connection actually runs with, names instead of numbers where SQLite has them."""
+    cursor = dbapi_connection.cursor()
+    effective = {}
+    for name in PRAGMAS:
+        value = cursor.execute(f'PRAGMA {name}').fetchone()[0]
+        if name in _NAMES:
+            value = _NAMES[name][value]
+        effective[name] = value.upper() if isinstance(value, str) else value
+    cursor.close()
+    return effective
+
+
+def _mismatches(wanted, effective):
+    return {
+        name: effective[name] for name in PRAGMAS
+        if str(wanted[name]).upper() != str(effective[name]).upper()
+    }
+
+
+def init_database(app):
+    """Initialise Flask-SQLAlchemy with pool settings and per-connection SQLite pragmas from the config.
+
+    The connect listener is attached to this app's engines only. The
+    first connection of every process logs the effective settings. With
+    a read engine (see read_uri()) GET and HEAD requests read through it
+    until they write.
+    """
+    options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    for key, value in engine_options(app.config).items():
+        options.setdefault(key, value)
+    uri = read_uri(app.config)
+    if uri:
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds.setdefault('read', {'url': uri, **engine_options(app.config, uri)})
+        app.config['SQLALCHEMY_BINDS'] = binds
+    db.init_app(app)
+
+    with app.app_context():
+        engines = dict(db.engines)
+    pragmas = configured_pragmas(app.config)
+    for key, engine in engines.items():
+        if engine.dialect.name != 'sqlite':
+            continue
+        reported = []
+
+        @event.listens_for(engine, 'connect')
+        def _configure(dbapi_connection, connection_record, engine=engine, reported=reported, key=key):
+            if not isinstance(dbapi_connection, sqlite3.Connection):
+                return
+            apply_pragmas(dbapi_connection, pragmas)
+            if key == 'read':
+                # Any write on this engine is a bug, let SQLite refuse it
+                dbapi_connection.execute('PRAGMA query_only=1')
+            if not reported:
+                reported.append(True)
+                effective = read_pragmas(dbapi_connection)
+                app.logger.info('SQLite %s%s: %s, pool %s', engine.url.database, ' (read)' if key == 'read' else '',
+                                ', '.join(f'{k}={v}' for k, v in effective.items()), engine.pool.status())
+                mismatches = _mismatches(pragmas, effective)
+                if mismatches:
+                    app.logger.warning('SQLite did not take all configured settings, running with %s', mismatches)
+
+    if 'read' in engines:
+        @app.before_request
+        def _route_reads():
+            if request.method in ('GET', 'HEAD'):
+                db.session.info['read_only'] = True
+
+    app.extensions['sqlite_pragmas'] = pragmas
+    return engines
+
+
+@contextmanager
+def reading():
+    """Read through the read engine within the block, as a GET request does. For reports.
+
+    A session that has written before stays on the primary.
+    """
+    session = db.session()
+    previous = session.info.get('read_only', False)
+    session.info['read_only'] = True
+    try:
+        yield
+    finally:
+        session.info['read_only'] = previous
+
+
+def database_settings():
+    """Effective connection settings of the current app's default engine, for `flask db_settings`."""
+    engine = db.engine
+    settings = {'url': engine.url.render_as_string(hide_password=True)}
+    with engine.connect() as conn:
+        if engine.dialect.name == 'sqlite':
+            settings.update(read_pragmas(conn.connection.dbapi_connection))
+        settings['pool'] = engine.pool.status()
+    read_engine = db.engines.get('read')
+    if read_engine is not None:
+        settings['read url'] = read_engine.url.render_as_string(hide_password=True)
+        settings['read pool'] = read_engine.pool.status()
+    return settings
+
+
+def copy_database(target):
+    """Copy the current app's SQLite database to the file target, consistent even while workers write."""
+    source = sqlite3.connect(db.engine.url.database)
+    copy = sqlite3.connect(target)
+    try:
+        source.backup(copy)
+    finally:
+        copy.close()
+        source.close()
+
+
+def copy_settings(database, pragmas=()):
+    """Config of the current app for an app on the copy database, with pragmas overriding the configured ones."""
+    settings = {key: value for key, value in current_app.config.items() if key.isupper()}
+    settings.update({CONFIG_KEYS[name]: value for name, value in dict(pragmas).items() if name in CONFIG_KEYS})
+    settings.update(
+        SQLALCHEMY_DATABASE_URI=f'sqlite:///{database}',
+        SQLALCHEMY_ENGINE_OPTIONS={},
+        SQLALCHEMY_BINDS={},
+        READ_DATABASE_URI='',
+        JOBS_POLL_INTERVAL=0,
+    )
+    return settings
+
+
+def settings_app(settings):
+    from app import create_app
+    return create_app(type('CopyConfig', (), settings))
+
+
+def benchmark_profiles(profiles, requests=50, downloads=500, limit=100):
+    """Time get_shapes and recording downloads under each profile, each on its own copy of the database.
+
+    Returns {profile: (ms per get_shapes request, ms per recorded and committed download)}.
+    """
+    from app.models.auth import User
+    from app.models.visio import Shape
+    from app.utilities.rollups import record_shape_download
+
+    results = {}
+    for name, pragmas in profiles.items():
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, 'benchmark.db')
+            copy_database(database)
+
+            app = settings_app(copy_settings(database, pragmas))
+            with app.app_context():
+                shapes = db.session.query(Shape.id, Shape.user_id).order_by(Shape.id).limit(10000).all()
+                user_ids = [user_id for user_id, in db.session.query(User.id).order_by(User.id).limit(1000)]
+                if not shapes or not user_ids:
+                    raise ValueError('The database needs at least one user and one shape.')
+                client = app.test_client()
+                client.get(f'/get_shapes?limit={limit}')
+
+                start = time.perf_counter()
+                for _ in range(requests):
+                    client.get(f'/get_shapes?limit={limit}')
+                reads = (time.perf_counter() - start) * 1000 / requests
+
+                rng = random.Random(0)
+                start = time.perf_counter()
+                for _ in range(downloads):
+                    record_shape_download(rng.choice(shapes), rng.choice(user_ids))
+                    db.session.commit()
+                writes = (time.perf_counter() - start) * 1000 / downloads
+
+                db.session.remove()
+                for engine in db.engines.values():
+                    engine.dispose()
+            results[name] = (reads, writes)
+    return results
@@ -0,0 +1,100 @@
+import fcntl
+import gzip
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import select
+
+from app.extensions import db
+
+# Raw events read per query while an archive is written
+READ_BATCH = 5000
+
+
+def _json_value(value):
+    return value.isoformat()
+
+
+class CompactionBusy(Exception):
+    """Another process is folding or retiring download events."""
+
+
+@contextmanager
+def compaction_lock(wait=True):
+    """Hold the host-wide lock of the download compaction while the block runs.
+
+    The periodic job and `flask compact-downloads` both take it, so they
+    never fold, archive or delete the same events at the same time. It is
+    a flock() on a file below the instance folder and is released when
+    the process dies. Raises CompactionBusy if wait is false and the lock
+    is taken.
+    """
+    directory = os.path.join(current_app.instance_path, 'locks')
+    os.makedirs(directory, exist_ok=True)
+    fd = os.open(os.path.join(directory, 'compact-downloads.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if wait else fcntl.LOCK_NB))
+        except BlockingIOError:
+            raise CompactionBusy()
+        yield
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def archive_downloads(raw, *criteria):
+    """Write the raw download events matching criteria to DOWNLOAD_ARCHIVE_DIR.
+
+    The file holds one JSON object per event with the columns of the raw
+    table, gzip-compressed, named
+    <table>-<first id>-<last id>-<UTC time>-<random>.ndjson.gz. It only gets
+    its name once it is complete and on disk, so the events can be deleted
+    afterwards, and it never replaces an existing archive. Call it under
+    compaction_lock(). Returns the highest id written, None if no event
+    matches.
+    """
+    directory = current_app.config['DOWNLOAD_ARCHIVE_DIR']
+    os.makedirs(directory, exist_ok=True)
+    table = raw.__table__
+    run = f'{datetime.utcnow():%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}'
+    part = os.path.join(directory, f'{table.name}-{run}.ndjson.gz.part')
+    first = last = None
+    try:
+        with open(part, 'xb') as f:
+            with gzip.GzipFile(fileobj=f, mode='wb') as archive:
+                while True:
+                    query = select(table).where(*criteria).order_by(table.c.id).limit(READ_BATCH)
+                    if last is not None:
+                        query = query.where(table.c.id > last)
+                    rows = db.session.execute(query).mappings().all()
+                    if not rows:
+                        break
+                    for row in rows:
+                        archive.write(json.dumps(dict(row), default=_json_value).encode() + b'\n')
+                    first = first or rows[0]['id']
+                    last = rows[-1]['id']
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.remove(part)
+        raise
+    if last is None:
+        os.remove(part)
+        return None
+    # link() fails instead of overwriting an archive that has the name already
+    os.link(part, os.path.join(directory, f'{table.name}-{first}-{last}-{run}.ndjson.gz'))
+    os.remove(part)
+    _fsync_directory(directory)
+    return last
@@ -0,0 +1,123 @@
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert
+
+from app.extensions import db
+from app.models.maintenance import FileDeletion
+from app.models.visio import Shape, Stencil
+from app.utilities.jobs import job
+from app.utilities.storage import get_storage, shape_image_key, stencil_file_key
+
+MAX_ATTEMPTS = 10
+
+
+def queue_file_deletions(keys):
+    """Record stored objects for deferred removal in the current transaction.
+
+    The rows are committed together with the DB delete of the shapes or
+    stencils they belong to, so a crash can neither lose a removal nor
+    remove files of rows that still exist.
+    """
+    now = datetime.utcnow()
+    rows = [{'storage_key': key, 'queued_at': now, 'attempts': 0} for key in keys]
+    if rows:
+        db.session.execute(insert(FileDeletion), rows)
+    return len(rows)
+
+
+def queue_shape_files(shape_ids):
+    return queue_file_deletions(shape_image_key(shape_id) for shape_id in shape_ids)
+
+
+def queue_stencil_files(stencils):
+    """stencils is an iterable of (id, file_name) pairs."""
+    return queue_file_deletions(stencil_file_key(stencil_id, file_name) for stencil_id, file_name in stencils)
+
+
+def _backoff(attempts):
+    return timedelta(seconds=min(30 * 2 ** attempts, 86400))
+
+
+def _ids(keys, prefix):
+    ids = set()
+    for key in keys:
+        stem = key[len(prefix) + 1:].partition('.')[0] if key.startswith(f'{prefix}/') else ''
+        if stem.isdigit():
+            ids.add(int(stem))
+    return ids
+
+
+def _keep(entries):
+    """Ids of the entries whose file must stay.
+
+    That is the file of a shape or stencil that exists now, only a safety
+    net since ids of deleted rows are not handed out again (AUTOINCREMENT,
+    migration d8a2f6c4e9b3), and any key that was queued again later: the
+    newest entry decides.
+    """
+    keys = {entry.storage_key for entry in entries}
+    live = {shape_image_key(shape_id) for shape_id, in
+            db.session.query(Shape.id).filter(Shape.id.in_(_ids(keys, 'shapes')))}
+    live.update(stencil_file_key(stencil_id, file_name) for stencil_id, file_name in
+                db.session.query(Stencil.id, Stencil.file_name).filter(Stencil.id.in_(_ids(keys, 'stencils'))))
+    newest = dict(
+        db.session.query(FileDeletion.storage_key, func.max(FileDeletion.id))
+        .filter(FileDeletion.storage_key.in_(keys))
+        .group_by(FileDeletion.storage_key)
+    )
+    return {entry.id for entry in entries if entry.storage_key in live or newest[entry.storage_key] != entry.id}
+
+
+@job('sweep_files', every=timedelta(minutes=5))
+def sweep_file_deletions(batch_size=200, max_batches=None):
+    """Remove queued files in batches. Returns (removed, failed).
+
+    Whether a file may go is decided from the database, see _keep(), not
+    from the file: linking a deduplicated upload to it changes its ctime.
+    Failures are retried with exponential backoff up to MAX_ATTEMPTS times.
+    """
+    storage = get_storage()
+    removed = failed = batches = 0
+    while max_batches is None or batches < max_batches:
+        now = datetime.utcnow()
+        batch = (
+            FileDeletion.query
+            .filter(FileDeletion.attempts < MAX_ATTEMPTS)
+            .filter(db.or_(FileDeletion.next_attempt.is_(None), FileDeletion.next_attempt <= now))
+            .order_by(FileDeletion.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        batches += 1
+
+        keep = _keep(batch)
+        done_ids = []
+        for entry in batch:
+            if entry.id in keep:
+                done_ids.append(entry.id)
+                continue
+            try:
+                if storage.delete(entry.storage_key):
+                    removed += 1
+                done_ids.append(entry.id)
+            except Exception as e:
+                entry.attempts += 1
+                entry.next_attempt = now + _backoff(entry.attempts)
+                entry.last_error = str(e)[:512]
+                failed += 1
+                logging.warning(f'Could not delete {entry.storage_key}: {e}')
+
+        if done_ids:
+            FileDeletion.query.filter(FileDeletion.id.in_(done_ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+        if len(batch) < batch_size:
+            break
+    return removed, failed
+
+
+def pending_file_deletions():
+    return FileDeletion.query.filter(FileDeletion.attempts < MAX_ATTEMPTS).count()
@@ -0,0 +1,106 @@
+import hashlib
+
+from app.extensions import db
+from app.models.visio import Shape, Stencil
+from app.utilities.storage import get_storage, shape_image_key, stencil_file_key, CHUNK_SIZE
+
+
+def sha256_text(text):
+    """SHA-256 hex digest of a string payload (e.g. a shape data object)."""
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+
+def sha256_stream(stream):
+    """SHA-256 hex digest of a binary stream, read in chunks."""
+    h = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def sha256_upload(file):
+    """SHA-256 hex digest of an uploaded FileStorage. Rewinds the stream afterwards."""
+    digest = sha256_stream(file.stream)
+    file.stream.seek(0)
+    return digest
+
+
+def save_deduplicated(file, key, candidates):
+    """Store an upload at key, reusing the bytes of an identical object if possible.
+
+    candidates are keys of objects already known to have the same SHA-256.
+    The first one that still exists is copied within the storage backend
+    (a hard link on disk, a server-side copy on S3). The upload itself is
+    only written if no candidate is available.
+    """
+    storage = get_storage()
+    for src in candidates:
+        if storage.copy(src, key):
+            return True
+    storage.save(key, file.stream)
+    return False
+
+
+def image_candidates(image_hash, exclude_id=None):
+    """Keys of stored shape images with the given fingerprint."""
+    q = db.session.query(Shape.id).filter(Shape.image_hash == image_hash)
+    if exclude_id is not None:
+        q = q.filter(Shape.id != exclude_id)
+    return [shape_image_key(shape_id) for shape_id, in q.limit(5)]
+
+
+def stencil_candidates(file_hash, exclude_id=None):
+    """Keys of stored stencil files with the given fingerprint."""
+    q = db.session.query(Stencil.id, Stencil.file_name).filter(Stencil.file_hash == file_hash)
+    if exclude_id is not None:
+        q = q.filter(Stencil.id != exclude_id)
+    return [stencil_file_key(stencil_id, file_name) for stencil_id, file_name in q.limit(5)]
+
+
+def _sha256_object(storage, key):
+    if storage.stat(key) is None:
+        return None
+    with storage.open(key) as stream:
+        return sha256_stream(stream)
+
+
+def backfill_fingerprints(batch_size=500):
+    """Compute missing fingerprints for existing shapes and stencils.
+
+    Returns a (shapes, stencils) tuple with the number of rows where a
+    fingerprint was written. A missing file leaves its fingerprint empty.
+    """
+    storage = get_storage()
+    shapes = stencils = 0
+
+    shape_ids = [
+        shape_id for shape_id, in
+        db.session.query(Shape.id)
+        .filter(db.or_(Shape.data_hash.is_(None), Shape.image_hash.is_(None)))
+        .order_by(Shape.id)
+    ]
+    for i in range(0, len(shape_ids), batch_size):
+        for shape in Shape.query.filter(Shape.id.in_(shape_ids[i:i + batch_size])):
+            written = False
+            if shape.data_hash is None:
+                shape.data_hash = sha256_text(shape.data_object)
+                written = True
+            if shape.image_hash is None:
+                shape.image_hash = _sha256_object(storage, shape_image_key(shape.id))
+                written = written or shape.image_hash is not None
+            shapes += written
+        db.session.commit()
+
+    stencil_ids = [
+        stencil_id for stencil_id, in
+        db.session.query(Stencil.id)
+        .filter(Stencil.file_hash.is_(None))
+        .order_by(Stencil.id)
+    ]
+    for i in range(0, len(stencil_ids), batch_size):
+        for stencil in Stencil.query.filter(Stencil.id.in_(stencil_ids[i:i + batch_size])):
+            stencil.file_hash = _sha256_object(storage, stencil_file_key(stencil.id, stencil.file_name))
+            stencils += stencil.file_hash is not None
+        db.session.commit()
+
+    return shapes, stencils
@@ -0,0 +1,197 @@
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.maintenance import ScheduledJob
+
+MAX_ATTEMPTS = 5
+
+# task name -> (function, repeat interval or None). Filled by the @job decorator
+# when the modules defining tasks are imported, which create_app does through
+# the blueprints.
+TASKS = {}
+
+
+def job(name, every=None):
+    """Register a function as task name. Periodic tasks pass every (a timedelta)."""
+    def decorator(func):
+        TASKS[name] = (func, every)
+        return func
+    return decorator
+
+
+def schedule(name, delay, **kwargs):
+    """Add a one-off job to the current transaction; it runs delay (a timedelta) from now.
+
+    The job is committed together with the change it belongs to, so e.g. a
+    new user never exists without the job that expires the registration.
+    """
+    if name not in TASKS:
+        raise ValueError(f'Unknown task {name!r}')
+    scheduled = ScheduledJob(task=name, kwargs=kwargs or None, run_at=datetime.utcnow() + delay, attempts=0)
+    db.session.add(scheduled)
+    return scheduled
+
+
+def ensure_periodic_jobs():
+    """Create the rows of periodic tasks that do not have one yet."""
+    existing = {
+        task for task, in
+        db.session.query(ScheduledJob.task).filter(ScheduledJob.repeat_seconds.isnot(None))
+    }
+    for name, (func, every) in TASKS.items():
+        if every is None or name in existing:
+            continue
+        db.session.add(ScheduledJob(
+            task=name, run_at=datetime.utcnow(), repeat_seconds=int(every.total_seconds()), attempts=0))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another process registered it at the same time
+            db.session.rollback()
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'[:64]
+
+
+def _claimable(now, claim_timeout):
+    # Unclaimed, or claimed by a worker that died before it finished
+    return db.or_(ScheduledJob.claimed_at.is_(None), ScheduledJob.claimed_at < now - claim_timeout)
+
+
+def _claim(job_id, now, claim_timeout, worker):
+    """Atomically claim a job. Only one of several concurrent workers gets rowcount 1."""
+    result = db.session.execute(
+        update(ScheduledJob)
+        .where(ScheduledJob.id == job_id, _claimable(now, claim_timeout))
+        .values(claimed_at=now, claimed_by=worker)
+    )
+    db.session.commit()
+    return result.rowcount == 1
+
+
+def _backoff(attempts):
+    return timedelta(seconds=min(60 * 2 ** attempts, 3600))
+
+
+def _run(scheduled):
+    func, every = TASKS[scheduled.task]
+    func(**(scheduled.kwargs or {}))
+
+
+def run_due_jobs(limit=50, claim_timeout=timedelta(minutes=10)):
+    """Claim and run due jobs. Returns (done, failed).
+
+    One-off jobs are removed after they ran, periodic jobs are moved to
+    their next run. A failing one-off job is retried with backoff up to
+    MAX_ATTEMPTS times, a failing periodic job simply runs again next time.
+    """
+    worker = worker_name()
+    now = datetime.utcnow()
+    due_ids = [
+        job_id for job_id, in
+        db.session.query(ScheduledJob.id)
+        .filter(ScheduledJob.run_at <= now, _claimable(now, claim_timeout))
+        .filter(db.or_(ScheduledJob.repeat_seconds.isnot(None), ScheduledJob.attempts < MAX_ATTEMPTS))
+        .order_by(ScheduledJob.run_at)
+        .limit(limit)
+    ]
+
+    done = failed = 0
+    for job_id in due_ids:
+        if not _claim(job_id, datetime.utcnow(), claim_timeout, worker):
+            continue
+        scheduled = db.session.get(ScheduledJob, job_id)
+        try:
+            _run(scheduled)
+        except Exception as e:
+            db.session.rollback()
+            scheduled = db.session.get(ScheduledJob, job_id)
+            scheduled.attempts += 1
+            scheduled.last_error = str(e)[:512]
+            if scheduled.repeat_seconds:
+                scheduled.run_at = datetime.utcnow() + timedelta(seconds=scheduled.repeat_seconds)
+            else:
+                scheduled.run_at = datetime.utcnow() + _backoff(scheduled.attempts)
+            scheduled.claimed_at = scheduled.claimed_by = None
+            db.session.commit()
+            failed += 1
+            logging.exception(f'Job {scheduled.task} ({job_id}) failed')
+            continue
+
+        if scheduled.repeat_seconds:
+            scheduled.run_at = datetime.utcnow() + timedelta(seconds=scheduled.repeat_seconds)
+            scheduled.claimed_at = scheduled.claimed_by = None
+            scheduled.attempts = 0
+            scheduled.last_error = None
+        else:
+            db.session.delete(scheduled)
+        db.session.commit()
+        done += 1
+    return done, failed
+
+
+def pending_jobs():
+    return ScheduledJob.query.filter(
+        db.or_(ScheduledJob.repeat_seconds.isnot(None), ScheduledJob.attempts < MAX_ATTEMPTS)
+    ).count()
+
+
+class JobPoller:
+    """One background thread per process that runs due jobs every interval seconds.
+
+    It is started by the first request rather than in create_app, so CLI
+    commands (db upgrade, ...) and the gunicorn master never start one.
+    """
+
+    def __init__(self, app, interval, claim_timeout):
+        self.app = app
+        self.interval = interval
+        self.claim_timeout = claim_timeout
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name='job-poller', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        with self.app.app_context():
+            try:
+                ensure_periodic_jobs()
+            except Exception:
+                db.session.rollback()
+                logging.exception('Could not register periodic jobs')
+        while not self._stop.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    run_due_jobs(claim_timeout=self.claim_timeout)
+                except Exception:
+                    db.session.rollback()
+                    logging.exception('Job poller failed')
+
+
+def init_jobs(app):
+    interval = app.config.get('JOBS_POLL_INTERVAL', 30)
+    if interval <= 0:
+        # Jobs are run by a separate `flask run-jobs` worker
+        return None
+    poller = JobPoller(app, interval, timedelta(seconds=app.config.get('JOBS_CLAIM_TIMEOUT', 600)))
+    app.extensions['job_poller'] = poller
+    app.before_request(poller.ensure_started)
+    return poller
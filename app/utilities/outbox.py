@@ -0,0 +1,204 @@
+import logging
+import smtplib
+import threading
+import uuid
+from datetime import datetime, timedelta
+from email.utils import formataddr
+
+from flask import current_app, has_request_context
+from flask_mail import Message
+from sqlalchemy import event, update
+
+from app.extensions import db, mail
+from app.models.maintenance import OutboxMessage
+from app.utilities.jobs import job
+
+MAX_ATTEMPTS = 8
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def queue_mail(msg, expires=None):
+    """Add a flask_mail Message to the outbox in the current transaction.
+
+    It is delivered in the background once the transaction is committed,
+    so the request never waits for the mail server. A message that is not
+    delivered within expires (a timedelta) is dropped, for mails whose
+    content stops being valid, like a password.
+    """
+    sender = msg.sender
+    if isinstance(sender, tuple):
+        sender = formataddr(sender)
+    now = datetime.utcnow()
+    db.session.add(OutboxMessage(
+        subject=msg.subject,
+        sender=sender,
+        recipients=list(msg.recipients),
+        html=msg.html,
+        body=msg.body,
+        queued_at=now,
+        attempts=0,
+        expires_at=now + expires if expires is not None else None,
+    ))
+    db.session.info['outbox_kick'] = True
+
+
+def _backoff(attempts):
+    return timedelta(seconds=min(60 * 2 ** attempts, 6 * 3600))
+
+
+def _claimable(now):
+    return db.and_(
+        OutboxMessage.attempts < MAX_ATTEMPTS,
+        db.or_(OutboxMessage.expires_at.is_(None), OutboxMessage.expires_at > now),
+        db.or_(OutboxMessage.next_attempt.is_(None), OutboxMessage.next_attempt <= now),
+        db.or_(OutboxMessage.claimed_by.is_(None), OutboxMessage.claimed_at < now - CLAIM_TIMEOUT),
+    )
+
+
+def _claim_batch(batch_size):
+    """Claim up to batch_size due messages for this sender with a single UPDATE."""
+    now = datetime.utcnow()
+    token = uuid.uuid4().hex
+    ids = [
+        message_id for message_id, in
+        db.session.query(OutboxMessage.id).filter(_claimable(now)).order_by(OutboxMessage.id).limit(batch_size)
+    ]
+    if not ids:
+        return []
+    # Re-checking the condition makes the claim atomic: rows another sender
+    # claimed in the meantime are not taken over
+    db.session.execute(
+        update(OutboxMessage)
+        .where(OutboxMessage.id.in_(ids), _claimable(now))
+        .values(claimed_by=token, claimed_at=now)
+    )
+    db.session.commit()
+    return OutboxMessage.query.filter_by(claimed_by=token).order_by(OutboxMessage.id).all()
+
+
+def _failed(message, error):
+    message.attempts += 1
+    message.next_attempt = datetime.utcnow() + _backoff(message.attempts)
+    message.claimed_by = message.claimed_at = None
+    message.last_error = str(error)[:512]
+    if message.attempts >= MAX_ATTEMPTS:
+        # Given up: keep subject, recipients and error, not the content
+        message.html = message.body = None
+    logging.warning(f'Could not send mail {message.id} to {message.recipients}: {error}')
+
+
+@job('deliver_mail', every=timedelta(minutes=1))
+def deliver_outbox(batch_size=50, max_batches=None):
+    """Send queued messages, one SMTP connection per batch. Returns (sent, failed).
+
+    Failed messages are retried with exponential backoff up to MAX_ATTEMPTS
+    times. If the connection itself fails, the rest of the batch is retried.
+    Expired messages are deleted unsent.
+    """
+    expired = [
+        message_id for message_id, in
+        db.session.query(OutboxMessage.id).filter(OutboxMessage.expires_at <= datetime.utcnow())
+    ]
+    if expired:
+        OutboxMessage.query.filter(OutboxMessage.id.in_(expired)).delete(synchronize_session=False)
+        db.session.commit()
+        logging.warning(f'Dropped {len(expired)} expired mails')
+    sent = failed = batches = 0
+    while max_batches is None or batches < max_batches:
+        batch = _claim_batch(batch_size)
+        if not batch:
+            break
+        batches += 1
+
+        sent_ids, done = [], set()
+        try:
+            with mail.connect() as conn:
+                for message in batch:
+                    try:
+                        conn.send(Message(
+                            subject=message.subject,
+                            recipients=message.recipients,
+                            html=message.html,
+                            body=message.body,
+                            sender=message.sender,
+                        ))
+                        sent_ids.append(message.id)
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except Exception as e:
+                        _failed(message, e)
+                        failed += 1
+                    done.add(message.id)
+        except Exception as e:
+            for message in batch:
+                if message.id not in done:
+                    _failed(message, e)
+                    failed += 1
+
+        if sent_ids:
+            OutboxMessage.query.filter(OutboxMessage.id.in_(sent_ids)).delete(synchronize_session=False)
+        db.session.commit()
+        sent += len(sent_ids)
+
+        if len(batch) < batch_size:
+            break
+    return sent, failed
+
+
+def outbox_status():
+    """Queue depth: messages waiting, messages given up on, age of the oldest waiting one."""
+    pending = OutboxMessage.query.filter(OutboxMessage.attempts < MAX_ATTEMPTS)
+    oldest = pending.with_entities(db.func.min(OutboxMessage.queued_at)).scalar()
+    return {
+        'pending': pending.count(),
+        'failed': OutboxMessage.query.filter(OutboxMessage.attempts >= MAX_ATTEMPTS).count(),
+        'oldest_age': int((datetime.utcnow() - oldest).total_seconds()) if oldest else None,
+    }
+
+
+class OutboxSender:
+    """A background thread per process that delivers the outbox when kicked.
+
+    Requests that queued mail kick it after their commit. Retries and mail
+    left behind by a stopped process are picked up by the periodic
+    deliver_mail job.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._thread = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def kick(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._loop, name='outbox-sender', daemon=True)
+                    self._thread.start()
+        self._wakeup.set()
+
+    def _loop(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self.app.app_context():
+                try:
+                    deliver_outbox()
+                except Exception:
+                    db.session.rollback()
+                    logging.exception('Outbox delivery failed')
+
+
+@event.listens_for(db.session, 'after_commit')
+def _kick_after_commit(session):
+    # Only kick from requests: CLI commands flush the outbox themselves and
+    # could exit in the middle of a background delivery
+    if session.info.pop('outbox_kick', False) and has_request_context():
+        current_app.extensions['outbox_sender'].kick()
+
+
+def init_outbox(app):
+    sender = OutboxSender(app)
+    app.extensions['outbox_sender'] = sender
+    return sender
@@ -0,0 +1,91 @@
+import fcntl
+import os
+import time
+from contextlib import contextmanager
+
+from flask import current_app
+
+from app.extensions import bcrypt
+
+
+class HashingBusy(Exception):
+    """All password-hashing slots stayed busy for BCRYPT_WAIT_TIMEOUT seconds."""
+
+
+class HashingSlots:
+    """Caps concurrent bcrypt work across all worker processes of one host.
+
+    Each slot is a lock file below the instance folder. flock() locks are
+    held per open file, so the cap applies to threads and to gunicorn
+    workers alike, and a lock is released when a worker dies.
+    """
+
+    def __init__(self, directory, slots, wait_timeout):
+        os.makedirs(directory, exist_ok=True)
+        self.paths = [os.path.join(directory, f'bcrypt-{i}.lock') for i in range(slots)]
+        self.wait_timeout = wait_timeout
+
+    def _try_acquire(self):
+        for path in self.paths:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                os.close(fd)
+        return None
+
+    @contextmanager
+    def acquire(self):
+        deadline = time.monotonic() + self.wait_timeout
+        fd = self._try_acquire()
+        while fd is None:
+            if time.monotonic() >= deadline:
+                raise HashingBusy()
+            time.sleep(0.01)
+            fd = self._try_acquire()
+        try:
+            yield
+        finally:
+            os.close(fd)
+
+
+def _slots():
+    return current_app.extensions['hashing_slots']
+
+
+def hash_password(password):
+    with _slots().acquire():
+        return bcrypt.generate_password_hash(password)
+
+
+def check_password(pw_hash, password):
+    if not pw_hash:
+        return False
+    with _slots().acquire():
+        return bcrypt.check_password_hash(pw_hash, password)
+
+
+def hash_rounds(pw_hash):
+    """Cost factor of a bcrypt hash ('$2b$12$...' -> 12)."""
+    if isinstance(pw_hash, bytes):
+        pw_hash = pw_hash.decode('ascii')
+    try:
+        return int(pw_hash.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(pw_hash):
+    return hash_rounds(pw_hash) != current_app.config['BCRYPT_LOG_ROUNDS']
+
+
+def init_passwords(app):
+    slots = app.config.get('BCRYPT_MAX_CONCURRENCY') or max(1, (os.cpu_count() or 2) // 2)
+    hashing_slots = HashingSlots(
+        os.path.join(app.instance_path, 'locks'),
+        slots,
+        app.config.get('BCRYPT_WAIT_TIMEOUT', 1.0),
+    )
+    app.extensions['hashing_slots'] = hashing_slots
+    return hashing_slots
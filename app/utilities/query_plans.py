@@ -0,0 +1,115 @@
+import re
+
+from sqlalchemy import event, func
+
+from app.extensions import db
+from app.models.auth import User, Role, TeamMembership, user_role_table
+from app.models.stats import UserStats
+from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
+from app.utilities.account_lists import shape_page, stencil_page
+from app.utilities.rollups import (
+    account_stats, recent_download_counts, forget_content, forget_user,
+)
+from app.utilities.status_mail import build_reports
+
+_SCAN = re.compile(r'^SCAN (\w+)$')
+_ALIAS = re.compile(r'(\w+) AS (\w+)')
+
+
+def _scenarios(user_id, team_id):
+    """The queries behind the pages and jobs that must not scan whole tables."""
+    return [
+        ('account statistics', lambda: account_stats(user_id)),
+        ('account 30-day figures', lambda: recent_download_counts(user_id)),
+        ('account content lists', lambda: (
+            shape_page(user_id), shape_page(user_id, 'a', after=1000),
+            stencil_page(user_id), stencil_page(user_id, 'a', after=1000),
+        )),
+        ('status mail', lambda: build_reports(('day', 'week', 'month'))),
+        ('team access', lambda: (
+            TeamMembership.query.filter_by(user_id=user_id, team_id=team_id).first(),
+            TeamMembership.query.filter_by(team_id=team_id).all(),
+            Shape.query.filter_by(team_id=team_id).order_by(Shape.upload_date.desc()).all(),
+            Stencil.query.filter_by(team_id=team_id).order_by(Stencil.upload_date.desc()).all(),
+        )),
+        ('admin user list', lambda: [
+            db.session.query(User, UserStats.shapes).outerjoin(UserStats, UserStats.user_id == User.id)
+            .order_by(order, User.id.desc()).limit(50).all()
+            for order in (User.register_date.desc(), User.last_active.desc().nulls_last())
+        ]),
+        ('admin user detail', lambda: [
+            section(user_id).limit(51).all() for section in _admin_detail_sections()
+        ]),
+        ('user search', lambda: [_user_search(q).all() for q in ('a', 'max%_', 'x@example')]),
+        ('team admin', lambda: (
+            TeamMembership.query.filter(TeamMembership.team_id.in_([team_id])).all(),
+            db.session.query(Shape.team_id, func.count(Shape.id)).filter(Shape.team_id.isnot(None)).group_by(Shape.team_id).all(),
+            db.session.query(Stencil.team_id, func.count(Stencil.id)).filter(Stencil.team_id.isnot(None)).group_by(Stencil.team_id).all(),
+        )),
+        ('user roles', lambda: Role.query.join(user_role_table).filter(user_role_table.c.user_id == user_id).all()),
+        ('stencil deletion', lambda: (
+            db.session.query(Shape.id).filter(Shape.stencil_id == 1).all(),
+            forget_content(shape_ids=[1], stencil_ids=[1]),
+        )),
+        ('user deletion', lambda: (
+            db.session.query(Shape.id).filter(Shape.user_id == user_id).order_by(Shape.id).limit(200).all(),
+            db.session.query(Stencil.id).filter(Stencil.user_id == user_id).order_by(Stencil.id).limit(200).all(),
+            db.session.query(ShapeDownload.id).filter(ShapeDownload.shape_id.in_([1])).limit(5000).all(),
+            db.session.query(ShapeDownload.id).filter(ShapeDownload.user_id == user_id).limit(5000).all(),
+            db.session.query(StencilDownload.id).filter(StencilDownload.stencil_id.in_([1])).limit(5000).all(),
+            db.session.query(StencilDownload.id).filter(StencilDownload.user_id == user_id).limit(5000).all(),
+            forget_user(user_id),
+        )),
+    ]
+
+
+def _admin_detail_sections():
+    from app.blueprints.admin.routes import DETAIL_SECTIONS
+    return DETAIL_SECTIONS.values()
+
+
+def _user_search(q):
+    from app.blueprints.admin.routes import user_search
+    return user_search(q)
+
+
+def _full_scans(statement, plan):
+    tables = db.metadata.tables
+    aliases = {alias: table for table, alias in _ALIAS.findall(statement) if table in tables}
+    scans = []
+    for detail in plan:
+        match = _SCAN.match(detail)
+        if match:
+            name = aliases.get(match.group(1), match.group(1))
+            if name in tables:
+                scans.append(name)
+    return scans
+
+
+def check_query_plans(user_id=1, team_id=1):
+    """Run the key queries and EXPLAIN each of them (SQLite only).
+
+    Returns a list of (scenario, statement, plan lines, tables scanned in
+    full). Everything runs in a transaction that is rolled back.
+    """
+    connection = db.session.connection()
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and not statement.startswith('EXPLAIN'):
+            captured.append((statement, parameters))
+
+    results = []
+    event.listen(connection, 'before_cursor_execute', capture)
+    try:
+        for name, run in _scenarios(user_id, team_id):
+            captured.clear()
+            run()
+            db.session.flush()
+            for statement, parameters in list(captured):
+                plan = [row[3] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+                results.append((name, statement, plan, _full_scans(statement, plan)))
+    finally:
+        event.remove(connection, 'before_cursor_execute', capture)
+        db.session.rollback()
+    return results
@@ -0,0 +1,582 @@
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import case, delete, func, insert, select, literal, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import defer, selectinload
+
+from app.extensions import db
+from app.models.stats import UserStats, ShapeUsage, StencilUsage, UserReach, DownloadDaily, RollupWatermark
+from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
+from app.utilities.download_archive import CompactionBusy, archive_downloads, compaction_lock
+from app.utilities.jobs import job
+from app.utilities.transactions import begin_write
+
+CHUNK = 500
+# Seconds between two delete batches, so requests get the write lock in between
+RETIRE_PAUSE = 0.05
+COUNTERS = [c.name for c in UserStats.__table__.columns if c.name != 'user_id']
+
+# user_id -> (counters, time computed, statistics JSON). Per process. Every
+# download by or of the user changes the counters, so an entry is never
+# served after such a download, whichever worker recorded it.
+_stats_cache = {}
+_stats_cache_lock = threading.Lock()
+
+
+class _Kind:
+    def __init__(self, name, item, raw, usage, item_col, used, foreign, by_others, reach):
+        self.name = name
+        self.item = item
+        self.raw = raw
+        self.usage = usage
+        self.item_col = item_col
+        self.used = used
+        self.foreign = foreign
+        self.by_others = by_others
+        self.reach = reach
+
+
+SHAPE = _Kind('shape', Shape, ShapeDownload, ShapeUsage, 'shape_id',
+              'shapes_used', 'foreign_shapes_used', 'shapes_used_by_others', 'users_used_my_shapes')
+STENCIL = _Kind('stencil', Stencil, StencilDownload, StencilUsage, 'stencil_id',
+                'stencils_downloaded', 'foreign_stencils_downloaded', 'stencils_downloaded_by_others',
+                'users_downloaded_my_stencils')
+
+
+def _insert(model):
+    if db.session.get_bind().dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def _bump_user(user_id, **increments):
+    increments = {k: v for k, v in increments.items() if v}
+    if not increments:
+        return
+    stmt = _insert(UserStats).values(user_id=user_id, **increments)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['user_id'],
+        set_={k: getattr(UserStats, k) + stmt.excluded[k] for k in increments},
+    ))
+
+
+def _count_downloads(kind, items, user_id):
+    """Update the rollups for downloads of items ((item_id, owner_id) pairs) by user_id."""
+    own = defaultdict(int)
+    owners = defaultdict(lambda: defaultdict(int))
+    for item_id, owner_id in items:
+        stmt = _insert(kind.usage).values({kind.item_col: item_id, 'user_id': user_id, 'owner_id': owner_id, 'count': 1})
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=[kind.item_col, 'user_id'],
+            set_={'count': kind.usage.count + stmt.excluded.count},
+        ))
+        own[kind.used] += 1
+        if owner_id != user_id:
+            own[kind.foreign] += 1
+            owners[owner_id][kind.by_others] += 1
+
+    _bump_user(user_id, **own)
+    for owner_id, increments in owners.items():
+        reached = db.session.execute(
+            _insert(UserReach).values(owner_id=owner_id, user_id=user_id, kind=kind.name).on_conflict_do_nothing()
+        )
+        if reached.rowcount == 1:
+            increments[kind.reach] = 1
+        _bump_user(owner_id, **increments)
+
+
+def record_shape_download(shape, user_id):
+    """Record a shape download and update the rollups, in the current transaction."""
+    db.session.add(ShapeDownload(shape_id=shape.id, user_id=user_id))
+    _count_downloads(SHAPE, [(shape.id, shape.user_id)], user_id)
+
+
+def record_stencil_downloads(stencils, user_id):
+    """Record downloads of stencils ((stencil_id, owner_id) pairs) and update the rollups."""
+    stencils = list(stencils)
+    if not stencils:
+        return
+    db.session.execute(insert(StencilDownload), [{'stencil_id': stencil_id, 'user_id': user_id} for stencil_id, _ in stencils])
+    _count_downloads(STENCIL, stencils, user_id)
+
+
+def count_new_content(user_id, shapes=0, stencils=0):
+    _bump_user(user_id, shapes=shapes, stencils=stencils)
+
+
+def forget_content(shape_ids=(), stencil_ids=()):
+    """Drop the usage rows of shapes and stencils that are being deleted.
+
+    Returns the ids of all users whose totals change; pass them to
+    refresh_user_stats() once the content itself is deleted.
+    """
+    affected = set()
+    for kind, ids in ((SHAPE, list(shape_ids)), (STENCIL, list(stencil_ids))):
+        item_col = getattr(kind.usage, kind.item_col)
+        for i in range(0, len(ids), CHUNK):
+            chunk = ids[i:i + CHUNK]
+            pairs = db.session.query(kind.usage.user_id, kind.usage.owner_id).filter(item_col.in_(chunk)).distinct()
+            for user_id, owner_id in pairs:
+                affected.update((user_id, owner_id))
+            kind.usage.query.filter(item_col.in_(chunk)).delete(synchronize_session=False)
+            DownloadDaily.query.filter(
+                DownloadDaily.kind == kind.name, DownloadDaily.item_id.in_(chunk)
+            ).delete(synchronize_session=False)
+    return affected
+
+
+def forget_user(user_id):
+    """Drop all rollups of a user who is being deleted. Returns the other users affected."""
+    affected = set()
+    for kind in (SHAPE, STENCIL):
+        rows = db.session.query(kind.usage.user_id, kind.usage.owner_id).filter(
+            db.or_(kind.usage.user_id == user_id, kind.usage.owner_id == user_id)
+        ).distinct()
+        for downloader_id, owner_id in rows:
+            affected.update((downloader_id, owner_id))
+        kind.usage.query.filter(
+            db.or_(kind.usage.user_id == user_id, kind.usage.owner_id == user_id)
+        ).delete(synchronize_session=False)
+    UserReach.query.filter(db.or_(UserReach.user_id == user_id, UserReach.owner_id == user_id)).delete(synchronize_session=False)
+    UserStats.query.filter(UserStats.user_id == user_id).delete(synchronize_session=False)
+    DownloadDaily.query.filter(
+        db.or_(DownloadDaily.user_id == user_id, DownloadDaily.owner_id == user_id)
+    ).delete(synchronize_session=False)
+    affected.discard(user_id)
+    return affected
+
+
+def _grouped(query, key, only):
+    if only is not None:
+        query = query.filter(key.in_(only))
+    return dict(query.group_by(key).all())
+
+
+def _refresh_chunk(only):
+    totals = defaultdict(dict)
+
+    def collect(counter, values):
+        for user_id, value in values.items():
+            totals[user_id][counter] = value
+
+    collect('shapes', _grouped(db.session.query(Shape.user_id, func.count(Shape.id)), Shape.user_id, only))
+    collect('stencils', _grouped(db.session.query(Stencil.user_id, func.count(Stencil.id)), Stencil.user_id, only))
+    for kind in (SHAPE, STENCIL):
+        usage = kind.usage
+        foreign = usage.owner_id != usage.user_id
+        collect(kind.used, _grouped(db.session.query(usage.user_id, func.sum(usage.count)), usage.user_id, only))
+        collect(kind.foreign, _grouped(
+            db.session.query(usage.user_id, func.sum(usage.count)).filter(foreign), usage.user_id, only))
+        collect(kind.by_others, _grouped(
+            db.session.query(usage.owner_id, func.sum(usage.count)).filter(foreign), usage.owner_id, only))
+        collect(kind.reach, _grouped(
+            db.session.query(usage.owner_id, func.count(func.distinct(usage.user_id))).filter(foreign), usage.owner_id, only))
+
+        reach = UserReach.query.filter(UserReach.kind == kind.name)
+        pairs = select(usage.owner_id, usage.user_id, literal(kind.name)).where(foreign).distinct()
+        if only is not None:
+            reach = reach.filter(UserReach.owner_id.in_(only))
+            pairs = pairs.where(usage.owner_id.in_(only))
+        reach.delete(synchronize_session=False)
+        db.session.execute(insert(UserReach).from_select(['owner_id', 'user_id', 'kind'], pairs))
+
+    stats = UserStats.query
+    if only is not None:
+        stats = stats.filter(UserStats.user_id.in_(only))
+    stats.delete(synchronize_session=False)
+    rows = [{'user_id': user_id, **{c: values.get(c, 0) for c in COUNTERS}} for user_id, values in totals.items()]
+    if rows:
+        db.session.execute(insert(UserStats), rows)
+
+
+def refresh_user_stats(user_ids=None):
+    """Recompute user_stats and user_reach from the usage tables, for user_ids or for everybody."""
+    if user_ids is None:
+        _refresh_chunk(None)
+        return
+    user_ids = sorted(user_ids)
+    for i in range(0, len(user_ids), CHUNK):
+        _refresh_chunk(user_ids[i:i + CHUNK])
+
+
+def rebuild_rollups():
+    """Rebuild the usage and user tables from download_daily and the raw download tables.
+
+    Returns the number of usage rows.
+    """
+    for model in (UserReach, UserStats, ShapeUsage, StencilUsage):
+        model.query.delete(synchronize_session=False)
+    for kind in (SHAPE, STENCIL):
+        window = download_window(kind).subquery()
+        db.session.execute(insert(kind.usage).from_select(
+            [kind.item_col, 'user_id', 'owner_id', 'count'],
+            select(window.c.item_id, window.c.user_id, window.c.owner_id, func.sum(window.c.count))
+            .group_by(window.c.item_id, window.c.user_id, window.c.owner_id)
+        ))
+    refresh_user_stats()
+    db.session.commit()
+    return ShapeUsage.query.count() + StencilUsage.query.count()
+
+
+# ── Daily buckets ──
+
+def _watermark(kind):
+    return db.session.query(RollupWatermark.last_id).filter(RollupWatermark.name == kind.raw.__tablename__).scalar() or 0
+
+
+def _marks(kind):
+    """(last folded id, retired_before) of kind's raw table."""
+    row = (db.session.query(RollupWatermark.last_id, RollupWatermark.retired_before)
+           .filter(RollupWatermark.name == kind.raw.__tablename__).first())
+    return (row.last_id, row.retired_before) if row else (0, None)
+
+
+def _day_start(day):
+    return datetime.combine(day, datetime.min.time())
+
+
+def _retention_start(days):
+    """Start of the oldest day whose raw download events are kept for days."""
+    return _day_start((datetime.utcnow() - timedelta(days=days)).date())
+
+
+def download_window(kind, since=None):
+    """Downloads since `since` (or all) as rows of (item_id, user_id, owner_id, count).
+
+    Whole days are read from download_daily. Raw events are only read for the
+    first, partial day and for the events the compactor has not folded in yet.
+    If the raw events of the first day are already retired, the whole day counts.
+    """
+    raw = kind.raw
+    raw_item = getattr(raw, kind.item_col)
+    raw_rows = (
+        select(raw_item.label('item_id'), raw.user_id, kind.item.user_id.label('owner_id'), literal(1).label('count'))
+        .join(kind.item, kind.item.id == raw_item)
+    )
+    buckets = (
+        select(DownloadDaily.item_id, DownloadDaily.user_id, DownloadDaily.owner_id, DownloadDaily.count)
+        .where(DownloadDaily.kind == kind.name)
+    )
+    last_id, retired_before = _marks(kind)
+    unfolded = raw_rows.where(raw.id > last_id)
+    if since is None:
+        return union_all(buckets, unfolded)
+
+    parts = []
+    first_day = since.date()
+    if since > _day_start(first_day) and (retired_before is None or since >= retired_before):
+        first_day += timedelta(days=1)
+        parts.append(raw_rows.where(raw.date >= since, raw.date < _day_start(first_day)))
+    parts.append(buckets.where(DownloadDaily.day >= first_day))
+    parts.append(unfolded.where(raw.date >= _day_start(first_day)))
+    return union_all(*parts)
+
+
+def recent_download_counts(user_id, days=30):
+    """Downloads in the last days: of user_id's content by others, and by user_id. Per kind."""
+    since = datetime.utcnow() - timedelta(days=days)
+    counts = {}
+    for kind in (SHAPE, STENCIL):
+        window = download_window(kind, since).subquery()
+        by_others, by_me = db.session.execute(
+            select(
+                func.coalesce(func.sum(case(
+                    (db.and_(window.c.owner_id == user_id, window.c.user_id != user_id), window.c.count), else_=0)), 0),
+                func.coalesce(func.sum(case((window.c.user_id == user_id, window.c.count), else_=0)), 0),
+            ).where(db.or_(window.c.owner_id == user_id, window.c.user_id == user_id))
+        ).one()
+        counts[kind.name] = {'by_others': by_others, 'by_me': by_me}
+    return counts
+
+
+def _fold(kind, batch_size):
+    """Fold the next batch_size raw events of kind into download_daily. Returns the events read."""
+    raw = kind.raw
+    raw_item = getattr(raw, kind.item_col)
+    last_id = _watermark(kind)
+    batch = select(raw.id).where(raw.id > last_id).order_by(raw.id).limit(batch_size).subquery()
+    upper, events = db.session.query(func.max(batch.c.id), func.count(batch.c.id)).one()
+    if not events:
+        return 0
+
+    # SQLite has one writer at a time and the raw tables use AUTOINCREMENT,
+    # so download ids become visible in order and are never reused: no
+    # event below the watermark can show up later, even after the newest
+    # events were deleted.
+    # Events of deleted content drop out through the join.
+    day = func.date(raw.date)
+    stmt = _insert(DownloadDaily).from_select(
+        ['day', 'kind', 'item_id', 'user_id', 'owner_id', 'count'],
+        select(day, literal(kind.name), raw_item, raw.user_id, kind.item.user_id, func.count(raw.id))
+        .join(kind.item, kind.item.id == raw_item)
+        .where(raw.id > last_id, raw.id <= upper)
+        .group_by(day, raw_item, raw.user_id, kind.item.user_id)
+    )
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['day', 'kind', 'item_id', 'user_id'],
+        set_={'count': DownloadDaily.count + stmt.excluded.count},
+    ))
+    mark = _insert(RollupWatermark).values(name=raw.__tablename__, last_id=upper)
+    db.session.execute(mark.on_conflict_do_update(index_elements=['name'], set_={'last_id': mark.excluded.last_id}))
+    db.session.commit()
+    return events
+
+
+def _retire(kind, before, batch_size, pause=RETIRE_PAUSE):
+    """Delete folded raw events older than before, batch_size rows per transaction.
+
+    First moves retired_before, so time windows count the days before it
+    from download_daily only, whether or not their raw events are gone.
+    With DOWNLOAD_ARCHIVE_DIR set, only events that were written to an
+    archive file are deleted. Returns the number of events deleted.
+    """
+    raw = kind.raw
+    begin_write()
+    last_id, retired_before = _marks(kind)
+    if retired_before is None or retired_before < before:
+        mark = _insert(RollupWatermark).values(name=raw.__tablename__, last_id=last_id, retired_before=before)
+        db.session.execute(mark.on_conflict_do_update(index_elements=['name'], set_={'retired_before': before}))
+    db.session.commit()
+
+    criteria = [raw.id <= last_id, raw.date < before]
+    if current_app.config['DOWNLOAD_ARCHIVE_DIR']:
+        upper = archive_downloads(raw, *criteria)
+        if upper is None:
+            return 0
+        criteria.append(raw.id <= upper)
+    deleted = 0
+    while True:
+        begin_write()
+        batch = select(raw.id).where(*criteria).order_by(raw.id).limit(batch_size)
+        result = db.session.execute(delete(raw).where(raw.id.in_(batch)))
+        db.session.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+        time.sleep(pause)
+
+
+def _fold_all(batch_size):
+    folded = 0
+    for kind in (SHAPE, STENCIL):
+        while True:
+            events = _fold(kind, batch_size)
+            folded += events
+            if events < batch_size:
+                break
+    return folded
+
+
+@job('roll_up_downloads', every=timedelta(minutes=5))
+def roll_up_downloads(batch_size=5000):
+    """Fold new download events into download_daily, then retire raw events past DOWNLOAD_RETENTION_DAYS.
+
+    Skipped while `flask compact-downloads` runs. Returns (events folded,
+    raw events deleted).
+    """
+    try:
+        with compaction_lock(wait=False):
+            folded = _fold_all(batch_size)
+            retired = 0
+            days = current_app.config['DOWNLOAD_RETENTION_DAYS']
+            if days:
+                for kind in (SHAPE, STENCIL):
+                    retired += _retire(kind, _retention_start(days), batch_size)
+    except CompactionBusy:
+        logging.info('Download compaction is running, roll-up skipped')
+        return 0, 0
+    if folded or retired:
+        logging.info(f'Rolled up {folded} download events, retired {retired}')
+    return folded, retired
+
+
+def compact_downloads(days, batch_size=1000, pause=RETIRE_PAUSE):
+    """Fold all new download events, then archive and delete the raw events older than days.
+
+    Every statistic keeps its value: lifetime figures come from the usage
+    tables, time windows from download_daily. Waits for a running
+    roll-up job to finish. Returns (events folded, raw events deleted).
+    """
+    with compaction_lock():
+        folded = _fold_all(batch_size)
+        before = _retention_start(days)
+        retired = sum(_retire(kind, before, batch_size, pause) for kind in (SHAPE, STENCIL))
+    logging.info(f'Compacted downloads before {before:%Y-%m-%d}: folded {folded}, retired {retired}')
+    return folded, retired
+
+
+def _top(name, query):
+    sub = query.limit(5).subquery()
+    return select(literal(name).label('list'), sub.c.item_id, sub.c.cnt)
+
+
+def user_counters(user_id):
+    row = UserStats.query.filter_by(user_id=user_id).first()
+    return {c: getattr(row, c) if row else 0 for c in COUNTERS}
+
+
+def account_stats(user_id, counters=None):
+    """Lifetime statistics and top-5 lists of the account page, read from the rollups."""
+    stats = dict(counters or user_counters(user_id))
+
+    tops = union_all(
+        _top('top_own_shapes', select(ShapeUsage.shape_id.label('item_id'), func.sum(ShapeUsage.count).label('cnt'))
+             .where(ShapeUsage.owner_id == user_id, ShapeUsage.user_id != user_id)
+             .group_by(ShapeUsage.shape_id).order_by(func.sum(ShapeUsage.count).desc(), ShapeUsage.shape_id)),
+        _top('top_own_stencils', select(StencilUsage.stencil_id.label('item_id'), func.sum(StencilUsage.count).label('cnt'))
+             .where(StencilUsage.owner_id == user_id, StencilUsage.user_id != user_id)
+             .group_by(StencilUsage.stencil_id).order_by(func.sum(StencilUsage.count).desc(), StencilUsage.stencil_id)),
+        _top('top_used_shapes', select(ShapeUsage.shape_id.label('item_id'), ShapeUsage.count.label('cnt'))
+             .where(ShapeUsage.user_id == user_id).order_by(ShapeUsage.count.desc(), ShapeUsage.shape_id)),
+        _top('top_downloaded_stencils', select(StencilUsage.stencil_id.label('item_id'), StencilUsage.count.label('cnt'))
+             .where(StencilUsage.user_id == user_id).order_by(StencilUsage.count.desc(), StencilUsage.stencil_id)),
+        _top('top_foreign_shapes', select(ShapeUsage.shape_id.label('item_id'), ShapeUsage.count.label('cnt'))
+             .where(ShapeUsage.user_id == user_id, ShapeUsage.owner_id != user_id)
+             .order_by(ShapeUsage.count.desc(), ShapeUsage.shape_id)),
+        _top('top_foreign_stencils', select(StencilUsage.stencil_id.label('item_id'), StencilUsage.count.label('cnt'))
+             .where(StencilUsage.user_id == user_id, StencilUsage.owner_id != user_id)
+             .order_by(StencilUsage.count.desc(), StencilUsage.stencil_id)),
+    )
+    lists = defaultdict(list)
+    for name, item_id, cnt in db.session.execute(tops):
+        lists[name].append((item_id, cnt))
+
+    shape_lists = ('top_own_shapes', 'top_used_shapes', 'top_foreign_shapes')
+    stencil_lists = ('top_own_stencils', 'top_downloaded_stencils', 'top_foreign_stencils')
+    shape_ids = {item_id for name in shape_lists for item_id, _ in lists[name]}
+    stencil_ids = {item_id for name in stencil_lists for item_id, _ in lists[name]}
+    shapes = stencils = {}
+    if shape_ids:
+        shapes = {s.id: s for s in Shape.query.options(defer(Shape.data_object), selectinload(Shape.user))
+                  .filter(Shape.id.in_(shape_ids))}
+    if stencil_ids:
+        stencils = {s.id: s for s in Stencil.query.options(selectinload(Stencil.user)).filter(Stencil.id.in_(stencil_ids))}
+
+    for names, objects in ((shape_lists, shapes), (stencil_lists, stencils)):
+        for name in names:
+            ranked = sorted(lists[name], key=lambda t: (-t[1], t[0]))
+            stats[name] = [(objects[i], cnt) for i, cnt in ranked if i in objects]
+    return stats
+
+
+def _item_json(kind, obj, cnt):
+    return {
+        'kind': kind,
+        'id': obj.id,
+        'name': obj.name if kind == 'shape' else obj.title,
+        'user_id': obj.user_id,
+        'user_name': obj.user.name,
+        'count': cnt,
+    }
+
+
+def cached_account_stats(user_id):
+    """account_stats() and the 30-day figures as JSON, cached for ACCOUNT_STATS_TTL seconds."""
+    counters = user_counters(user_id)
+    now = time.monotonic()
+    ttl = current_app.config['ACCOUNT_STATS_TTL']
+    cached = _stats_cache.get(user_id)
+    if cached and cached[0] == counters and now - cached[1] < ttl:
+        return cached[2]
+
+    stats = account_stats(user_id, counters)
+    result = {'user_id': user_id}
+    for key, value in stats.items():
+        if key.startswith('top_'):
+            kind = 'shape' if key.endswith('shapes') else 'stencil'
+            value = [_item_json(kind, obj, cnt) for obj, cnt in value]
+        result[key] = value
+    recent = recent_download_counts(user_id, days=30)
+    result.update({
+        'shapes_used_by_others_30d': recent['shape']['by_others'],
+        'stencils_downloaded_by_others_30d': recent['stencil']['by_others'],
+        'shapes_used_30d': recent['shape']['by_me'],
+        'stencils_downloaded_30d': recent['stencil']['by_me'],
+    })
+
+    with _stats_cache_lock:
+        if len(_stats_cache) >= 1000:
+            for key in [k for k, v in _stats_cache.items() if now - v[1] >= ttl]:
+                del _stats_cache[key]
+        _stats_cache[user_id] = (counters, now, result)
+    return result
+
+
+def benchmark_account_stats(days, per_day=1000, users=50, items=500, requests=20):
+    """Time the account statistics while the download history grows, on a copy of the database.
+
+    Downloads are seeded at per_day a day, among users new users and items
+    new shapes and stencils, and the history is extended backwards to each
+    number of days in turn. Yields (days, raw download events, ms per
+    account_stats(), ms per cached_account_stats() with an empty cache).
+    """
+    from app.models.auth import User
+    from app.utilities.database import copy_database, copy_settings, settings_app
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'benchmark.db')
+        copy_database(database)
+        app = settings_app(copy_settings(database))
+        with app.app_context():
+            tag = os.urandom(4).hex()
+            db.session.execute(insert(User), [
+                {'name': f'stats-benchmark-{tag}-{i}', 'email': f'stats-benchmark-{tag}-{i}@example.invalid',
+                 'password_hash': '!'} for i in range(users)
+            ])
+            user_ids = [user_id for user_id, in db.session.query(User.id).filter(User.name.like(f'stats-benchmark-{tag}-%'))]
+            db.session.execute(insert(Shape), [
+                {'name': f'shape {i}', 'prompt': '', 'keywords': '', 'data_object': '', 'user_id': user_ids[i % users]}
+                for i in range(items)
+            ])
+            db.session.execute(insert(Stencil), [
+                {'file_name': f'{i}.vssx', 'title': f'stencil {i}', 'subject': '', 'author': '', 'manager': '',
+                 'company': '', 'language': '', 'categories': '', 'tags': '', 'comments': '', 'user_id': user_ids[i % users]}
+                for i in range(max(1, items // 10))
+            ])
+            db.session.commit()
+            owners = {}
+            for kind in (SHAPE, STENCIL):
+                owners[kind.name] = db.session.query(kind.item.id).filter(kind.item.user_id.in_(user_ids)).all()
+
+            rng = random.Random(0)
+            now = datetime.utcnow()
+            seeded = events = 0
+            for until in sorted(days):
+                # Older days, a fifth of the downloads are stencil downloads
+                for day in range(seeded, until):
+                    start = now - timedelta(days=day + 1)
+                    for kind, share in ((SHAPE, 0.8), (STENCIL, 0.2)):
+                        db.session.execute(insert(kind.raw), [
+                            {kind.item_col: rng.choice(owners[kind.name])[0], 'user_id': rng.choice(user_ids),
+                             'date': start + timedelta(seconds=rng.random() * 86400)}
+                            for _ in range(int(per_day * share))
+                        ])
+                    db.session.commit()
+                seeded = until
+                events = ShapeDownload.query.count() + StencilDownload.query.count()
+                _fold_all(5000)
+                rebuild_rollups()
+
+                timings = []
+                for measure in (lambda user_id: account_stats(user_id),
+                                lambda user_id: (_stats_cache.clear(), cached_account_stats(user_id))):
+                    measure(user_ids[0])
+                    start = time.perf_counter()
+                    for i in range(requests):
+                        measure(user_ids[i % users])
+                        db.session.rollback()
+                    timings.append((time.perf_counter() - start) * 1000 / requests)
+                yield until, events, timings[0], timings[1]
+
+            _stats_cache.clear()
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
@@ -1,81 +1,112 @@
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from sqlalchemy import func, literal, select, union_all
 from app.models.auth import User
-from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
-from app.extensions import db, mail
+from app.models.visio import Shape, Stencil
+from app.extensions import db
+from app.utilities.database import reading
+from app.utilities.outbox import queue_mail
+from app.utilities.rollups import SHAPE, STENCIL, download_window
 from flask import current_app
 from flask_mail import Message
 
-
-def send_status_mail():
-    """Query last-24h stats and send a status e-mail to OWNER_EMAIL."""
-    status_email = current_app.config.get('STATUS_EMAIL', '')
-    if not status_email:
-        current_app.logger.warning('send_status_mail: STATUS_EMAIL not set – skipping.')
-        return
-
-    since = datetime.utcnow() - timedelta(hours=24)
-    date_str = datetime.utcnow().strftime('%Y-%m-%d')
-
-    # ── New users ─────────────────────────────────────────────────────────────
+# name → (length, title, period shown in the mail)
+REPORT_WINDOWS = {
+    'day':   (timedelta(days=1),  'Daily',   'letzte 24 Stunden'),
+    'week':  (timedelta(days=7),  'Weekly',  'letzte 7 Tage'),
+    'month': (timedelta(days=30), 'Monthly', 'letzte 30 Tage'),
+}
+ACTIVITY = ['shapes_added', 'stencils_added', 'shapes_used', 'stencils_dl']
+
+
+def _part(window, user_id, **counts):
+    return [literal(window).label('window'), user_id.label('user_id')] + [
+        counts.get(name, literal(0)).label(name) for name in ACTIVITY
+    ]
+
+
+def activity_rows(windows, now):
+    """Activity per window and user in one statement, busiest users first.
+
+    Every source is grouped by user before the union, the downloads come
+    from the daily rollups, and the users are joined once at the end.
+    Returns rows of (window, name, *ACTIVITY).
+    """
+    parts = []
+    for window in windows:
+        since = now - REPORT_WINDOWS[window][0]
+        parts.append(select(*_part(window, Shape.user_id, shapes_added=func.count(Shape.id)))
+                     .where(Shape.upload_date >= since).group_by(Shape.user_id))
+        parts.append(select(*_part(window, Stencil.user_id, stencils_added=func.count(Stencil.id)))
+                     .where(Stencil.upload_date >= since).group_by(Stencil.user_id))
+        for kind, name in ((SHAPE, 'shapes_used'), (STENCIL, 'stencils_dl')):
+            downloads = download_window(kind, since).subquery()
+            parts.append(select(*_part(window, downloads.c.user_id, **{name: func.sum(downloads.c.count)}))
+                         .group_by(downloads.c.user_id))
+    c = union_all(*parts).subquery().c
+    return db.session.execute(
+        select(c.window, User.name, *[func.sum(c[name]) for name in ACTIVITY])
+        .join(User, User.id == c.user_id)
+        .group_by(c.window, User.id, User.name)
+        .order_by(func.sum(c.shapes_added + c.stencils_added + c.shapes_used + c.stencils_dl).desc(), User.name)
+    ).all()
+
+
+def build_reports(windows, now=None):
+    """Aggregate once for all windows and split the result into one report per window.
+
+    Returns {window: {'since', 'new_users', 'active_users'}}.
+    """
+    now = now or datetime.utcnow()
+    reports = {window: {'since': now - REPORT_WINDOWS[window][0], 'new_users': [], 'active_users': []}
+               for window in windows}
+    if not reports:
+        return reports
+
+    earliest = min(report['since'] for report in reports.values())
     new_users = (
-        User.query
-        .filter(User.register_date >= since)
+        db.session.query(User.name, User.email, User.register_date)
+        .filter(User.register_date >= earliest)
         .order_by(User.register_date)
         .all()
     )
+    for report in reports.values():
+        report['new_users'] = [u for u in new_users if u.register_date >= report['since']]
 
-    # ── Per-user activity maps (user_id → count) ──────────────────────────────
-    shapes_added = dict(
-        db.session.query(Shape.user_id, func.count(Shape.id))
-        .filter(Shape.upload_date >= since)
-        .group_by(Shape.user_id)
-        .all()
-    )
-    stencils_added = dict(
-        db.session.query(Stencil.user_id, func.count(Stencil.id))
-        .filter(Stencil.upload_date >= since)
-        .group_by(Stencil.user_id)
-        .all()
-    )
-    shapes_used = dict(
-        db.session.query(ShapeDownload.user_id, func.count(ShapeDownload.id))
-        .filter(ShapeDownload.date >= since)
-        .group_by(ShapeDownload.user_id)
-        .all()
-    )
-    stencils_dl = dict(
-        db.session.query(StencilDownload.user_id, func.count(StencilDownload.id))
-        .filter(StencilDownload.date >= since)
-        .group_by(StencilDownload.user_id)
-        .all()
-    )
+    for window, name, *counts in activity_rows(list(reports), now):
+        reports[window]['active_users'].append({'name': name, **dict(zip(ACTIVITY, counts))})
+    return reports
 
-    # ── Build active-user rows (any non-zero activity) ────────────────────────
-    active_ids = set(shapes_added) | set(stencils_added) | set(shapes_used) | set(stencils_dl)
-    active_users = []
-    for uid in active_ids:
-        user = db.session.get(User, uid)
-        if not user:
-            continue
-        active_users.append({
-            'name':              user.name,
-            'shapes_added':      shapes_added.get(uid, 0),
-            'stencils_added':    stencils_added.get(uid, 0),
-            'shapes_used':       shapes_used.get(uid, 0),
-            'stencils_dl':       stencils_dl.get(uid, 0),
-        })
-    active_users.sort(key=lambda u: -(
-        u['shapes_added'] + u['stencils_added'] + u['shapes_used'] + u['stencils_dl']
-    ))
-
-    msg = Message(
-        subject=f'Visio Shapes – Daily Status {date_str}',
-        recipients=[status_email],
-        html=_build_html(date_str, new_users, active_users),
-    )
-    mail.send(msg)
-    current_app.logger.info('send_status_mail: sent to %s', status_email)
+
+def configured_windows():
+    windows = [w.strip() for w in current_app.config['STATUS_MAIL_WINDOWS'].split(',') if w.strip()]
+    unknown = [w for w in windows if w not in REPORT_WINDOWS]
+    if unknown:
+        raise ValueError(f'Unknown STATUS_MAIL_WINDOWS: {", ".join(unknown)}')
+    return windows
+
+
+def send_status_mail(windows=None):
+    """Queue one status e-mail per report window to STATUS_EMAIL. Returns the number queued."""
+    status_email = current_app.config.get('STATUS_EMAIL', '')
+    if not status_email:
+        current_app.logger.warning('send_status_mail: STATUS_EMAIL not set – skipping.')
+        return 0
+
+    now = datetime.utcnow()
+    date_str = now.strftime('%Y-%m-%d')
+    with reading():
+        reports = build_reports(windows or configured_windows(), now)
+    for window, report in reports.items():
+        _, title, period = REPORT_WINDOWS[window]
+        msg = Message(
+            subject=f'Visio Shapes – {title} Status {date_str}',
+            recipients=[status_email],
+            html=_build_html(title, period, date_str, report['new_users'], report['active_users']),
+        )
+        queue_mail(msg)
+    db.session.commit()
+    current_app.logger.info('send_status_mail: %s queued for %s', ', '.join(reports), status_email)
+    return len(reports)
 
 
 # ── HTML builder ──────────────────────────────────────────────────────────────
@@ -86,7 +117,7 @@ _TD  = 'padding:5px 10px; border-top:1px solid #eee;'
 _TDR = 'padding:5px 10px; border-top:1px solid #eee; text-align:right;'
 
 
-def _build_html(date_str, new_users, active_users):
+def _build_html(title, period, date_str, new_users, active_users):
     # New-users section
     if new_users:
         items = ''.join(
@@ -131,8 +162,8 @@ def _build_html(date_str, new_users, active_users):
 <html>
 <head><meta charset="UTF-8"></head>
 <body style="font-family:'Helvetica Neue',Arial,sans-serif; font-size:14px; color:#3b3530; background:#fff; padding:24px; max-width:640px;">
-  <h2 style="margin:0 0 4px 0; font-size:18px;">Visio Shapes – Daily Status</h2>
-  <p style="margin:0 0 24px 0; color:#999; font-size:12px;">{date_str} &nbsp;|&nbsp; letzte 24 Stunden (UTC)</p>
+  <h2 style="margin:0 0 4px 0; font-size:18px;">Visio Shapes – {title} Status</h2>
+  <p style="margin:0 0 24px 0; color:#999; font-size:12px;">{date_str} &nbsp;|&nbsp; {period} (UTC)</p>
 
   <h3 style="margin:0 0 6px 0; font-size:13px; text-transform:uppercase; letter-spacing:.05em; color:#888; border-bottom:1px solid #e0dbd4; padding-bottom:4px;">
     Neue User ({len(new_users)})
@@ -0,0 +1,311 @@
+import contextlib
+import errno
+import io
+import os
+import shutil
+import uuid
+import urllib.request
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import quote
+
+from flask import current_app, send_file, redirect, Response
+
+CHUNK_SIZE = 64 * 1024
+# Reasons a hard link cannot be made where a copy still works
+_NO_LINK = (errno.EXDEV, errno.EPERM, errno.EMLINK)
+
+
+@dataclass
+class StoredObject:
+    key: str
+    size: int
+    # Last time the object's content or links changed (ctime on disk, LastModified on S3), naive UTC
+    changed: datetime
+
+
+def shape_image_key(shape_id):
+    return f'shapes/{shape_id}.png'
+
+
+def stencil_file_key(stencil_id, file_name):
+    return f'stencils/{stencil_id}{Path(file_name).suffix}'
+
+
+def get_storage():
+    return current_app.extensions['storage']
+
+
+def init_storage(app):
+    backend = app.config.get('STORAGE_BACKEND', 'local')
+    if backend == 'local':
+        storage = LocalStorage(app.root_path)
+    elif backend == 's3':
+        storage = S3Storage(
+            bucket=app.config['STORAGE_S3_BUCKET'],
+            prefix=app.config.get('STORAGE_S3_PREFIX', ''),
+            endpoint_url=app.config.get('STORAGE_S3_ENDPOINT_URL') or None,
+            region=app.config.get('STORAGE_S3_REGION') or None,
+            access_key=app.config.get('STORAGE_S3_ACCESS_KEY') or None,
+            secret_key=app.config.get('STORAGE_S3_SECRET_KEY') or None,
+            presign_expires=app.config.get('STORAGE_PRESIGN_EXPIRES', 300),
+            proxy=app.config.get('STORAGE_S3_PROXY', False),
+        )
+    else:
+        raise ValueError(f'Unknown STORAGE_BACKEND {backend!r}')
+    app.extensions['storage'] = storage
+    return storage
+
+
+class LocalStorage:
+    """Files below the app root: shapes in static/images/shapes, stencils in stencils/."""
+
+    DIRECTORIES = {
+        'shapes': Path('static') / 'images' / 'shapes',
+        'stencils': Path('stencils'),
+    }
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, key):
+        prefix, _, name = key.partition('/')
+        return self.root / self.DIRECTORIES[prefix] / name
+
+    def _temp(self, path):
+        return path.with_name(f'{path.name}.{uuid.uuid4().hex}.part')
+
+    def _replace(self, tmp, path):
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def save(self, key, stream):
+        """Write a stream to key. The file only appears under its name once complete.
+
+        Existing files are replaced, never written to: the inode may be
+        shared with other keys through copy().
+        """
+        path = self.path(key)
+        tmp = self._temp(path)
+        try:
+            with open(tmp, 'xb') as f:
+                shutil.copyfileobj(stream, f, CHUNK_SIZE)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._replace(tmp, path)
+
+    def open(self, key):
+        return open(self.path(key), 'rb')
+
+    def stat(self, key):
+        try:
+            st = self.path(key).stat()
+        except FileNotFoundError:
+            return None
+        return StoredObject(key, st.st_size, datetime.utcfromtimestamp(st.st_ctime))
+
+    def delete(self, key):
+        try:
+            self.path(key).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def copy(self, src_key, dst_key):
+        """Make dst_key share the bytes of src_key (hard link, or a copy as fallback).
+
+        The link or copy is made under a new name and renamed onto dst_key,
+        so a file already at dst_key, and any key linked to it, is left as
+        it was.
+        """
+        src, dst = self.path(src_key), self.path(dst_key)
+        tmp = self._temp(dst)
+        try:
+            os.link(src, tmp)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            if e.errno not in _NO_LINK:
+                raise
+            try:
+                shutil.copyfile(src, tmp)
+            except FileNotFoundError:
+                tmp.unlink(missing_ok=True)
+                return False
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+        self._replace(tmp, dst)
+        return True
+
+    def list_keys(self, prefix):
+        with os.scandir(self.path(f'{prefix}/')) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.name != '.gitignore':
+                    yield f'{prefix}/{entry.name}'
+
+    def send(self, key, download_name=None, mimetype=None, max_age=None):
+        path = self.path(key)
+        if download_name:
+            return send_file(path, download_name=download_name, as_attachment=True)
+        return send_file(path, mimetype=mimetype, max_age=max_age)
+
+
+class S3Storage:
+    """Objects in an S3-compatible bucket. Needs the optional boto3 dependency.
+
+    Downloads are answered with a redirect to a presigned URL, so the bytes do
+    not pass through the app; with proxy=True they are streamed instead.
+    """
+
+    def __init__(self, bucket, prefix='', endpoint_url=None, region=None,
+                 access_key=None, secret_key=None, presign_expires=300, proxy=False):
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError:
+            raise RuntimeError('STORAGE_BACKEND=s3 requires boto3 (uv sync --extra s3)')
+        self._client_error = ClientError
+        self.client = boto3.client(
+            's3',
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+        )
+        self.bucket = bucket
+        self.prefix = prefix.strip('/') + '/' if prefix.strip('/') else ''
+        self.presign_expires = presign_expires
+        self.proxy = proxy
+
+    def _key(self, key):
+        return self.prefix + key
+
+    def _not_found(self, error):
+        return error.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound')
+
+    def save(self, key, stream):
+        # upload_fileobj streams in multipart chunks, the upload is never held in memory
+        self.client.upload_fileobj(stream, self.bucket, self._key(key))
+
+    def open(self, key):
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(key))['Body']
+
+    def stat(self, key):
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except self._client_error as e:
+            if self._not_found(e):
+                return None
+            raise
+        changed = head['LastModified'].astimezone(timezone.utc).replace(tzinfo=None)
+        return StoredObject(key, head['ContentLength'], changed)
+
+    def delete(self, key):
+        if self.stat(key) is None:
+            return False
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+        return True
+
+    def copy(self, src_key, dst_key):
+        """Server-side copy, the bytes are not transferred through the app."""
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=self._key(dst_key),
+                CopySource={'Bucket': self.bucket, 'Key': self._key(src_key)},
+            )
+        except self._client_error as e:
+            if self._not_found(e):
+                return False
+            raise
+        return True
+
+    def list_keys(self, prefix):
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._key(f'{prefix}/')):
+            for obj in page.get('Contents', []):
+                yield obj['Key'][len(self.prefix):]
+
+    def send(self, key, download_name=None, mimetype=None, max_age=None):
+        if self.proxy:
+            body = self.open(key)
+            headers = {}
+            if download_name:
+                headers['Content-Disposition'] = _attachment(download_name)
+            return Response(body.iter_chunks(CHUNK_SIZE), mimetype=mimetype or 'application/octet-stream', headers=headers)
+
+        params = {'Bucket': self.bucket, 'Key': self._key(key)}
+        if download_name:
+            params['ResponseContentDisposition'] = _attachment(download_name)
+        if mimetype:
+            params['ResponseContentType'] = mimetype
+        url = self.client.generate_presigned_url('get_object', Params=params, ExpiresIn=self.presign_expires)
+        response = redirect(url)
+        if max_age:
+            # Let browsers reuse the redirect while the presigned URL is still valid
+            response.cache_control.max_age = min(max_age, self.presign_expires // 2)
+            response.cache_control.private = True
+        return response
+
+
+def check_storage(storage):
+    """Run every storage operation on two scratch objects. Yields (step, error), error is None when it passed.
+
+    Stops at the first failed step and deletes the scratch objects again.
+    """
+    data = uuid.uuid4().bytes * 1024
+    key, copy_key = (f'shapes/storage-check-{uuid.uuid4().hex}.png' for _ in range(2))
+
+    def read(key):
+        with contextlib.closing(storage.open(key)) as f:
+            return f.read()
+
+    def download(key):
+        with current_app.test_request_context():
+            response = storage.send(key, download_name='check.png')
+            if response.status_code in (301, 302, 303, 307):
+                with urllib.request.urlopen(response.location) as f:
+                    return f.read()
+            response.direct_passthrough = False
+            return response.get_data()
+
+    steps = [
+        ('save', lambda: storage.save(key, io.BytesIO(data))),
+        ('stat', lambda: _expect(storage.stat(key) and storage.stat(key).size, len(data))),
+        ('open', lambda: _expect(read(key), data)),
+        ('copy', lambda: _expect(storage.copy(key, copy_key), True)),
+        ('read copy', lambda: _expect(read(copy_key), data)),
+        ('list', lambda: _expect({key, copy_key} <= set(storage.list_keys('shapes')), True)),
+        ('download', lambda: _expect(download(copy_key), data)),
+        ('delete', lambda: _expect((storage.delete(key), storage.delete(copy_key)), (True, True))),
+        ('gone', lambda: _expect((storage.stat(key), storage.copy(key, copy_key)), (None, False))),
+    ]
+    try:
+        for step, run in steps:
+            try:
+                run()
+            except Exception as e:
+                yield step, f'{type(e).__name__}: {e}'
+                return
+            yield step, None
+    finally:
+        for scratch in (key, copy_key):
+            try:
+                storage.delete(scratch)
+            except Exception:
+                pass
+
+
+def _expect(value, expected):
+    if value != expected:
+        raise AssertionError(f'got {str(value)[:60]}, expected {str(expected)[:60]}')
+
+
+def _attachment(download_name):
+    return f"attachment; filename*=UTF-8''{quote(download_name)}"
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.extensions import db
+from app.models.visio import Shape, Stencil
+from app.utilities.storage import get_storage
+
+# LocalStorage writes each file as '<name>.<uuid>.part' first. Such a file
+# is only an orphan once it is older than this: then its upload crashed.
+PART_GRACE = timedelta(hours=1)
+
+
+@dataclass
+class AuditResult:
+    checked_files: int = 0
+    checked_rows: int = 0
+    orphans: list = field(default_factory=list)   # StoredObjects without a row
+    missing: list = field(default_factory=list)   # (kind, id) of rows without a file
+
+    @property
+    def orphan_bytes(self):
+        return sum(obj.size for obj in self.orphans)
+
+
+def _scan(storage, prefix, parts):
+    """Sorted (id, suffix, key) entries of all objects named '<prefix>/<id><suffix>'.
+
+    Keys of files still being written are added to parts instead.
+    """
+    keys = []
+    for key in storage.list_keys(prefix):
+        if key.endswith('.part'):
+            parts.append(key)
+            continue
+        stem, _, suffix = key[len(prefix) + 1:].partition('.')
+        if stem.isdigit():
+            keys.append((int(stem), f'.{suffix}' if suffix else '', key))
+    keys.sort()
+    return keys
+
+
+def _merge(files, rows, kind, result):
+    """Sorted merge of file keys against row keys, collecting orphans and missing files."""
+    files = iter(files)
+    f = next(files, None)
+    for row_key in rows:
+        result.checked_rows += 1
+        while f is not None and f[:2] < row_key:
+            result.orphans.append(f[2])
+            f = next(files, None)
+        if f is not None and f[:2] == row_key:
+            f = next(files, None)
+        else:
+            result.missing.append((kind, row_key[0]))
+    while f is not None:
+        result.orphans.append(f[2])
+        f = next(files, None)
+
+
+def audit_storage(max_workers=16):
+    """Compare the stored shape images and stencil files with the shapes/stencils tables."""
+    storage = get_storage()
+    result = AuditResult()
+
+    parts = []
+    shape_files = _scan(storage, 'shapes', parts)
+    stencil_files = _scan(storage, 'stencils', parts)
+    result.checked_files = len(shape_files) + len(stencil_files) + len(parts)
+
+    shape_rows = ((shape_id, '.png') for shape_id, in db.session.query(Shape.id).order_by(Shape.id).yield_per(5000))
+    _merge(shape_files, shape_rows, 'shape', result)
+
+    stencil_rows = (
+        (stencil_id, Path(file_name).suffix)
+        for stencil_id, file_name in db.session.query(Stencil.id, Stencil.file_name).order_by(Stencil.id).yield_per(5000)
+    )
+    _merge(stencil_files, stencil_rows, 'stencil', result)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        result.orphans = [obj for obj in pool.map(storage.stat, result.orphans) if obj is not None]
+        cutoff = datetime.utcnow() - PART_GRACE
+        result.orphans += [obj for obj in pool.map(storage.stat, parts) if obj is not None and obj.changed < cutoff]
+    return result
+
+
+def reclaim_orphans(result, min_age=3600, max_workers=16):
+    """Delete orphaned files older than min_age seconds. Returns (files, bytes) removed.
+
+    Files younger than min_age are kept: add_stencil writes its files
+    before the transaction commits, so a fresh file may still get its row.
+    """
+    storage = get_storage()
+    cutoff = datetime.utcnow() - timedelta(seconds=min_age)
+    victims = [obj for obj in result.orphans if obj.changed < cutoff]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        removed = [obj.size for obj, ok in zip(victims, pool.map(lambda obj: storage.delete(obj.key), victims)) if ok]
+    return len(removed), sum(removed)
@@ -0,0 +1,179 @@
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from functools import wraps
+
+from flask import current_app
+
+from app.extensions import db
+
+# Per-process counters since the worker started, see write_metrics()
+_metrics = {'transactions': 0, 'retries': 0, 'conflicts': 0, 'wait_ms': 0.0, 'max_wait_ms': 0.0}
+_metrics_lock = threading.Lock()
+
+
+class WriteConflict(Exception):
+    """Other workers held the database's write lock through every attempt."""
+
+
+def _is_busy(error):
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+def _record(waited, retries, conflict=False):
+    waited *= 1000
+    with _metrics_lock:
+        _metrics['transactions'] += 1
+        _metrics['retries'] += retries
+        _metrics['conflicts'] += conflict
+        _metrics['wait_ms'] += waited
+        _metrics['max_wait_ms'] = max(_metrics['max_wait_ms'], waited)
+
+
+def begin_write():
+    """Take SQLite's write lock for the current transaction with BEGIN IMMEDIATE.
+
+    Call it before the first write of a request, after slow work such as
+    password hashing. From here on no statement of the transaction can
+    fail with "database is locked", and what it reads stays current until
+    the commit. Instead of SQLite's busy handler, which sleeps up to
+    100 ms between checks and lets a busy worker starve the others, the
+    lock is tried again after a random pause of at most
+    WRITE_LOCK_BACKOFF, for up to SQLITE_BUSY_TIMEOUT. Raises
+    WriteConflict if the lock stays taken. Does nothing on other
+    databases or in a transaction that has already written.
+    """
+    connection = db.session.connection()
+    if connection.dialect.name != 'sqlite':
+        return
+    dbapi_connection = connection.connection.dbapi_connection
+    if dbapi_connection.in_transaction:
+        return
+
+    config = current_app.config
+    backoff = config['WRITE_LOCK_BACKOFF']
+    cursor = dbapi_connection.cursor()
+    start = time.perf_counter()
+    deadline = start + config['SQLITE_BUSY_TIMEOUT'] / 1000
+    attempt = 0
+    try:
+        cursor.execute('PRAGMA busy_timeout=0')
+        while True:
+            try:
+                cursor.execute('BEGIN IMMEDIATE')
+                _record(time.perf_counter() - start, attempt)
+                return
+            except sqlite3.OperationalError as e:
+                if not _is_busy(e):
+                    raise
+                if time.perf_counter() >= deadline:
+                    _record(time.perf_counter() - start, attempt, conflict=True)
+                    logging.warning('Database still locked after %d attempts in %.0f ms',
+                                    attempt + 1, (time.perf_counter() - start) * 1000)
+                    raise WriteConflict() from e
+            # Full jitter, doubling from 1 ms
+            time.sleep(random.uniform(0, min(backoff, 0.001 * 2 ** attempt)))
+            attempt += 1
+    finally:
+        cursor.execute(f"PRAGMA busy_timeout={config['SQLITE_BUSY_TIMEOUT']}")
+        cursor.close()
+
+
+def write_transaction(f):
+    """Run the view in a transaction that holds the write lock from the start, see begin_write()."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        begin_write()
+        return f(*args, **kwargs)
+    return decorated
+
+
+def write_metrics():
+    """Lock waits of this worker process since it started."""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    metrics['pid'] = os.getpid()
+    metrics['mean_wait_ms'] = metrics['wait_ms'] / metrics['transactions'] if metrics['transactions'] else 0.0
+    return metrics
+
+
+def _stress_worker(settings, plain, seconds, hold, pause, start, results):
+    from sqlalchemy.exc import OperationalError
+    from app.utilities.database import settings_app
+    from app.models.auth import User
+    from app.models.visio import Shape
+    from app.utilities.rollups import record_shape_download
+
+    app = settings_app(settings)
+    commits = locked = conflicts = 0
+    with app.app_context():
+        shapes = db.session.query(Shape.id, Shape.user_id).order_by(Shape.id).limit(10000).all()
+        user_ids = [user_id for user_id, in db.session.query(User.id).order_by(User.id).limit(1000)]
+        db.session.rollback()
+        rng = random.Random()
+        start.wait()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            try:
+                if not plain:
+                    begin_write()
+                record_shape_download(rng.choice(shapes), rng.choice(user_ids))
+                db.session.flush()
+                # Work done while the write lock is held, e.g. a storage upload
+                time.sleep(hold)
+                db.session.commit()
+                commits += 1
+                # The rest of the request
+                time.sleep(pause)
+            except OperationalError as e:
+                db.session.rollback()
+                if not _is_busy(e.orig):
+                    raise
+                locked += 1
+            except WriteConflict:
+                db.session.rollback()
+                conflicts += 1
+    results.put((commits, locked, conflicts, write_metrics()))
+
+
+def stress_writes(processes=4, seconds=10.0, hold=0.005, pause=0.01, busy_timeout=None, plain=False):
+    """Record downloads from several processes at once on a copy of the database.
+
+    Every process commits one download per transaction, holds the write
+    lock for hold seconds before the commit and pauses for pause seconds
+    before the next transaction. With plain the helper
+    is not used: the lock is taken by the first INSERT and contention
+    surfaces as "database is locked". Returns (commits per second,
+    locked errors, conflicts, write_metrics() of each process).
+    """
+    import multiprocessing
+    from app.utilities.database import copy_database, copy_settings
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'stress.db')
+        copy_database(database)
+        settings = copy_settings(database)
+        if busy_timeout is not None:
+            settings['SQLITE_BUSY_TIMEOUT'] = busy_timeout
+
+        context = multiprocessing.get_context('spawn')
+        start, results = context.Barrier(processes + 1), context.Queue()
+        workers = [
+            context.Process(target=_stress_worker, args=(settings, plain, seconds, hold, pause, start, results))
+            for _ in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        start.wait()
+        reports = [results.get(timeout=seconds + 120) for _ in workers]
+        for worker in workers:
+            worker.join()
+
+    commits = sum(report[0] for report in reports)
+    return (commits / seconds, sum(report[1] for report in reports), sum(report[2] for report in reports),
+            [report[3] for report in reports])
@@ -0,0 +1,206 @@
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, exists, select
+
+from app.extensions import db
+from app.models.auth import User
+from app.models.maintenance import ScheduledJob, UserDeletion
+from app.models.visio import Shape, Stencil, ShapeDownload, StencilDownload
+from app.utilities.api_tokens import revoke_tokens
+from app.utilities.file_cleanup import queue_shape_files, queue_stencil_files
+from app.utilities.jobs import MAX_ATTEMPTS, job, schedule
+from app.utilities.rollups import forget_content, forget_user, refresh_user_stats
+from app.utilities.transactions import begin_write
+
+# Shapes or stencils removed per transaction, raw download rows per DELETE
+CHUNK = 200
+BATCH = 5000
+# Seconds one run of the job works before it hands over to a new job, so it
+# never comes near JOBS_CLAIM_TIMEOUT and other jobs get their turn
+TIME_SLICE = 20
+# Finished deletions are listed in the admin UI for this long
+SHOW_FINISHED = timedelta(hours=1)
+
+
+def start_user_deletion(user, requested_by=None):
+    """Queue the deletion of user and revoke their API tokens. The caller commits.
+
+    Returns the UserDeletion. A deletion that is already under way is
+    returned as it is, with a new job if its last one gave up.
+    """
+    deletion = UserDeletion.query.filter_by(user_id=user.id, finished_at=None).first()
+    if deletion is None:
+        deletion = UserDeletion(
+            user_id=user.id,
+            user_name=user.name,
+            requested_by=requested_by,
+            requested_at=datetime.utcnow(),
+            total=(db.session.query(Shape.id).filter(Shape.user_id == user.id).count()
+                   + db.session.query(Stencil.id).filter(Stencil.user_id == user.id).count()),
+            done=0,
+            step='shapes',
+        )
+        db.session.add(deletion)
+        db.session.flush()
+        revoke_tokens(user)
+    elif _has_job(deletion.id):
+        return deletion
+    deletion.last_error = None
+    schedule('delete_user', timedelta(0), deletion_id=deletion.id)
+    return deletion
+
+
+def _being_deleted(user_id):
+    return exists().where(UserDeletion.user_id == user_id, UserDeletion.finished_at.is_(None))
+
+
+def active_users():
+    """Query of the users whose account is not being deleted. Logins and sessions only accept these."""
+    return User.query.filter(~_being_deleted(User.id))
+
+
+def deletion_pending(user_id):
+    return db.session.query(_being_deleted(user_id)).scalar()
+
+
+def _has_job(deletion_id):
+    jobs = ScheduledJob.query.filter(ScheduledJob.task == 'delete_user', ScheduledJob.attempts < MAX_ATTEMPTS)
+    return any((scheduled.kwargs or {}).get('deletion_id') == deletion_id for scheduled in jobs)
+
+
+def _delete_batch(model, *criteria):
+    """Delete up to BATCH rows of model and commit. Returns the number of rows deleted.
+
+    Deleting the newest raw download events is safe for the rollups only
+    because the download tables use AUTOINCREMENT (migration b7d4e2a9c6f1):
+    their ids are never handed out again below the rollup watermark.
+    """
+    ids = select(model.id).where(*criteria).limit(BATCH)
+    deleted = db.session.execute(delete(model).where(model.id.in_(ids))).rowcount
+    db.session.commit()
+    return deleted
+
+
+def _delete_shapes(shape_ids):
+    while _delete_batch(ShapeDownload, ShapeDownload.shape_id.in_(shape_ids)):
+        pass
+    queue_shape_files(shape_ids)
+    affected = forget_content(shape_ids=shape_ids)
+    affected.update(user_id for user_id, in db.session.query(Shape.user_id).filter(Shape.id.in_(shape_ids)).distinct())
+    Shape.query.filter(Shape.id.in_(shape_ids)).delete(synchronize_session=False)
+    refresh_user_stats(affected)
+
+
+def _delete_stencils(stencil_ids):
+    shape_ids = [shape_id for shape_id, in db.session.query(Shape.id).filter(Shape.stencil_id.in_(stencil_ids))]
+    if shape_ids:
+        _delete_shapes(shape_ids)
+    while _delete_batch(StencilDownload, StencilDownload.stencil_id.in_(stencil_ids)):
+        pass
+    queue_stencil_files(db.session.query(Stencil.id, Stencil.file_name).filter(Stencil.id.in_(stencil_ids)).all())
+    affected = forget_content(stencil_ids=stencil_ids)
+    affected.update(user_id for user_id, in db.session.query(Stencil.user_id).filter(Stencil.id.in_(stencil_ids)).distinct())
+    Stencil.query.filter(Stencil.id.in_(stencil_ids)).delete(synchronize_session=False)
+    refresh_user_stats(affected)
+
+
+def _step(deletion):
+    """Delete the next chunk of the account and commit. Returns True once nothing is left.
+
+    Every step works on what is still in the database, so after a crash
+    the job simply continues where the last committed chunk left off.
+    """
+    user_id = deletion.user_id
+
+    shape_ids = [shape_id for shape_id, in db.session.query(Shape.id)
+                 .filter(Shape.user_id == user_id).order_by(Shape.id).limit(CHUNK)]
+    if shape_ids:
+        deletion.step = 'shapes'
+        _delete_shapes(shape_ids)
+        deletion.done = min(deletion.done + len(shape_ids), deletion.total)
+        db.session.commit()
+        return False
+
+    stencil_ids = [stencil_id for stencil_id, in db.session.query(Stencil.id)
+                   .filter(Stencil.user_id == user_id).order_by(Stencil.id).limit(CHUNK)]
+    if stencil_ids:
+        deletion.step = 'stencils'
+        _delete_stencils(stencil_ids)
+        deletion.done = min(deletion.done + len(stencil_ids), deletion.total)
+        db.session.commit()
+        return False
+
+    deletion.step = 'downloads'
+    for model in (ShapeDownload, StencilDownload):
+        if _delete_batch(model, model.user_id == user_id):
+            return False
+
+    # Under the write lock nothing can be added until the user row is gone.
+    # Whatever was added since the steps above goes through them again, so
+    # its files are queued and its downloads deleted.
+    begin_write()
+    for model in (Shape, Stencil, ShapeDownload, StencilDownload):
+        if db.session.query(exists().where(model.user_id == user_id)).scalar():
+            db.session.commit()
+            return False
+    deletion.step = 'account'
+    user = db.session.get(User, user_id)
+    if user is not None:
+        affected = forget_user(user_id)
+        db.session.delete(user)
+        db.session.flush()
+        refresh_user_stats(affected)
+    deletion.done = deletion.total
+    deletion.finished_at = datetime.utcnow()
+    db.session.commit()
+    return True
+
+
+@job('delete_user')
+def delete_user(deletion_id, time_slice=TIME_SLICE):
+    """Delete an account chunk by chunk, each chunk in its own short transaction.
+
+    After time_slice seconds the job schedules its continuation and ends.
+    """
+    deletion = db.session.get(UserDeletion, deletion_id)
+    if deletion is None or deletion.finished_at is not None:
+        return
+    deadline = time.monotonic() + time_slice
+    deletion.last_error = None
+    try:
+        while not _step(deletion):
+            if time.monotonic() > deadline:
+                schedule('delete_user', timedelta(0), deletion_id=deletion_id)
+                db.session.commit()
+                return
+    except Exception as e:
+        db.session.rollback()
+        deletion = db.session.get(UserDeletion, deletion_id)
+        deletion.last_error = str(e)[:512]
+        db.session.commit()
+        raise
+
+
+def deletion_status(deletion):
+    return {
+        'id': deletion.id,
+        'user_id': deletion.user_id,
+        'user_name': deletion.user_name,
+        'step': deletion.step,
+        'total': deletion.total,
+        'done': deletion.done,
+        'finished': deletion.finished_at is not None,
+        'error': deletion.last_error,
+    }
+
+
+def recent_deletions():
+    """Deletions under way and those finished within SHOW_FINISHED, newest first."""
+    return (
+        UserDeletion.query
+        .filter(db.or_(UserDeletion.finished_at.is_(None),
+                       UserDeletion.finished_at > datetime.utcnow() - SHOW_FINISHED))
+        .order_by(UserDeletion.id.desc())
+        .all()
+    )
@@ -7,6 +7,19 @@ class Config(object):
     SECRET_KEY = config('SECRET_KEY')
     SQLALCHEMY_DATABASE_URI = config('DATABASE_URI') or 'sqlite:///' + os.path.join(basedir, 'app.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    READ_DATABASE_URI = config('READ_DATABASE_URI', default='')  # replica for GET requests and reports, empty: query_only connections to a SQLite file
+    DB_READ_ROUTING = config('DB_READ_ROUTING', default=True, cast=bool)  # off: everything reads from the primary
+    DB_POOL_SIZE = config('DB_POOL_SIZE', default=2, cast=int)  # connections kept open per worker process
+    DB_MAX_OVERFLOW = config('DB_MAX_OVERFLOW', default=3, cast=int)  # extra connections opened under load
+    DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10, cast=int)  # seconds to wait for a free connection
+    DB_POOL_RECYCLE = config('DB_POOL_RECYCLE', default=1800, cast=int)  # seconds, server databases only
+    SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')  # NORMAL is safe with WAL, FULL also survives power loss
+    SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int)  # ms to wait for a lock held by another worker
+    WRITE_LOCK_BACKOFF = config('WRITE_LOCK_BACKOFF', default=0.01, cast=float)  # seconds, longest random pause between attempts to take the write lock
+    SQLITE_CACHE_SIZE = config('SQLITE_CACHE_SIZE', default=-16000, cast=int)  # page cache per connection, negative = KiB
+    SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int)  # bytes, 0 = no memory map
+    SQLITE_TEMP_STORE = config('SQLITE_TEMP_STORE', default='MEMORY')  # DEFAULT, FILE or MEMORY
+    SQLITE_FOREIGN_KEYS = config('SQLITE_FOREIGN_KEYS', default=False, cast=bool)  # off: raw download rows outlive deleted content
     MAIL_SERVER = config('MAIL_SERVER')
     MAIL_PORT = config('MAIL_PORT')
     MAIL_USE_TLS = config('MAIL_USE_TLS')
@@ -18,4 +31,26 @@ class Config(object):
     MAX_CONTENT_LENGTH = config('MAX_CONTENT_LENGTH', default=100 * 1024 * 1024, cast=int)    # 100 MB
     OWNER_EMAIL = config('OWNER_EMAIL', default='')
     STATUS_EMAIL = config('STATUS_EMAIL', default='')
-    BASE_URL = config('BASE_URL', default='http://localhost:5000')
\ No newline at end of file
+    STATUS_MAIL_WINDOWS = config('STATUS_MAIL_WINDOWS', default='day')  # comma-separated: day, week, month
+    BASE_URL = config('BASE_URL', default='http://localhost:5000')
+    STORAGE_BACKEND = config('STORAGE_BACKEND', default='local')  # 'local' or 's3'
+    STORAGE_S3_BUCKET = config('STORAGE_S3_BUCKET', default='')
+    STORAGE_S3_PREFIX = config('STORAGE_S3_PREFIX', default='')
+    STORAGE_S3_ENDPOINT_URL = config('STORAGE_S3_ENDPOINT_URL', default='')  # e.g. MinIO: http://minio:9000
+    STORAGE_S3_REGION = config('STORAGE_S3_REGION', default='')
+    STORAGE_S3_ACCESS_KEY = config('STORAGE_S3_ACCESS_KEY', default='')
+    STORAGE_S3_SECRET_KEY = config('STORAGE_S3_SECRET_KEY', default='')
+    STORAGE_S3_PROXY = config('STORAGE_S3_PROXY', default=False, cast=bool)
+    STORAGE_PRESIGN_EXPIRES = config('STORAGE_PRESIGN_EXPIRES', default=300, cast=int)  # seconds
+    JOBS_POLL_INTERVAL = config('JOBS_POLL_INTERVAL', default=30, cast=int)  # seconds, 0 = only `flask run-jobs` runs jobs
+    JOBS_CLAIM_TIMEOUT = config('JOBS_CLAIM_TIMEOUT', default=600, cast=int)  # seconds until a claimed job counts as abandoned
+    BCRYPT_LOG_ROUNDS = config('BCRYPT_LOG_ROUNDS', default=12, cast=int)  # changed costs are applied on the next login
+    BCRYPT_MAX_CONCURRENCY = config('BCRYPT_MAX_CONCURRENCY', default=0, cast=int)  # hashes at a time per host, 0 = half the CPUs
+    BCRYPT_WAIT_TIMEOUT = config('BCRYPT_WAIT_TIMEOUT', default=1.0, cast=float)  # seconds to wait for a free slot before 429
+    API_TOKEN_MAX_AGE = config('API_TOKEN_MAX_AGE', default=30 * 86400, cast=int)  # seconds
+    API_TOKEN_GENERATION_TTL = config('API_TOKEN_GENERATION_TTL', default=60, cast=int)  # seconds a revocation may take to reach all workers
+    API_LEGACY_TOKENS_UNTIL = config('API_LEGACY_TOKENS_UNTIL', default='')  # YYYY-MM-DD, empty = raw tokens stay valid
+    ACTIVITY_FLUSH_INTERVAL = config('ACTIVITY_FLUSH_INTERVAL', default=60, cast=int)  # seconds between last_active writes per worker
+    DOWNLOAD_RETENTION_DAYS = config('DOWNLOAD_RETENTION_DAYS', default=0, cast=int)  # days raw download events are kept, 0 = forever
+    DOWNLOAD_ARCHIVE_DIR = config('DOWNLOAD_ARCHIVE_DIR', default=os.path.join(basedir, 'instance', 'download-archive'))  # raw events are written here before they are deleted, empty: not archived
+    ACCOUNT_STATS_TTL = config('ACCOUNT_STATS_TTL', default=60, cast=int)  # seconds, a download by or of the user refreshes earlier
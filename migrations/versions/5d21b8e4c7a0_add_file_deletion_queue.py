@@ -0,0 +1,37 @@
+"""add file deletion queue
+
+Revision ID: 5d21b8e4c7a0
+Revises: a3c9e1f07b42
+Create Date: 2026-10-18 10:03:17.452981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d21b8e4c7a0'
+down_revision = 'a3c9e1f07b42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('file_deletions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('path', sa.String(length=512), nullable=False),
+    sa.Column('queued_at', sa.DateTime(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.String(length=512), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('file_deletions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_file_deletions_next_attempt'), ['next_attempt'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('file_deletions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_file_deletions_next_attempt'))
+
+    op.drop_table('file_deletions')
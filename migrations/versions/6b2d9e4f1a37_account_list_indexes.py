@@ -0,0 +1,36 @@
+"""account list indexes
+
+Revision ID: 6b2d9e4f1a37
+Revises: 9c4e7b1a5d28
+Create Date: 2026-10-19 18:05:27.104512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6b2d9e4f1a37'
+down_revision = '9c4e7b1a5d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('shapes', schema=None) as batch_op:
+        batch_op.drop_index('ix_shapes_user_upload')
+        batch_op.create_index('ix_shapes_user_list', ['user_id', 'id'], unique=False)
+
+    with op.batch_alter_table('stencils', schema=None) as batch_op:
+        batch_op.drop_index('ix_stencils_user_upload')
+        batch_op.create_index('ix_stencils_user_list', ['user_id', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('stencils', schema=None) as batch_op:
+        batch_op.drop_index('ix_stencils_user_list')
+        batch_op.create_index('ix_stencils_user_upload', ['user_id', 'upload_date'], unique=False)
+
+    with op.batch_alter_table('shapes', schema=None) as batch_op:
+        batch_op.drop_index('ix_shapes_user_list')
+        batch_op.create_index('ix_shapes_user_upload', ['user_id', 'upload_date'], unique=False)
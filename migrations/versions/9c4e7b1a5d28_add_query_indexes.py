@@ -0,0 +1,82 @@
+"""add query indexes
+
+Revision ID: 9c4e7b1a5d28
+Revises: f3a8d2c6e1b4
+Create Date: 2026-10-19 16:42:03.551970
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e7b1a5d28'
+down_revision = 'f3a8d2c6e1b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('shape_downloads', schema=None) as batch_op:
+        batch_op.create_index('ix_shape_downloads_shape_user', ['shape_id', 'user_id'], unique=False)
+        batch_op.create_index('ix_shape_downloads_user_date', ['user_id', 'date'], unique=False)
+
+    with op.batch_alter_table('shapes', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_shapes_stencil_id'), ['stencil_id'], unique=False)
+        batch_op.create_index('ix_shapes_team_upload', ['team_id', 'upload_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_shapes_upload_date'), ['upload_date'], unique=False)
+        batch_op.create_index('ix_shapes_user_upload', ['user_id', 'upload_date'], unique=False)
+
+    with op.batch_alter_table('stencil_downloads', schema=None) as batch_op:
+        batch_op.create_index('ix_stencil_downloads_stencil_user', ['stencil_id', 'user_id'], unique=False)
+        batch_op.create_index('ix_stencil_downloads_user_date', ['user_id', 'date'], unique=False)
+
+    with op.batch_alter_table('stencils', schema=None) as batch_op:
+        batch_op.create_index('ix_stencils_team_upload', ['team_id', 'upload_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_stencils_upload_date'), ['upload_date'], unique=False)
+        batch_op.create_index('ix_stencils_user_upload', ['user_id', 'upload_date'], unique=False)
+
+    with op.batch_alter_table('team_membership', schema=None) as batch_op:
+        batch_op.create_index('ix_team_membership_team', ['team_id', 'role'], unique=False)
+
+    with op.batch_alter_table('user_role_table', schema=None) as batch_op:
+        batch_op.create_index('ix_user_role_table_user', ['user_id', 'role_id'], unique=False)
+
+    with op.batch_alter_table('user_reach', schema=None) as batch_op:
+        batch_op.create_index('ix_user_reach_user', ['user_id'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_register_date'), ['register_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_register_date'))
+
+    with op.batch_alter_table('user_reach', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_reach_user')
+
+    with op.batch_alter_table('user_role_table', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_role_table_user')
+
+    with op.batch_alter_table('team_membership', schema=None) as batch_op:
+        batch_op.drop_index('ix_team_membership_team')
+
+    with op.batch_alter_table('stencils', schema=None) as batch_op:
+        batch_op.drop_index('ix_stencils_user_upload')
+        batch_op.drop_index(batch_op.f('ix_stencils_upload_date'))
+        batch_op.drop_index('ix_stencils_team_upload')
+
+    with op.batch_alter_table('stencil_downloads', schema=None) as batch_op:
+        batch_op.drop_index('ix_stencil_downloads_user_date')
+        batch_op.drop_index('ix_stencil_downloads_stencil_user')
+
+    with op.batch_alter_table('shapes', schema=None) as batch_op:
+        batch_op.drop_index('ix_shapes_user_upload')
+        batch_op.drop_index(batch_op.f('ix_shapes_upload_date'))
+        batch_op.drop_index('ix_shapes_team_upload')
+        batch_op.drop_index(batch_op.f('ix_shapes_stencil_id'))
+
+    with op.batch_alter_table('shape_downloads', schema=None) as batch_op:
+        batch_op.drop_index('ix_shape_downloads_user_date')
+        batch_op.drop_index('ix_shape_downloads_shape_user')
@@ -0,0 +1,40 @@
+"""add content fingerprints
+
+Revision ID: a3c9e1f07b42
+Revises: 13dfc56ae7e5
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9e1f07b42'
+down_revision = '13dfc56ae7e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('shapes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_hash', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('image_hash', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_shapes_data_hash'), ['data_hash'], unique=False)
+        batch_op.create_index(batch_op.f('ix_shapes_image_hash'), ['image_hash'], unique=False)
+
+    with op.batch_alter_table('stencils', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('file_hash', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_stencils_file_hash'), ['file_hash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('stencils', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_stencils_file_hash'))
+        batch_op.drop_column('file_hash')
+
+    with op.batch_alter_table('shapes', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_shapes_image_hash'))
+        batch_op.drop_index(batch_op.f('ix_shapes_data_hash'))
+        batch_op.drop_column('image_hash')
+        batch_op.drop_column('data_hash')
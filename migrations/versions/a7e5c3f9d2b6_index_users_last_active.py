@@ -0,0 +1,26 @@
+"""index users last_active
+
+Revision ID: a7e5c3f9d2b6
+Revises: 6b2d9e4f1a37
+Create Date: 2026-10-19 19:12:40.318745
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e5c3f9d2b6'
+down_revision = '6b2d9e4f1a37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_last_active'), ['last_active'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_last_active'))
@@ -0,0 +1,48 @@
+"""autoincrement download ids
+
+Revision ID: b7d4e2a9c6f1
+Revises: e5c9a3f7b2d8
+Create Date: 2026-10-20 09:41:27.504318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d4e2a9c6f1'
+down_revision = 'e5c9a3f7b2d8'
+branch_labels = None
+depends_on = None
+
+TABLES = ('shape_downloads', 'stencil_downloads')
+
+
+def upgrade():
+    # Without AUTOINCREMENT SQLite hands out the ids of deleted newest rows
+    # again, below the rollup watermark, and those events are never folded.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None, recreate='always',
+                                  table_kwargs={'sqlite_autoincrement': True}) as batch_op:
+            pass
+        # Continue above every id handed out so far, including those of
+        # deleted rows the watermark has already passed
+        seq = sa.text(
+            "SELECT max(coalesce((SELECT max(id) FROM {0}), 0), "
+            "coalesce((SELECT last_id FROM rollup_watermarks WHERE name = :name), 0))".format(table)
+        )
+        start = op.get_bind().execute(seq, {'name': table}).scalar()
+        op.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = :name").bindparams(name=table))
+        op.execute(sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)")
+                   .bindparams(name=table, seq=start))
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None, recreate='always',
+                                  table_kwargs={'sqlite_autoincrement': False}) as batch_op:
+            pass
@@ -0,0 +1,28 @@
+"""add outbox expiry
+
+Revision ID: c3e9f1a7d5b2
+Revises: b7d4e2a9c6f1
+Create Date: 2026-10-20 11:18:05.227391
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e9f1a7d5b2'
+down_revision = 'b7d4e2a9c6f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+    # Messages given up on keep no content, it may contain a password (MAX_ATTEMPTS = 8)
+    op.execute("UPDATE mail_outbox SET html = NULL, body = NULL WHERE attempts >= 8")
+
+
+def downgrade():
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.drop_column('expires_at')
@@ -0,0 +1,43 @@
+"""add user deletions
+
+Revision ID: c4f1e8a2b7d3
+Revises: a7e5c3f9d2b6
+Create Date: 2026-10-19 20:03:18.442190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f1e8a2b7d3'
+down_revision = 'a7e5c3f9d2b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_deletions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('user_name', sa.String(length=255), nullable=False),
+    sa.Column('requested_by', sa.String(length=255), nullable=True),
+    sa.Column('requested_at', sa.DateTime(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('done', sa.Integer(), nullable=False),
+    sa.Column('step', sa.String(length=20), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.String(length=512), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('user_deletions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_deletions_finished_at'), ['finished_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_user_deletions_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user_deletions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_deletions_user_id'))
+        batch_op.drop_index(batch_op.f('ix_user_deletions_finished_at'))
+
+    op.drop_table('user_deletions')
@@ -0,0 +1,32 @@
+"""store storage keys in file_deletions
+
+Revision ID: c81f4a2d9e63
+Revises: 5d21b8e4c7a0
+Create Date: 2026-10-18 11:40:52.730164
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81f4a2d9e63'
+down_revision = '5d21b8e4c7a0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('file_deletions', schema=None) as batch_op:
+        batch_op.alter_column('path', new_column_name='storage_key', existing_type=sa.String(length=512), existing_nullable=False)
+
+    # Paths were relative to the app root, storage keys are relative to the storage backend
+    op.execute("UPDATE file_deletions SET storage_key = 'shapes/' || substr(storage_key, length('static/images/shapes/') + 1) "
+               "WHERE storage_key LIKE 'static/images/shapes/%'")
+
+
+def downgrade():
+    op.execute("UPDATE file_deletions SET storage_key = 'static/images/' || storage_key WHERE storage_key LIKE 'shapes/%'")
+
+    with op.batch_alter_table('file_deletions', schema=None) as batch_op:
+        batch_op.alter_column('storage_key', new_column_name='path', existing_type=sa.String(length=512), existing_nullable=False)
@@ -0,0 +1,85 @@
+"""add download rollups
+
+Revision ID: d5c1a7e3b9f2
+Revises: b2e8f6a4c3d1
+Create Date: 2026-10-19 09:21:37.640915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5c1a7e3b9f2'
+down_revision = 'b2e8f6a4c3d1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('shapes', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('stencils', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('shapes_used_by_others', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('users_used_my_shapes', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('stencils_downloaded_by_others', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('users_downloaded_my_stencils', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('shapes_used', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('stencils_downloaded', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('foreign_shapes_used', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('foreign_stencils_downloaded', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table('shape_usage',
+    sa.Column('shape_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['shape_id'], ['shapes.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('shape_id', 'user_id')
+    )
+    with op.batch_alter_table('shape_usage', schema=None) as batch_op:
+        batch_op.create_index('ix_shape_usage_owner', ['owner_id', 'shape_id'], unique=False)
+        batch_op.create_index('ix_shape_usage_user_count', ['user_id', 'count'], unique=False)
+
+    op.create_table('stencil_usage',
+    sa.Column('stencil_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['stencil_id'], ['stencils.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('stencil_id', 'user_id')
+    )
+    with op.batch_alter_table('stencil_usage', schema=None) as batch_op:
+        batch_op.create_index('ix_stencil_usage_owner', ['owner_id', 'stencil_id'], unique=False)
+        batch_op.create_index('ix_stencil_usage_user_count', ['user_id', 'count'], unique=False)
+
+    op.create_table('user_reach',
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('owner_id', 'user_id', 'kind')
+    )
+
+
+def downgrade():
+    op.drop_table('user_reach')
+    with op.batch_alter_table('stencil_usage', schema=None) as batch_op:
+        batch_op.drop_index('ix_stencil_usage_user_count')
+        batch_op.drop_index('ix_stencil_usage_owner')
+
+    op.drop_table('stencil_usage')
+    with op.batch_alter_table('shape_usage', schema=None) as batch_op:
+        batch_op.drop_index('ix_shape_usage_user_count')
+        batch_op.drop_index('ix_shape_usage_owner')
+
+    op.drop_table('shape_usage')
+    op.drop_table('user_stats')
@@ -0,0 +1,52 @@
+"""autoincrement shape and stencil ids
+
+Revision ID: d8a2f6c4e9b3
+Revises: c3e9f1a7d5b2
+Create Date: 2026-10-20 14:07:52.618940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8a2f6c4e9b3'
+down_revision = 'c3e9f1a7d5b2'
+branch_labels = None
+depends_on = None
+
+# Table and the prefix of its keys in file_deletions
+TABLES = (('shapes', 'shapes/'), ('stencils', 'stencils/'))
+
+
+def upgrade():
+    # Without AUTOINCREMENT SQLite hands the id of a deleted newest shape or
+    # stencil to the next upload, whose file then has the key that is still
+    # queued for deletion.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, prefix in TABLES:
+        with op.batch_alter_table(table, schema=None, recreate='always',
+                                  table_kwargs={'sqlite_autoincrement': True}) as batch_op:
+            pass
+        # Continue above every id that still exists or whose file is queued;
+        # CAST reads the leading digits of "<id>.<ext>"
+        seq = sa.text(
+            "SELECT max(coalesce((SELECT max(id) FROM {0}), 0), "
+            "coalesce((SELECT max(CAST(substr(storage_key, :start) AS INTEGER)) FROM file_deletions "
+            "WHERE substr(storage_key, 1, :length) = :prefix), 0))".format(table)
+        )
+        start = op.get_bind().execute(
+            seq, {'start': len(prefix) + 1, 'length': len(prefix), 'prefix': prefix}).scalar()
+        op.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = :name").bindparams(name=table))
+        op.execute(sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)")
+                   .bindparams(name=table, seq=start))
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, _ in TABLES:
+        with op.batch_alter_table(table, schema=None, recreate='always',
+                                  table_kwargs={'sqlite_autoincrement': False}) as batch_op:
+            pass
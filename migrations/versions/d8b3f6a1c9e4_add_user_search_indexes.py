@@ -0,0 +1,28 @@
+"""add user search indexes
+
+Revision ID: d8b3f6a1c9e4
+Revises: c4f1e8a2b7d3
+Create Date: 2026-10-19 21:04:17.552306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8b3f6a1c9e4'
+down_revision = 'c4f1e8a2b7d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_name_nocase', [sa.text('name COLLATE NOCASE')], unique=False)
+        batch_op.create_index('ix_users_email_nocase', [sa.text('email COLLATE NOCASE')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_email_nocase')
+        batch_op.drop_index('ix_users_name_nocase')
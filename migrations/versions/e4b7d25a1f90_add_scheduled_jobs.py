@@ -0,0 +1,42 @@
+"""add scheduled jobs
+
+Revision ID: e4b7d25a1f90
+Revises: c81f4a2d9e63
+Create Date: 2026-10-18 23:48:05.217334
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7d25a1f90'
+down_revision = 'c81f4a2d9e63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scheduled_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task', sa.String(length=64), nullable=False),
+    sa.Column('kwargs', sa.JSON(), nullable=True),
+    sa.Column('run_at', sa.DateTime(), nullable=False),
+    sa.Column('repeat_seconds', sa.Integer(), nullable=True),
+    sa.Column('claimed_at', sa.DateTime(), nullable=True),
+    sa.Column('claimed_by', sa.String(length=64), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.String(length=512), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('scheduled_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_scheduled_jobs_run_at'), ['run_at'], unique=False)
+        batch_op.create_index('ix_scheduled_jobs_periodic_task', ['task'], unique=True, sqlite_where=sa.text('repeat_seconds IS NOT NULL'), postgresql_where=sa.text('repeat_seconds IS NOT NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('scheduled_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_scheduled_jobs_periodic_task', sqlite_where=sa.text('repeat_seconds IS NOT NULL'), postgresql_where=sa.text('repeat_seconds IS NOT NULL'))
+        batch_op.drop_index(batch_op.f('ix_scheduled_jobs_run_at'))
+
+    op.drop_table('scheduled_jobs')
@@ -0,0 +1,26 @@
+"""add retired_before to rollup watermarks
+
+Revision ID: e5c9a3f7b2d8
+Revises: d8b3f6a1c9e4
+Create Date: 2026-10-19 23:12:40.183944
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5c9a3f7b2d8'
+down_revision = 'd8b3f6a1c9e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('rollup_watermarks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('retired_before', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('rollup_watermarks', schema=None) as batch_op:
+        batch_op.drop_column('retired_before')
@@ -0,0 +1,62 @@
+"""add download_daily
+
+Revision ID: f3a8d2c6e1b4
+Revises: d5c1a7e3b9f2
+Create Date: 2026-10-19 14:05:12.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8d2c6e1b4'
+down_revision = 'd5c1a7e3b9f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('download_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('day', 'kind', 'item_id', 'user_id')
+    )
+    with op.batch_alter_table('download_daily', schema=None) as batch_op:
+        batch_op.create_index('ix_download_daily_item', ['kind', 'item_id'], unique=False)
+        batch_op.create_index('ix_download_daily_owner', ['owner_id', 'day'], unique=False)
+        batch_op.create_index('ix_download_daily_user', ['user_id', 'day'], unique=False)
+
+    op.create_table('rollup_watermarks',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('last_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # The windowed queries read the raw events of the first, partial day by date
+    with op.batch_alter_table('shape_downloads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_shape_downloads_date'), ['date'], unique=False)
+
+    with op.batch_alter_table('stencil_downloads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_stencil_downloads_date'), ['date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('stencil_downloads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_stencil_downloads_date'))
+
+    with op.batch_alter_table('shape_downloads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_shape_downloads_date'))
+
+    op.drop_table('rollup_watermarks')
+    with op.batch_alter_table('download_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_download_daily_user')
+        batch_op.drop_index('ix_download_daily_owner')
+        batch_op.drop_index('ix_download_daily_item')
+
+    op.drop_table('download_daily')